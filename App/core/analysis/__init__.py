@@ -0,0 +1 @@
+"""Offline analysis tools for generators and filters."""
@@ -0,0 +1,125 @@
+"""
+Characterisation Module - Measure filter magnitude responses with noise and cross-spectra.
+"""
+
+import itertools
+from typing import Dict, Optional, Sequence
+import numpy as np
+from ..processors.processor_factory import AudioProcessorFactory
+from ..visualization.octave_smoothing import OctaveSmoother
+from ..visualization.response_table import ResponseTable
+from .parameter_sweep import ParameterSweep
+
+# Parameter grids used for the shipped tables
+DEFAULT_GRIDS: Dict[str, Dict[str, Sequence[float]]] = {
+    "cascaded_v2": {
+        "cutoff": np.linspace(0.0, 1.0, 21),
+        "resonance": np.linspace(0.0, 1.0, 6),
+        "poles": [1, 2, 3, 4],
+    },
+}
+
+def characterise(filter_type: str, grid: Dict[str, Sequence[float]], frames: int = 2 ** 17,
+                 fft_size: int = 8192, block_size: int = 2048, sample_rate: int = 44100,
+                 generator: str = "xorshift", generator_parameters: Optional[dict] = None,
+                 octave_fraction: int = 12) -> ResponseTable:
+    """Estimate a filter's magnitude response at every point of a parameter grid.
+
+    The generator's noise is rendered once, in engine-sized blocks, and
+    filtered through all parameter sets together by the filter's sweep
+    kernel, so the nonlinear stages see the same signal level as in the app.
+    Each output is compared with the input through Welch-averaged cross
+    spectra (H1 = Sxy / Sxx, 50% overlap, Hann window), and both spectra are
+    averaged over 1/N-octave bands before dividing.
+
+    Args:
+        filter_type: Registered filter with a sweep kernel
+        grid: Parameter name -> grid values; the table has one axis per entry
+        frames: Noise length used for the estimate
+        fft_size: Welch segment length
+        block_size: Block size the filter processes, as in the audio engine
+        sample_rate: Sample rate in Hz
+        generator: Registered generator providing the test signal
+        generator_parameters: Parameters passed to the generator
+        octave_fraction: Frequency resolution of the table (1/N octave)
+
+    Returns:
+        ResponseTable with magnitudes in dB
+    """
+    names = list(grid)
+    axes = [np.asarray(grid[name], dtype=float) for name in names]
+    rows = [dict(zip(names, values)) for values in itertools.product(*axes)]
+    sweep = ParameterSweep(filter_type, rows)
+    source = AudioProcessorFactory.create(generator)
+
+    hop = fft_size // 2
+    window = np.hanning(fft_size)
+    bins = fft_size // 2 + 1
+    cross = np.zeros((len(rows), bins), dtype=np.complex128)
+    input_power = np.zeros(bins)
+    segments = 0
+
+    # Rolling segment buffers, filled block by block so memory stays bounded
+    input_buffer = np.zeros(fft_size)
+    output_buffer = np.zeros((len(rows), fft_size))
+    filled = 0
+    for start in range(0, frames, block_size):
+        block_frames = min(block_size, frames - start)
+        block = source.process_audio(block_frames, generator_parameters or {})
+        filtered = sweep.process(block)
+        offset = 0
+        while offset < block_frames:
+            take = min(fft_size - filled, block_frames - offset)
+            input_buffer[filled:filled + take] = block[offset:offset + take]
+            output_buffer[:, filled:filled + take] = filtered[:, offset:offset + take]
+            filled += take
+            offset += take
+            if filled == fft_size:
+                x = np.fft.rfft(input_buffer * window)
+                y = np.fft.rfft(output_buffer * window, axis=-1)
+                cross += y * np.conj(x)
+                input_power += np.abs(x) ** 2
+                segments += 1
+                input_buffer[:hop] = input_buffer[hop:]
+                output_buffer[:, :hop] = output_buffer[:, hop:]
+                filled = hop
+    if not segments:
+        raise ValueError(f"Need at least {fft_size} frames, got {frames}")
+
+    smoother = OctaveSmoother(np.fft.rfftfreq(fft_size, d=1.0 / sample_rate), octave_fraction)
+    band_input = smoother.apply(input_power)
+    band_cross = np.array([smoother.apply(row) for row in cross])
+    magnitude = np.abs(band_cross) / band_input
+    magnitude_db = 20 * np.log10(np.clip(magnitude, 1e-6, None))
+
+    return ResponseTable(
+        filter_type=filter_type,
+        parameter_names=names,
+        axes=axes,
+        freqs=smoother.centers,
+        magnitude_db=magnitude_db.reshape(tuple(len(axis) for axis in axes) + (len(smoother.centers),)),
+        metadata={
+            "frames": frames,
+            "fft_size": fft_size,
+            "block_size": block_size,
+            "sample_rate": sample_rate,
+            "generator": generator,
+            "segments": segments,
+            "octave_fraction": octave_fraction,
+        }
+    )
+
+def compare_tables(reference: ResponseTable, candidate: ResponseTable) -> float:
+    """Largest absolute difference in dB between two tables on the same grid.
+
+    Raises:
+        ValueError: If the tables do not share parameters, axes and frequencies
+    """
+    if (reference.parameter_names != candidate.parameter_names
+            or any(len(a) != len(b) or not np.allclose(a, b) for a, b in zip(reference.axes, candidate.axes))
+            or not np.allclose(reference.freqs, candidate.freqs)):
+        raise ValueError("Tables have different grids")
+    # Only compare the displayed range; deep stopband estimates are noise
+    visible = (reference.magnitude_db > -60) | (candidate.magnitude_db > -60)
+    difference = np.abs(reference.magnitude_db.astype(float) - candidate.magnitude_db.astype(float))
+    return float(difference[visible].max()) if visible.any() else 0.0
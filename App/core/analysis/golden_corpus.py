@@ -0,0 +1,220 @@
+"""
+Golden Corpus Module - Reference outputs of processors and chains for checking rewrites.
+"""
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from ..audio.audio_engine import AudioEngine
+from ..audio.stream_config import StreamConfig
+from ..diagnostics.benchmark import CANONICAL_CHAINS
+from ..processors.processor_factory import AudioProcessorFactory
+
+# Corpus checked by the test suite
+CORPUS_PATH = Path(__file__).parent / "golden" / "corpus.npz"
+
+# Generator driving single filters
+DEFAULT_GENERATOR = "xorshift"
+
+# Parameter points rendered per processor, on top of its defaults
+PARAMETER_POINTS: Dict[str, List[Dict[str, Any]]] = {
+    "xorshift": [{}],
+    "fractal": [{}, {"octave_count": 6, "persistence": 0.7, "lacunarity": 2.5}],
+    "bandpass": [
+        {"cutoff": 0.2, "bandwidth": 0.3},
+        {"cutoff": 0.5, "bandwidth": 0.5},
+        {"cutoff": 0.9, "bandwidth": 0.8},
+    ],
+    "cascaded": [
+        {"cutoff": 0.3, "resonance": 0.0, "poles": 1},
+        {"cutoff": 0.6, "resonance": 0.5, "poles": 2},
+        {"cutoff": 0.9, "resonance": 0.9, "poles": 4},
+    ],
+}
+PARAMETER_POINTS["cascaded_v2"] = PARAMETER_POINTS["cascaded"]
+
+# Largest allowed absolute difference per processor; 0.0 means bit-exact.
+# Generators are integer arithmetic and must not change at all; filters may
+# be reordered by vectorised rewrites, within a few ulps of their dtype.
+TOLERANCES: Dict[str, float] = {
+    "xorshift": 0.0,
+    "fractal": 0.0,
+    "cascaded_v2": 1e-5,
+}
+DEFAULT_TOLERANCE = 1e-9
+
+@dataclass
+class GoldenCase:
+    """One rendering: a chain at a parameter point from a fixed seed."""
+    name: str
+    chain: Tuple[str, ...]
+    parameters: Dict[str, Any]
+    seed: int = 12345
+    frames: int = 8192
+    block_size: int = 512
+
+    @property
+    def tolerance(self) -> float:
+        """Loosest tolerance of the chain's processors."""
+        return max(TOLERANCES.get(name, DEFAULT_TOLERANCE) for name in self.chain)
+
+@dataclass
+class GoldenEntry:
+    """Stored result of a case: hash of the full output plus a decimated copy."""
+    case: GoldenCase
+    digest: str
+    dtype: str
+    reference: np.ndarray
+
+@dataclass
+class GoldenMismatch:
+    """A case whose output no longer matches the corpus."""
+    name: str
+    reason: str
+    max_error: float = 0.0
+    tolerance: float = 0.0
+
+@dataclass
+class GoldenCorpus:
+    """Reference outputs keyed by case name."""
+    entries: Dict[str, GoldenEntry]
+    stride: int
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def save(self, path: Union[str, Path]):
+        """Write the corpus as a compressed .npz (case definitions stored as JSON)."""
+        names = list(self.entries)
+        np.savez_compressed(
+            path,
+            stride=np.array(self.stride),
+            cases=np.array(json.dumps([asdict(self.entries[name].case) for name in names])),
+            digests=np.array([self.entries[name].digest for name in names]),
+            dtypes=np.array([self.entries[name].dtype for name in names]),
+            metadata=np.array(json.dumps(self.metadata)),
+            **{f"reference_{index}": self.entries[name].reference for index, name in enumerate(names)}
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "GoldenCorpus":
+        """Read a corpus written by save()."""
+        with np.load(path) as data:
+            cases = [GoldenCase(**{**case, "chain": tuple(case["chain"])})
+                     for case in json.loads(str(data["cases"]))]
+            entries = {
+                case.name: GoldenEntry(case, str(digest), str(dtype), data[f"reference_{index}"])
+                for index, (case, digest, dtype) in enumerate(zip(cases, data["digests"], data["dtypes"]))
+            }
+            return cls(entries, int(data["stride"]), json.loads(str(data["metadata"])))
+
+def default_cases() -> List[GoldenCase]:
+    """
+    Cases covering every registered processor and the canonical chains.
+
+    Generators render alone, filters are driven by DEFAULT_GENERATOR, and
+    each canonical chain renders at every parameter point of its filter.
+    """
+    cases = []
+    for registration in AudioProcessorFactory.get_registered_processors():
+        chain = ((registration.name,) if registration.category == "noise"
+                 else (DEFAULT_GENERATOR, registration.name))
+        for index, point in enumerate(PARAMETER_POINTS.get(registration.name, [{}])):
+            cases.append(GoldenCase(f"{'->'.join(chain)}[{index}]", chain, point))
+    for chain in CANONICAL_CHAINS:
+        if tuple(chain[:2]) == (DEFAULT_GENERATOR, chain[-1]):
+            continue  # Already covered as a single filter
+        for index, point in enumerate(PARAMETER_POINTS.get(chain[-1], [{}])):
+            cases.append(GoldenCase(f"{'->'.join(chain)}[{index}]", tuple(chain), point))
+    return cases
+
+def render_case(case: GoldenCase) -> np.ndarray:
+    """
+    Render a case through AudioEngine, from its seed, in engine-sized blocks.
+
+    Parameters not given by the case take the processors' defaults.
+    """
+    engine = AudioEngine(
+        {"processors": [{"type": name} for name in case.chain]},
+        stream_config=StreamConfig(block_size=case.block_size)
+    )
+    parameters = {}
+    for name in case.chain:
+        schema = AudioProcessorFactory.get_processor_info(name).schema
+        parameters.update(schema.defaults())
+        parameters.update(schema.validate({key: value for key, value in case.parameters.items() if key in schema}))
+    engine.set_parameters(**parameters)
+
+    generator = engine.processors[0]
+    generator.initial_seed = case.seed
+    generator.reset()
+    return np.concatenate([
+        engine.generate_noise(min(case.block_size, case.frames - start))
+        for start in range(0, case.frames, case.block_size)
+    ])
+
+def digest(output: np.ndarray) -> str:
+    """Compact content hash of an output (dtype and samples)."""
+    hasher = hashlib.sha256(output.dtype.str.encode())
+    hasher.update(np.ascontiguousarray(output).tobytes())
+    return hasher.hexdigest()[:16]
+
+def build_corpus(cases: Optional[Iterable[GoldenCase]] = None, stride: int = 16) -> GoldenCorpus:
+    """
+    Render every case and record its hash and every `stride`-th sample.
+
+    Args:
+        cases: Cases to render; default_cases() if None
+        stride: Decimation of the stored reference arrays
+
+    Returns:
+        The corpus
+    """
+    entries = {}
+    for case in (default_cases() if cases is None else cases):
+        output = render_case(case)
+        entries[case.name] = GoldenEntry(case, digest(output), output.dtype.str, output[::stride].copy())
+    return GoldenCorpus(entries, stride, {"numpy": np.__version__})
+
+def verify_corpus(corpus: GoldenCorpus, exact: bool = False,
+                  names: Optional[Sequence[str]] = None) -> List[GoldenMismatch]:
+    """
+    Re-render stored cases and compare them with the corpus.
+
+    A case passes when its hash matches. Otherwise, unless `exact` is set,
+    it still passes if its decimated output has the stored dtype and stays
+    within the chain's tolerance of the reference.
+
+    Args:
+        corpus: Stored corpus
+        exact: Require bit-exact output for every case
+        names: Cases to check; all if None
+
+    Returns:
+        The failing cases
+    """
+    mismatches = []
+    for name in (corpus.entries if names is None else names):
+        entry = corpus.entries[name]
+        output = render_case(entry.case)
+        if digest(output) == entry.digest:
+            continue
+
+        tolerance = 0.0 if exact else entry.case.tolerance
+        if output.dtype.str != entry.dtype:
+            mismatches.append(GoldenMismatch(name, f"dtype changed from {entry.dtype} to {output.dtype.str}"))
+            continue
+        decimated = output[::corpus.stride]
+        if decimated.shape != entry.reference.shape:
+            mismatches.append(GoldenMismatch(name, f"length changed to {len(output)} frames"))
+            continue
+        max_error = float(np.max(np.abs(decimated.astype(np.float64) - entry.reference)))
+        if tolerance == 0.0 or max_error > tolerance:
+            mismatches.append(GoldenMismatch(
+                name,
+                "output not bit-exact" if tolerance == 0.0 else "output outside tolerance",
+                max_error,
+                tolerance
+            ))
+    return mismatches
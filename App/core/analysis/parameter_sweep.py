@@ -0,0 +1,401 @@
+"""
+Parameter Sweep Module - Filters one input buffer through many parameter sets at once.
+
+Each sweep kernel mirrors the sample loop of its filter in
+``App/core/filters/implementations`` but holds state and coefficients as arrays
+with one row per parameter set, so the Python per-sample overhead is paid once
+for the whole sweep instead of once per parameter set.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Type, Union
+import numpy as np
+from ..processors.processor_factory import AudioProcessorFactory
+
+
+class SweepKernel(ABC):
+    """Base class for vectorized filter kernels used by ParameterSweep."""
+
+    def __init__(self, n_rows: int):
+        """Initialize kernel state for a number of parameter rows.
+
+        Args:
+            n_rows: Number of parameter sets processed in parallel
+        """
+        self.n_rows = n_rows
+        self.reset()
+
+    @abstractmethod
+    def reset(self):
+        """Reset all per-row filter states to zero."""
+        pass
+
+    @abstractmethod
+    def process_block(self, audio: np.ndarray, parameters: Dict[str, np.ndarray]) -> np.ndarray:
+        """Filter one input block through every parameter row.
+
+        Args:
+            audio: Input audio block shared by all rows, shape (frames,)
+            parameters: Dictionary of per-row parameter arrays, shape (n_rows,)
+
+        Returns:
+            Filtered audio of shape (n_rows, frames)
+        """
+        pass
+
+    @staticmethod
+    def _clip_output(audio: np.ndarray) -> np.ndarray:
+        """Clip output to [-1, 1] like FilterBase."""
+        return np.clip(audio, -1.0, 1.0)
+
+
+class BandpassSweepKernel(SweepKernel):
+    """Vectorized counterpart of BandpassFilter."""
+
+    def reset(self):
+        self.hp_prev_x = 0.0
+        self.hp_prev_y = np.zeros(self.n_rows)
+        self.lp_prev_y = np.zeros(self.n_rows)
+
+    def process_block(self, audio: np.ndarray, parameters: Dict[str, np.ndarray]) -> np.ndarray:
+        cutoff = parameters.get('cutoff', np.full(self.n_rows, 0.5))
+        bandwidth = parameters.get('bandwidth', np.full(self.n_rows, 0.5))
+        volume = parameters.get('volume', np.ones(self.n_rows))
+
+        # Same coefficient mapping as BandpassFilter, one value per row
+        base_alpha = 0.001 + cutoff * 0.099
+        bandwidth_offset = bandwidth * 0.05
+        high_alpha = np.minimum(0.1, base_alpha + bandwidth_offset)
+        low_alpha = np.maximum(0.001, base_alpha - bandwidth_offset)
+        hp_feedback = 1 - high_alpha
+        lp_feedback = 1 - low_alpha
+
+        # Time-major buffer so each step writes one contiguous row
+        lp = np.empty((len(audio), self.n_rows))
+        hp_prev_x = self.hp_prev_x
+        hp_prev_y = self.hp_prev_y
+        lp_prev_y = self.lp_prev_y
+
+        for i in range(len(audio)):
+            x = audio[i]
+            hp_prev_y = x - hp_prev_x + hp_feedback * hp_prev_y
+            hp_prev_x = x
+            lp_prev_y = low_alpha * hp_prev_y + lp_feedback * lp_prev_y
+            lp[i] = lp_prev_y
+
+        self.hp_prev_x = hp_prev_x
+        self.hp_prev_y = hp_prev_y
+        self.lp_prev_y = lp_prev_y
+
+        gain_compensation = 1.5 + (0.2 * (1.0 - bandwidth))
+        output = lp.T * gain_compensation[:, None]
+        return self._clip_output(output * volume[:, None])
+
+
+class CascadedOnePoleLowPassSweepKernel(SweepKernel):
+    """Vectorized counterpart of CascadedOnePoleLowPass."""
+
+    MAX_POLES = 4
+
+    def reset(self):
+        self.prev_y = np.zeros((self.MAX_POLES, self.n_rows))
+
+    def process_block(self, audio: np.ndarray, parameters: Dict[str, np.ndarray]) -> np.ndarray:
+        cutoff = parameters.get('cutoff', np.full(self.n_rows, 0.5))
+        resonance = parameters.get('resonance', np.zeros(self.n_rows))
+        poles = parameters.get('poles', np.ones(self.n_rows)).astype(int)
+        volume = parameters.get('volume', np.ones(self.n_rows))
+
+        if np.any((poles < 1) | (poles > self.MAX_POLES)):
+            raise ValueError("Pole count must be between 1 and 4")
+
+        alpha = 0.001 + np.power(cutoff, 3.0) * 0.999
+        max_resonance = 0.95 + (poles * 0.01)
+        feedback = resonance * max_resonance
+
+        frames = len(audio)
+        current = np.repeat(np.asarray(audio, dtype=float)[:, None], self.n_rows, axis=1)
+        output = np.empty_like(current)
+
+        for p in range(int(poles.max())):
+            # Rows with fewer poles pass this stage through untouched
+            active = p < poles
+            a = (alpha / (5.0 ** p))[active]
+            one_minus_a = 1.0 - a
+            # Feedback only on each row's final pole
+            final = (p == poles - 1)[active] & (feedback[active] > 0)
+            stage_feedback = np.where(final, feedback[active], 0.0)
+            stage_input = current[:, active]
+            stage_output = np.empty_like(stage_input)
+            prev_y = self.prev_y[p, active]
+
+            for i in range(frames):
+                input_sample = stage_input[i] + stage_feedback * prev_y
+                prev_y = a * input_sample + one_minus_a * prev_y
+                stage_output[i] = prev_y
+
+            self.prev_y[p, active] = prev_y
+            output[:, active] = stage_output
+            output[:, ~active] = current[:, ~active]
+            current = output.copy()
+
+        output = np.ascontiguousarray(output.T)
+
+        # Multi-stage DC offset removal, per row
+        output = output - np.mean(output, axis=1, keepdims=True)
+        window_size = min(64, frames)
+        if window_size > 1:
+            window = np.ones(window_size) / window_size
+            dc_trend = np.array([np.convolve(row, window, mode='same') for row in output])
+            output = output - dc_trend
+        output = output - output[:, :1]
+
+        base_gain = 1.0 + (0.05 * poles)
+        resonance_boost = np.where(feedback > 0, 1.0 + (feedback * 0.2), 1.0)
+        output = output * (base_gain * resonance_boost)[:, None]
+
+        mean = np.mean(output, axis=1, keepdims=True)
+        output = np.where(np.abs(mean) >= 0.001, output - mean, output)
+
+        return self._clip_output(output * volume[:, None])
+
+
+class CascadedOnePoleLowPassV2SweepKernel(SweepKernel):
+    """Vectorized counterpart of CascadedOnePoleLowPassV2."""
+
+    MAX_POLES = 4
+
+    def reset(self):
+        self.prev_y = np.zeros((self.MAX_POLES, self.n_rows), dtype=np.float32)
+
+    def process_block(self, audio: np.ndarray, parameters: Dict[str, np.ndarray]) -> np.ndarray:
+        cutoff = parameters.get('cutoff', np.full(self.n_rows, 0.5))
+        resonance = parameters.get('resonance', np.zeros(self.n_rows))
+        poles = parameters.get('poles', np.ones(self.n_rows)).astype(int)
+        volume = parameters.get('volume', np.ones(self.n_rows))
+
+        if np.any((poles < 1) | (poles > self.MAX_POLES)):
+            raise ValueError("Pole count must be between 1 and 4")
+
+        alpha = 0.005 + np.power(cutoff, 2.0) * 0.495
+        base_alpha = np.clip(alpha, 0.005, 0.5)
+        feedback_scale = np.where(poles > 1, 1.0 + (0.1 * (poles - 1)), 1.0)
+        scaled_feedback = np.where(resonance > 0, resonance * feedback_scale, 0.0)
+
+        frames = len(audio)
+        current = np.repeat(np.asarray(audio).astype(np.float32)[:, None], self.n_rows, axis=1)
+
+        for p in range(int(poles.max())):
+            # Rows with fewer poles pass this stage through untouched
+            active = p < poles
+            a = (base_alpha[active] / (1.3 ** p)).astype(np.float32)
+            one_minus_a = 1.0 - a
+            stage_input = current[:, active]
+            prev_y = self.prev_y[p, active]
+
+            # Block-constant feedback offset on each row's final pole
+            final = (p == poles - 1)[active] & (scaled_feedback[active] > 0)
+            if np.any(final):
+                feedback_signal = np.tanh(scaled_feedback[active].astype(np.float32) * prev_y)
+                stage_input = stage_input + np.where(final, feedback_signal, 0.0).astype(np.float32)
+
+            stage_output = np.empty_like(stage_input)
+            for i in range(frames):
+                prev_y = np.tanh(a * stage_input[i] + one_minus_a * prev_y)
+                stage_output[i] = prev_y
+
+            self.prev_y[p, active] = prev_y
+            current[:, active] = stage_output
+
+        output = np.ascontiguousarray(current.T)
+
+        base_gain = np.where(poles > 1, 1.5 * (1.0 + 0.2 * (poles - 1)), 1.5)
+        base_gain = np.where(resonance > 0, base_gain * (1.0 + (resonance * 0.5)), base_gain)
+        output = np.tanh(output * base_gain[:, None].astype(np.float32))
+
+        mean_val = np.mean(output, axis=1, keepdims=True)
+        output = np.where(np.isfinite(mean_val), output - mean_val, output)
+
+        output = output * volume[:, None].astype(np.float32)
+        output = np.nan_to_num(output, nan=0.0)
+        return self._clip_output(output.astype(np.float32))
+
+
+_SWEEP_KERNELS: Dict[str, Type[SweepKernel]] = {
+    "bandpass": BandpassSweepKernel,
+    "cascaded": CascadedOnePoleLowPassSweepKernel,
+    "cascaded_v2": CascadedOnePoleLowPassV2SweepKernel,
+}
+
+
+def register_sweep_kernel(name: str, kernel_class: Type[SweepKernel]) -> None:
+    """Register a vectorized kernel for a processor name.
+
+    Raises:
+        ValueError: If a kernel is already registered under the name
+    """
+    if name in _SWEEP_KERNELS:
+        raise ValueError(f"Sweep kernel '{name}' is already registered")
+    _SWEEP_KERNELS[name] = kernel_class
+
+
+def get_sweep_kernel(name: str) -> Type[SweepKernel]:
+    """Get the vectorized kernel class for a processor name.
+
+    Raises:
+        ValueError: If no kernel exists for the processor
+    """
+    if name not in _SWEEP_KERNELS:
+        raise ValueError(f"No sweep kernel for processor type: {name}")
+    return _SWEEP_KERNELS[name]
+
+
+def _expand_grid(parameter_grid: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Dict[str, np.ndarray]:
+    """Turn a grid description into equal-length per-row parameter arrays.
+
+    Args:
+        parameter_grid: Either a dict of name -> scalar or sequence (scalars are
+            broadcast across rows), or a list of per-row parameter dicts
+
+    Returns:
+        Dictionary of parameter name -> array of shape (n_rows,)
+
+    Raises:
+        ValueError: If sequence lengths disagree or the grid is empty
+    """
+    if isinstance(parameter_grid, list):
+        if not parameter_grid:
+            raise ValueError("Parameter grid is empty")
+        names = sorted({name for row in parameter_grid for name in row})
+        missing = [name for name in names if any(name not in row for row in parameter_grid)]
+        if missing:
+            raise ValueError(f"Parameters missing from some rows: {missing}")
+        return {name: np.array([row[name] for row in parameter_grid]) for name in names}
+
+    lengths = {len(value) for value in parameter_grid.values() if np.ndim(value) == 1}
+    if len(lengths) > 1:
+        raise ValueError(f"Parameter sequences have different lengths: {sorted(lengths)}")
+    n_rows = lengths.pop() if lengths else 1
+    return {
+        name: np.broadcast_to(np.asarray(value), (n_rows,)).copy()
+        for name, value in parameter_grid.items()
+    }
+
+
+@dataclass
+class SweepResult:
+    """Output of a parameter sweep."""
+    output: np.ndarray
+    parameters: Dict[str, np.ndarray]
+    spectra: Optional[np.ndarray] = None
+    freqs: Optional[np.ndarray] = None
+
+
+def average_spectra(output: np.ndarray, fft_size: int, sample_rate: int) -> tuple:
+    """Average Hann-windowed power spectra for every row of a sweep output.
+
+    Args:
+        output: Sweep output of shape (n_rows, frames)
+        fft_size: Segment length; segments overlap by half
+        sample_rate: Sample rate in Hz used for the frequency axis
+
+    Returns:
+        Tuple of (power spectra of shape (n_rows, fft_size // 2 + 1), freqs)
+    """
+    frames = output.shape[1]
+    if frames < fft_size:
+        raise ValueError(f"Need at least {fft_size} frames for spectra, got {frames}")
+    hop = fft_size // 2
+    starts = np.arange(0, frames - fft_size + 1, hop)
+    window = np.hanning(fft_size)
+    segments = np.stack([output[:, s:s + fft_size] for s in starts], axis=1) * window
+    power = np.abs(np.fft.rfft(segments, axis=-1)) ** 2
+    spectra = power.mean(axis=1) / np.sum(window ** 2)
+    return spectra, np.fft.rfftfreq(fft_size, d=1.0 / sample_rate)
+
+
+class ParameterSweep:
+    """Runs one filter type across many parameter sets on a shared input."""
+
+    def __init__(self, filter_type: str, parameter_grid: Union[Dict[str, Any], List[Dict[str, Any]]]):
+        """
+        Initialize a sweep.
+
+        Args:
+            filter_type: Registered filter name (e.g. "bandpass", "cascaded_v2")
+            parameter_grid: Dict of name -> scalar/sequence or list of row dicts
+        """
+        self.filter_type = filter_type
+        self.parameters = _expand_grid(parameter_grid)
+        self.n_rows = len(next(iter(self.parameters.values())))
+        self.kernel = get_sweep_kernel(filter_type)(self.n_rows)
+
+    def reset(self):
+        """Reset all per-row filter states."""
+        self.kernel.reset()
+
+    def process(self, audio: np.ndarray) -> np.ndarray:
+        """Filter one block, keeping state for the next call.
+
+        Args:
+            audio: Input block of shape (frames,)
+
+        Returns:
+            Filtered audio of shape (n_rows, frames)
+        """
+        return self.kernel.process_block(audio, self.parameters)
+
+    def run(self, frames: int, generator: str = "xorshift", generator_parameters: Optional[dict] = None,
+            block_size: int = 2048, compute_spectra: bool = False, fft_size: int = 2048,
+            sample_rate: int = 44100) -> SweepResult:
+        """Generate noise once and filter it through every parameter row.
+
+        Args:
+            frames: Total number of frames to render
+            generator: Registered generator name
+            generator_parameters: Parameters passed to the generator's process_audio
+            block_size: Block size, matching what the audio engine would use
+            compute_spectra: Also return averaged per-row power spectra
+            fft_size: Segment length used for spectra
+            sample_rate: Sample rate used for the spectra frequency axis
+
+        Returns:
+            SweepResult with output of shape (n_rows, frames)
+        """
+        source = AudioProcessorFactory.create(generator)
+        output = np.empty((self.n_rows, frames), dtype=np.float64)
+        for start in range(0, frames, block_size):
+            block_frames = min(block_size, frames - start)
+            block = source.process_audio(block_frames, generator_parameters or {})
+            output[:, start:start + block_frames] = self.process(block)
+
+        result = SweepResult(output=output, parameters=self.parameters)
+        if compute_spectra:
+            result.spectra, result.freqs = average_spectra(output, fft_size, sample_rate)
+        return result
+
+
+def sequential_sweep(filter_type: str, parameter_grid: Union[Dict[str, Any], List[Dict[str, Any]]],
+                     frames: int, generator: str = "xorshift", generator_parameters: Optional[dict] = None,
+                     block_size: int = 2048) -> np.ndarray:
+    """Reference implementation: one generator and one filter instance per row.
+
+    This is what running one engine per parameter set costs and is used to
+    check and benchmark ParameterSweep.
+
+    Returns:
+        Filtered audio of shape (n_rows, frames)
+    """
+    parameters = _expand_grid(parameter_grid)
+    n_rows = len(next(iter(parameters.values())))
+    output = np.empty((n_rows, frames), dtype=np.float64)
+    for row in range(n_rows):
+        row_parameters = {name: values[row].item() for name, values in parameters.items()}
+        source = AudioProcessorFactory.create(generator)
+        processor = AudioProcessorFactory.create(filter_type)
+        for start in range(0, frames, block_size):
+            block_frames = min(block_size, frames - start)
+            block = source.process_audio(block_frames, generator_parameters or {})
+            output[row, start:start + block_frames] = processor.process_audio(block, row_parameters)
+    return output
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
+import time
 import numpy as np
-from typing import Dict, Any, List
-from ..processors.processor_factory import AudioProcessorFactory
+from typing import Dict, Any, List, Optional
+from ..processors.processor_factory import AudioProcessorFactory, ProcessorCapabilities, ProcessorRegistration
+from .execution_plan import ExecutionPlan, StagePlan, negotiate_plan
+from ..diagnostics.processor_profiler import ProcessorProfiler
+from .stream_config import StreamConfig, DEFAULT_STREAM_CONFIG
 from ..noise.base import NoiseGenerator
 from ..filters.base import FilterBase
 
@@ -28,6 +32,14 @@ class AudioEngineBase(ABC):
             **parameters: Dictionary of parameter key-value pairs
         """
         pass
+    
+    def select_filter(self, name: str):
+        """Use the named filter type. Engines without a switchable filter ignore this.
+        
+        Args:
+            name: Registered filter type
+        """
+        pass
 
 class AudioEngine(AudioEngineBase):
     """Modular audio engine that can use any combination of generators and filters."""
@@ -39,18 +51,33 @@ class AudioEngine(AudioEngineBase):
         ]
     }
     
-    def __init__(self, config: Dict[str, Any] = None):
+    def __init__(self, config: Dict[str, Any] = None, stream_config: Optional[StreamConfig] = None,
+                 max_latency: Optional[float] = None):
         """Initialize audio engine with configurable components.
         
         Args:
             config: Configuration dictionary specifying processors
                    If None, uses DEFAULT_CONFIG.
+            stream_config: Stream settings; the sample rate is passed to
+                   processors for coefficient design. Uses DEFAULT_STREAM_CONFIG if None.
+            max_latency: Refuse chains whose latency (algorithmic delay plus
+                   one block) exceeds this many seconds
+                   
+        Raises:
+            ValueError: If the processors cannot run with these stream settings
         """
         if config is None:
             config = self.DEFAULT_CONFIG
             
+        self.stream_config = stream_config or DEFAULT_STREAM_CONFIG
+        self.max_latency = max_latency
         self.parameters = {}
         self.processors = []
+        self.profiler: Optional[ProcessorProfiler] = None
+        
+        # Plan the chain from the processors' declared capabilities
+        self.processor_types = [processor_config["type"] for processor_config in config.get("processors", [])]
+        self.plan: ExecutionPlan = self._negotiate(self.processor_types)
         
         # Initialize processors from config
         for processor_config in config.get("processors", []):
@@ -58,8 +85,97 @@ class AudioEngine(AudioEngineBase):
                 processor_config["type"],
                 **processor_config.get("params", {})
             )
+            if hasattr(processor, "set_sample_rate"):
+                processor.set_sample_rate(self.stream_config.sample_rate)
             self.processors.append(processor)
 
+    def _negotiate(self, processor_types: List[str]) -> ExecutionPlan:
+        """Plan a chain of processor types for this engine's stream."""
+        return negotiate_plan(
+            [(name, self._capabilities(name)) for name in processor_types],
+            self.stream_config,
+            self.max_latency
+        )
+
+    def switch_processor(self, index: int, name: str):
+        """Replace one processor in the chain.
+        
+        The new processor comes from the factory pool when one is ready
+        (see AudioProcessorFactory.prewarm), so the first block after a
+        switch does not pay for construction or warmup. The replaced
+        processor goes back to the pool.
+        
+        Args:
+            index: Position in the chain (0 is the generator)
+            name: Registered processor type
+            
+        Raises:
+            ValueError: If the new chain cannot run with the stream settings
+        """
+        processor_types = list(self.processor_types)
+        processor_types[index] = name
+        plan = self._negotiate(processor_types)
+        
+        processor = AudioProcessorFactory.checkout(name)
+        if hasattr(processor, "set_sample_rate"):
+            processor.set_sample_rate(self.stream_config.sample_rate)
+        processors = list(self.processors)
+        replaced, replaced_type = processors[index], self.processor_types[index]
+        processors[index] = processor
+        
+        # New list, swapped in whole; the audio thread picks it up on its next block
+        self.plan = plan
+        self.processors = processors
+        self.processor_types = processor_types
+        if self.profiler is not None:
+            self.profiler.rename_stage(index, name)
+        AudioProcessorFactory.release(replaced_type, replaced)
+
+    def select_filter(self, name: str):
+        """Switch the filter after the generator to `name`, if it is not already in use.
+        
+        Raises:
+            ValueError: If the filter is unknown or cannot run with the stream settings
+        """
+        if len(self.processor_types) > 1 and self.processor_types[1] != name:
+            self.switch_processor(1, name)
+
+    @staticmethod
+    def _capabilities(name: str) -> ProcessorCapabilities:
+        """Declared capabilities of a processor type (defaults if it declares none)."""
+        info = AudioProcessorFactory.get_processor_info(name)
+        if isinstance(info, ProcessorRegistration):
+            return info.capabilities
+        return ProcessorCapabilities()
+
+    def enable_profiling(self, capacity: int = 4096) -> ProcessorProfiler:
+        """Start timing each processor on every block.
+        
+        Can be called while the stream runs; the audio thread picks up the
+        profiler on its next block.
+        
+        Args:
+            capacity: Number of recent blocks kept
+            
+        Returns:
+            The profiler recording the blocks
+        """
+        self.profiler = ProcessorProfiler(self.processor_types, self.stream_config.sample_rate, capacity)
+        return self.profiler
+
+    def disable_profiling(self) -> Optional[ProcessorProfiler]:
+        """Stop timing blocks.
+        
+        Returns:
+            The profiler that was recording, for export, or None
+        """
+        profiler, self.profiler = self.profiler, None
+        return profiler
+
+    def describe_plan(self) -> str:
+        """Summary of the negotiated execution plan."""
+        return self.plan.describe()
+
     def set_parameters(self, **parameters):
         """Set parameters for all components.
         
@@ -68,6 +184,17 @@ class AudioEngine(AudioEngineBase):
         """
         self.parameters = parameters
 
+    def apply_changes(self, **changes):
+        """Merge changes into the current parameters.
+        
+        Builds a new dict and swaps it in with one assignment, so the audio
+        thread sees either the old or the new snapshot, never a partial one.
+        
+        Args:
+            **changes: Parameter key-value pairs to change
+        """
+        self.parameters = {**self.parameters, **changes}
+
     def generate_noise(self, frames: int) -> np.ndarray:
         """Generate and process audio through component chain.
         
@@ -77,14 +204,61 @@ class AudioEngine(AudioEngineBase):
         Returns:
             Processed audio data
         """
-        if not self.processors:
+        processors, plan, parameters, profiler = self.processors, self.plan, self.parameters, self.profiler
+        if not processors:
             return np.zeros(frames)
-            
-        # Start with first processor
-        audio = self.processors[0].process_audio(frames, self.parameters)
+        if profiler is not None:
+            return self._generate_profiled(frames, processors, plan, parameters, profiler)
         
-        # Process through remaining processors
-        for processor in self.processors[1:]:
-            audio = processor.process_audio(audio, self.parameters)
+        if plan.is_direct:
+            # Start with first processor
+            audio = processors[0].process_audio(frames, parameters)
             
+            # Process through remaining processors
+            for processor in processors[1:]:
+                audio = processor.process_audio(audio, parameters)
+            return audio
+        
+        return self._generate_planned(frames, processors, plan, parameters)
+    
+    def _generate_planned(self, frames: int, processors: list, plan: ExecutionPlan,
+                          parameters: dict) -> np.ndarray:
+        """Run the chain with the plan's dtype conversions and block splitting."""
+        audio = None
+        for processor, stage in zip(processors, plan.stages):
+            audio = self._run_stage(processor, stage, audio, frames, parameters)
+        return audio
+    
+    def _generate_profiled(self, frames: int, processors: list, plan: ExecutionPlan,
+                           parameters: dict, profiler: ProcessorProfiler) -> np.ndarray:
+        """Run the chain as planned, timing each stage into the profiler."""
+        clock = time.perf_counter
+        block_start = clock()
+        audio = None
+        for index, (processor, stage) in enumerate(zip(processors, plan.stages)):
+            start = clock()
+            audio = self._run_stage(processor, stage, audio, frames, parameters)
+            profiler.record_stage(index, start, clock())
+        profiler.end_block(block_start, clock(), frames)
         return audio
+    
+    @staticmethod
+    def _run_stage(processor, stage: StagePlan, audio: Optional[np.ndarray], frames: int,
+                   parameters: dict) -> np.ndarray:
+        """Run one stage of the plan; `audio` is None for the generator."""
+        if audio is None:
+            if stage.chunk_size:
+                return np.concatenate([
+                    processor.process_audio(min(stage.chunk_size, frames - start), parameters)
+                    for start in range(0, frames, stage.chunk_size)
+                ])
+            return processor.process_audio(frames, parameters)
+        
+        if stage.convert:
+            audio = audio.astype(stage.input_dtype)
+        if stage.chunk_size:
+            return np.concatenate([
+                processor.process_audio(audio[start:start + stage.chunk_size], parameters)
+                for start in range(0, frames, stage.chunk_size)
+            ])
+        return processor.process_audio(audio, parameters)
@@ -32,6 +32,9 @@ class AudioParameterObserver(Observer):
             parameters: Dictionary of parameter key-value pairs
         """
         try:
+            # A new filter type swaps in a pooled instance of that filter
+            if "filter_type" in parameters:
+                self.audio_engine.select_filter(parameters["filter_type"])
             # Pass validated parameters to the engine
             self.audio_engine.set_parameters(**parameters)
         except (ValueError, KeyError) as e:
@@ -2,63 +2,179 @@
 Audio Stream Module - Handles real-time audio streaming using sounddevice library.
 """
 
-import sounddevice as sd
+import logging
+import threading
 import numpy as np
 from threading import Thread, Event
-from typing import Callable
+from time import perf_counter
+from typing import Callable, Optional
+from .output_backend import OutputBackend
+from .realtime_gc import RealtimeGC
+from .ring_buffer import SampleRingBuffer
+from .stream_config import StreamConfig, DEFAULT_STREAM_CONFIG
+from .thread_priority import AppliedPolicy, ThreadPolicy, apply_thread_policy
+
+from ..diagnostics.callback_metrics import STATUS_FLAGS, CallbackMetrics, status_bits
+from ..diagnostics.realtime_log import RealtimeLog
+
+# sounddevice, imported when the first sound card stream is opened
+sd = None
+
+# Full-scale value for integer sample formats
+INTEGER_SCALE = {"int16": 32767.0, "int32": 2147483647.0}
+
+# Samples kept for visualization; enough for the largest analysis FFT
+TAP_CAPACITY = 65536
+
+class SoundDeviceBackend(OutputBackend):
+    """Plays audio on a sound card through sounddevice.OutputStream."""
+
+    def open_stream(self, callback: Callable, config: StreamConfig):
+        device = load_sounddevice()
+        self.callback_stop = device.CallbackStop
+        return device.OutputStream(callback=callback, **config.stream_kwargs())
+
+def load_sounddevice():
+    """
+    Import sounddevice on first use.
+    
+    Raises:
+        RuntimeError: If sounddevice or the PortAudio library is missing
+    """
+    global sd
+    if sd is None:
+        try:
+            import sounddevice
+        except (ImportError, OSError) as e:  # No PortAudio library, e.g. CI machines without audio hardware
+            raise RuntimeError(f"sounddevice is not available (is PortAudio installed?): {e}") from e
+        sd = sounddevice
+    return sd
 
 class AudioStream:
     """Handles real-time audio streaming with callback-based audio generation."""
     
-    def __init__(self, callback: Callable[[int], np.ndarray], waveform_view=None):
+    def __init__(self, callback: Callable[[int], np.ndarray], waveform_view=None,
+                 config: Optional[StreamConfig] = None, backend: Optional[OutputBackend] = None,
+                 gc_control: Optional[RealtimeGC] = None, thread_policy: Optional[ThreadPolicy] = None):
         """
         Initialize audio stream with callback function for audio generation.
         
         Args:
             callback: Function that generates audio data
-            waveform_view: Optional WaveformView widget for visualization
+            waveform_view: Optional WaveformView widget for visualization. It is
+                handed a ring buffer to pull samples from; the audio thread never
+                calls into it.
+            config: Stream settings; uses DEFAULT_STREAM_CONFIG if None
+            backend: Output device backend; plays on the sound card if None
+            gc_control: Told where each block starts and ends, to attribute
+                deadline misses to collections and to run deferred ones
+            thread_policy: CPU affinity and scheduling for the thread the
+                device calls back on, applied once the first callback arrives
         """
         self.generate_audio = callback
+        self.config = config or DEFAULT_STREAM_CONFIG
+        self.backend = backend or SoundDeviceBackend()
+        self._output_scale = INTEGER_SCALE.get(self.config.dtype)
+        self.metrics = CallbackMetrics(self.config.sample_rate)
+        self.gc_control = gc_control
+        self.thread_policy = thread_policy
+        self.applied_policy: Optional[AppliedPolicy] = None
+        # Thread running the callback: native id for scheduling, ident for sampling profilers
+        self.callback_thread_id = None
+        self.callback_thread_ident = None
+        self.first_callback = Event()
+        self.logger = logging.getLogger(__name__)
+        
+        # The callback logs through a preallocated queue drained on another thread
+        self.log = RealtimeLog(logger=self.logger)
+        self._status_events = [
+            self.log.define(name, logging.WARNING, f"Stream status: {name.replace('_', ' ')}")
+            for name in STATUS_FLAGS
+        ]
+        self._other_status_event = self.log.define("stream_status", logging.WARNING,
+                                                   "Stream status: unrecognised flags")
         self.stream = None
         self.stop_event = Event()
         self.audio_thread = None
         self.waveform_view = waveform_view
+        self.waveform_tap = None
+        if waveform_view is not None:
+            self.waveform_tap = SampleRingBuffer(TAP_CAPACITY)
+            waveform_view.attach_tap(self.waveform_tap)
         
-    def audio_callback(self, outdata: np.ndarray, frames: int, time: float, status: sd.CallbackFlags):
+    def audio_callback(self, outdata: np.ndarray, frames: int, time: float, status: "sd.CallbackFlags"):
         """
         Called by sounddevice to get audio data for playback.
         """
+        start = perf_counter()
+        if self.callback_thread_id is None:
+            self.callback_thread_ident = threading.get_ident()
+            self.callback_thread_id = threading.get_native_id()
+            self.first_callback.set()
         if status:
-            print("Stream status:", status)
+            self.log_status(status)
 
         if self.stop_event.is_set():
-            raise sd.CallbackStop()
+            raise self.backend.callback_stop()
+
+        gc_control = self.gc_control
+        if gc_control is not None:
+            gc_token = gc_control.block_started()
 
         audio_data = self.generate_audio(frames)
-        outdata[:] = audio_data.reshape(-1, 1)
+        if self._output_scale is None:
+            outdata[:] = audio_data.reshape(-1, 1)
+        else:
+            outdata[:] = (audio_data * self._output_scale).reshape(-1, 1)
+        
+        # Hand samples to the waveform view, which pulls them on its own timer
+        if self.waveform_tap is not None:
+            self.waveform_tap.write(audio_data)
+
+        render_time = perf_counter() - start
+        self.metrics.record(render_time, frames, status)
+        if gc_control is not None:
+            gc_control.block_finished(gc_token, render_time, frames / self.config.sample_rate)
+
+    def log_status(self, status):
+        """Queue one record per xrun flag set in a callback status. Realtime-safe."""
+        bits = status_bits(status)
+        if not bits:
+            self.log.push(self._other_status_event)
+            return
+        for bit, code in enumerate(self._status_events):
+            if bits & (1 << bit):
+                self.log.push(code)
+
+    def apply_thread_policy(self, timeout: float = 1.0):
+        """Apply the thread policy to the callback thread from outside it.
         
-        # Update waveform if view is available
-        if self.waveform_view:
-            self.waveform_view.update_waveform(audio_data)
+        The device owns the callback thread, so its native id is recorded
+        by the first callback and the policy is applied from here, keeping
+        system calls and logging off the realtime path.
+        """
+        if self.thread_policy is None:
+            return
+        if not self.first_callback.wait(timeout):
+            self.logger.warning("No audio callback yet, thread policy not applied")
+            return
+        self.applied_policy = apply_thread_policy(self.thread_policy, self.callback_thread_id)
+        log = self.logger.warning if self.applied_policy.errors else self.logger.info
+        log(f"Audio callback thread policy: {self.applied_policy.describe()}")
 
     def stream_thread(self):
         """
         Runs the audio stream in a separate thread.
         """
         try:
-            with sd.OutputStream(
-                samplerate=44100,
-                channels=1,
-                dtype="float32",
-                callback=self.audio_callback,
-                blocksize=2048,  # Larger buffer for better performance
-                latency='high',  # Prefer stability over low latency
-            ) as stream:
+            with self.backend.open_stream(self.audio_callback, self.config) as stream:
                 self.stream = stream
                 stream.start()
+                self.apply_thread_policy()
                 self.stop_event.wait()
         except Exception as e:
-            print(f"Audio stream error: {e}")
+            # The stream is gone, so this is no longer on the realtime path
+            self.logger.error(f"Audio stream error: {e}")
         finally:
             self.stream = None
 
@@ -66,6 +182,10 @@ class AudioStream:
         """Start audio streaming in a separate thread."""
         if self.audio_thread is None or not self.audio_thread.is_alive():
             self.stop_event.clear()
+            self.callback_thread_id = None
+            self.callback_thread_ident = None
+            self.first_callback.clear()
+            self.log.start()
             self.audio_thread = Thread(
                 target=self.stream_thread,
                 daemon=True,
@@ -81,3 +201,4 @@ class AudioStream:
             if self.stream:
                 self.stream.close()
                 self.stream = None
+        self.log.stop()
@@ -0,0 +1,107 @@
+"""
+Block Renderer Module - Renders audio blocks on a dedicated thread paced at realtime.
+"""
+
+import logging
+import time
+from threading import Thread, Event
+from typing import Callable, Optional
+import numpy as np
+from .realtime_gc import RealtimeGC
+from .thread_priority import AppliedPolicy, ThreadPolicy, apply_thread_policy
+
+class BlockRenderer:
+    """Pulls fixed-size blocks from a generator function at the audio sample rate.
+
+    Used where there is no sound card clock to drive the callback, e.g. the
+    headless PCM server. Blocks are produced on a single thread against a
+    monotonic clock so downstream consumers see a steady realtime stream.
+    """
+
+    def __init__(self, generate_audio: Callable[[int], np.ndarray],
+                 on_block: Callable[[np.ndarray], None],
+                 block_size: int = 2048, sample_rate: int = 44100,
+                 max_lag_blocks: int = 4, gc_control: Optional[RealtimeGC] = None,
+                 thread_policy: Optional[ThreadPolicy] = None):
+        """
+        Initialize the renderer.
+
+        Args:
+            generate_audio: Function returning `frames` samples (e.g. AudioEngine.generate_noise)
+            on_block: Called on the render thread with every rendered block
+            block_size: Frames per block
+            sample_rate: Sample rate in Hz used to pace rendering
+            max_lag_blocks: Resynchronise the clock instead of bursting when
+                rendering falls further behind than this
+            gc_control: Told where each block starts and ends, to attribute
+                late blocks to collections and to run deferred ones
+            thread_policy: CPU affinity and scheduling applied to the render
+                thread when it starts
+        """
+        self.generate_audio = generate_audio
+        self.on_block = on_block
+        self.block_size = block_size
+        self.sample_rate = sample_rate
+        self.max_lag_blocks = max_lag_blocks
+        self.gc_control = gc_control
+        self.thread_policy = thread_policy
+        self.applied_policy: Optional[AppliedPolicy] = None
+        self.stop_event = Event()
+        self.render_thread = None
+        self.blocks_rendered = 0
+        self.late_blocks = 0
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def block_duration(self) -> float:
+        """Duration of one block in seconds."""
+        return self.block_size / self.sample_rate
+
+    def render_loop(self):
+        """Render blocks until stopped, sleeping until each block is due."""
+        if self.thread_policy is not None:
+            self.applied_policy = apply_thread_policy(self.thread_policy)
+            log = self.logger.warning if self.applied_policy.errors else self.logger.info
+            log(f"Render thread policy: {self.applied_policy.describe()}")
+        next_due = time.monotonic()
+        gc_control = self.gc_control
+        while not self.stop_event.is_set():
+            if gc_control is not None:
+                gc_token = gc_control.block_started()
+                start = time.perf_counter()
+            try:
+                audio = self.generate_audio(self.block_size)
+                self.on_block(audio)
+            except Exception as e:
+                self.logger.error(f"Render error: {e}")
+                self.stop_event.set()
+                break
+            self.blocks_rendered += 1
+            if gc_control is not None:
+                gc_control.block_finished(gc_token, time.perf_counter() - start, self.block_duration)
+
+            next_due += self.block_duration
+            delay = next_due - time.monotonic()
+            if delay > 0:
+                self.stop_event.wait(delay)
+            else:
+                self.late_blocks += 1
+                if -delay > self.max_lag_blocks * self.block_duration:
+                    next_due = time.monotonic()
+
+    def start(self):
+        """Start rendering on a separate thread."""
+        if self.render_thread is None or not self.render_thread.is_alive():
+            self.stop_event.clear()
+            self.render_thread = Thread(
+                target=self.render_loop,
+                daemon=True,
+                name="RenderThread"
+            )
+            self.render_thread.start()
+
+    def stop(self):
+        """Stop rendering and wait for the thread to finish."""
+        self.stop_event.set()
+        if self.render_thread and self.render_thread.is_alive():
+            self.render_thread.join(timeout=1.0)
@@ -0,0 +1,150 @@
+"""
+Execution Plan Module - Negotiate how the engine runs a processor chain from processor capabilities.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+from ..processors.processor_factory import ProcessorCapabilities
+from .stream_config import StreamConfig
+
+@dataclass(frozen=True)
+class StagePlan:
+    """How one processor in the chain is run.
+
+    Attributes:
+        name: Registered processor name
+        input_dtype: dtype the stage is fed (None for the generator)
+        output_dtype: dtype the stage produces
+        convert: Whether the engine converts the block to `input_dtype` first
+        chunk_size: Frames per call if the block is split, else None
+        latency: Algorithmic delay in samples
+    """
+    name: str
+    input_dtype: Optional[str]
+    output_dtype: str
+    convert: bool
+    chunk_size: Optional[int]
+    latency: int
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """Negotiated processing plan for one block of the stream."""
+    stages: Tuple[StagePlan, ...]
+    block_size: int
+    sample_rate: int
+    channels: int
+    render_channels: int
+
+    @property
+    def latency_samples(self) -> int:
+        """Total algorithmic delay of the chain."""
+        return sum(stage.latency for stage in self.stages)
+
+    @property
+    def latency(self) -> float:
+        """Algorithmic delay plus one block, in seconds."""
+        return (self.latency_samples + self.block_size) / self.sample_rate
+
+    @property
+    def output_dtype(self) -> str:
+        """dtype of the block handed to the stream."""
+        return self.stages[-1].output_dtype if self.stages else "float64"
+
+    @property
+    def is_direct(self) -> bool:
+        """True if every stage runs once per block on the previous stage's output."""
+        return not any(stage.convert or stage.chunk_size for stage in self.stages)
+
+    def describe(self) -> str:
+        """Human-readable summary of the plan."""
+        lines = [
+            f"{self.block_size} frames at {self.sample_rate} Hz, "
+            f"latency {self.latency * 1000:.1f} ms ({self.latency_samples} samples algorithmic)"
+        ]
+        if self.render_channels != self.channels:
+            lines.append(f"rendered mono, duplicated to {self.channels} channels by the stream")
+        for stage in self.stages:
+            notes = []
+            if stage.convert:
+                notes.append(f"convert to {stage.input_dtype}")
+            if stage.chunk_size:
+                notes.append(f"split into {stage.chunk_size}-frame calls")
+            if stage.latency:
+                notes.append(f"{stage.latency} samples latency")
+            lines.append(f"  {stage.name}: {stage.output_dtype}" + (f" ({', '.join(notes)})" if notes else ""))
+        return "\n".join(lines)
+
+def negotiate_plan(stages: Sequence[Tuple[str, ProcessorCapabilities]], stream_config: StreamConfig,
+                   max_latency: Optional[float] = None) -> ExecutionPlan:
+    """
+    Choose how to run a processor chain for a stream.
+
+    The generator runs in its native dtype and each filter is fed a dtype
+    it supports, converting only where the previous stage's output is not
+    accepted. A stage is split into smaller calls when the block exceeds its
+    maximum size, or when its preferred size divides the block.
+
+    Args:
+        stages: (processor name, capabilities) pairs, generator first
+        stream_config: Stream the chain renders for
+        max_latency: Largest acceptable latency in seconds (algorithmic
+            delay plus one block); not checked if None
+
+    Returns:
+        The negotiated plan
+
+    Raises:
+        ValueError: If a stage cannot process the stream's block size, or
+            the chain exceeds `max_latency`
+    """
+    block_size = stream_config.block_size
+    planned: List[StagePlan] = []
+    current_dtype = None
+    for index, (name, capabilities) in enumerate(stages):
+        if block_size < capabilities.min_block_size:
+            raise ValueError(
+                f"Processor '{name}' needs blocks of at least {capabilities.min_block_size} frames, "
+                f"stream uses {block_size}"
+            )
+
+        if index == 0:
+            input_dtype, convert, output_dtype = None, False, capabilities.dtypes[0]
+        elif current_dtype in capabilities.dtypes:
+            input_dtype, convert, output_dtype = current_dtype, False, current_dtype
+        else:
+            input_dtype, convert, output_dtype = capabilities.dtypes[0], True, capabilities.dtypes[0]
+
+        planned.append(StagePlan(
+            name=name,
+            input_dtype=input_dtype,
+            output_dtype=output_dtype,
+            convert=convert,
+            chunk_size=_chunk_size(block_size, capabilities),
+            latency=capabilities.latency
+        ))
+        current_dtype = output_dtype
+
+    multichannel = bool(stages) and all(capabilities.multichannel for _, capabilities in stages)
+    plan = ExecutionPlan(
+        stages=tuple(planned),
+        block_size=block_size,
+        sample_rate=stream_config.sample_rate,
+        channels=stream_config.channels,
+        render_channels=stream_config.channels if multichannel else 1
+    )
+    if max_latency is not None and plan.latency > max_latency:
+        raise ValueError(
+            f"Processing chain latency {plan.latency * 1000:.1f} ms exceeds the "
+            f"{max_latency * 1000:.1f} ms budget"
+        )
+    return plan
+
+def _chunk_size(block_size: int, capabilities: ProcessorCapabilities) -> Optional[int]:
+    """Frames per call for a stage, or None to process the whole block at once."""
+    limit = capabilities.max_block_size or block_size
+    preferred = capabilities.preferred_block_size
+    if preferred and preferred < block_size and preferred <= limit and block_size % preferred == 0:
+        return preferred
+    if limit < block_size:
+        return limit
+    return None
@@ -0,0 +1,217 @@
+"""
+Output Backend Module - Pluggable audio output devices, including a simulated one.
+"""
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from threading import Thread, Event, current_thread
+from types import SimpleNamespace
+from typing import Callable, List, Optional
+import numpy as np
+from .stream_config import StreamConfig
+
+class CallbackStop(Exception):
+    """Raised by a callback to stop the stream (mirrors sounddevice.CallbackStop).
+    
+    Defined here rather than imported so that sounddevice is only loaded
+    when a sound card stream is opened. Callbacks raise their backend's
+    `callback_stop`, which is this class or sounddevice's own.
+    """
+
+class OutputBackend(ABC):
+    """Creates output streams that pull audio through a sounddevice-style callback.
+
+    The stream returned by `open_stream` is a context manager with `start()`
+    and `close()`, and calls `callback(outdata, frames, time, status)` once
+    per block, exactly like sounddevice.OutputStream.
+    """
+
+    # Exception a callback raises to end the stream
+    callback_stop = CallbackStop
+
+    @abstractmethod
+    def open_stream(self, callback: Callable, config: StreamConfig):
+        """Create (but do not start) an output stream for `config`."""
+        pass
+
+@dataclass
+class VirtualCallbackFlags:
+    """Status flags passed to the callback by the virtual device."""
+    output_underflow: bool = False
+    output_overflow: bool = False
+    input_underflow: bool = False
+    input_overflow: bool = False
+
+    def __bool__(self) -> bool:
+        return self.output_underflow or self.output_overflow or self.input_underflow or self.input_overflow
+
+    def __str__(self) -> str:
+        return ", ".join(name.replace("_", " ") for name, value in vars(self).items() if value)
+
+class VirtualOutputStream:
+    """Drives an audio callback from a simulated device clock.
+
+    Block k is due on the device at k * block_duration. The callback for it is
+    issued at that time plus an injected scheduling delay and must finish
+    before the device consumes the next block; otherwise the next callback
+    sees `output_underflow`, as PortAudio reports it. In realtime mode the
+    thread sleeps until each issue time; otherwise it runs as fast as the
+    callback allows and only the accounting uses the simulated clock.
+    """
+
+    def __init__(self, callback: Callable, config: StreamConfig, realtime: bool = False,
+                 jitter: float = 0.0, max_blocks: Optional[int] = None, record: bool = True,
+                 record_path: Optional[str] = None, seed: int = 0):
+        """
+        Initialize the virtual stream.
+
+        Args:
+            callback: sounddevice-style callback
+            config: Stream settings (sample rate, block size, dtype, channels)
+            realtime: Pace callbacks at the device rate instead of running flat out
+            jitter: Mean scheduling delay in seconds added before each callback
+                (exponentially distributed, so occasional long stalls occur)
+            max_blocks: Stop after this many blocks; None runs until closed
+            record: Keep every block in memory
+            record_path: Also append every block's raw samples to this file
+            seed: Seed for the jitter generator, for reproducible runs
+        """
+        self.callback = callback
+        self.config = config
+        self.realtime = realtime
+        self.jitter = jitter
+        self.max_blocks = max_blocks
+        self.record = record
+        self.record_path = record_path
+        self.rng = np.random.default_rng(seed)
+        self.blocks: List[np.ndarray] = []
+        self.blocks_played = 0
+        self.underflows = 0
+        self.error: Optional[Exception] = None
+        self.stop_event = Event()
+        self.finished = Event()
+        self.device_thread = None
+        self.logger = logging.getLogger(__name__)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def active(self) -> bool:
+        """Whether the device is still calling back."""
+        return self.device_thread is not None and not self.finished.is_set()
+
+    def start(self):
+        """Start calling back on the device thread."""
+        if self.device_thread is None:
+            self.stop_event.clear()
+            self.device_thread = Thread(target=self.device_loop, daemon=True, name="VirtualDeviceThread")
+            self.device_thread.start()
+
+    def stop(self):
+        """Stop calling back and wait for the device thread."""
+        self.stop_event.set()
+        if self.device_thread is not None and self.device_thread is not current_thread():
+            self.device_thread.join(timeout=1.0)
+
+    def close(self):
+        """Stop the stream; recorded blocks stay available."""
+        self.stop()
+
+    def recording(self) -> np.ndarray:
+        """All recorded blocks as one (frames, channels) array."""
+        if not self.blocks:
+            return np.zeros((0, self.config.channels), dtype=self.config.dtype)
+        return np.concatenate(self.blocks)
+
+    def device_loop(self):
+        """Issue callbacks against the simulated clock until stopped."""
+        frames = self.config.block_size
+        block_duration = self.config.block_duration
+        outdata = np.zeros((frames, self.config.channels), dtype=self.config.dtype)
+        record_file = open(self.record_path, "ab") if self.record_path else None
+        status = VirtualCallbackFlags()
+        wall_start = time.monotonic()
+        try:
+            while not self.stop_event.is_set():
+                if self.max_blocks is not None and self.blocks_played >= self.max_blocks:
+                    break
+                device_time = self.blocks_played * block_duration
+                delay = self.rng.exponential(self.jitter) if self.jitter > 0 else 0.0
+                if self.realtime:
+                    sleep_for = wall_start + device_time + delay - time.monotonic()
+                    if sleep_for > 0:
+                        time.sleep(sleep_for)
+
+                time_info = SimpleNamespace(
+                    currentTime=device_time + delay,
+                    outputBufferDacTime=device_time + block_duration
+                )
+                start = time.perf_counter()
+                try:
+                    self.callback(outdata, frames, time_info, status)
+                except CallbackStop:
+                    break
+                except Exception as e:
+                    # sounddevice aborts the stream on callback errors too
+                    self.error = e
+                    self.logger.error(f"Virtual device callback error: {e}")
+                    break
+                render_time = time.perf_counter() - start
+
+                if self.record:
+                    self.blocks.append(outdata.copy())
+                if record_file is not None:
+                    record_file.write(outdata.tobytes())
+                self.blocks_played += 1
+
+                # The block is late if the callback was not done before the device needed it
+                late = delay + render_time > block_duration
+                if late:
+                    self.underflows += 1
+                status = VirtualCallbackFlags(output_underflow=late)
+        finally:
+            if record_file is not None:
+                record_file.close()
+            self.finished.set()
+
+class VirtualOutputBackend(OutputBackend):
+    """Output backend that needs no audio hardware.
+
+    Keeps a reference to the last stream it opened so callers can wait for
+    `finished`, read the recording and check underflow counts.
+    """
+
+    def __init__(self, realtime: bool = False, jitter: float = 0.0, max_blocks: Optional[int] = None,
+                 record: bool = True, record_path: Optional[str] = None, seed: int = 0):
+        """
+        Initialize the backend. Arguments are passed to each VirtualOutputStream.
+        """
+        self.stream_options = dict(
+            realtime=realtime, jitter=jitter, max_blocks=max_blocks,
+            record=record, record_path=record_path, seed=seed
+        )
+        self.stream: Optional[VirtualOutputStream] = None
+        self.opened = Event()
+
+    def open_stream(self, callback: Callable, config: StreamConfig) -> VirtualOutputStream:
+        self.stream = VirtualOutputStream(callback, config, **self.stream_options)
+        self.opened.set()
+        return self.stream
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until a stream has been opened and has stopped calling back.
+
+        Returns:
+            False if the timeout expired first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self.opened.wait(timeout):
+            return False
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        return self.stream.finished.wait(remaining)
@@ -0,0 +1,224 @@
+"""
+Realtime GC Module - Keep cyclic garbage collection out of audio blocks and measure its pauses.
+"""
+
+import gc
+import logging
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Dict, Optional
+import numpy as np
+
+# "default" only measures; "freeze" moves startup objects out of the collector's
+# reach so full collections are short; "deferred" also turns automatic
+# collection off and collects between blocks when there is slack.
+GC_MODES = ("default", "freeze", "deferred")
+
+@dataclass
+class GCSnapshot:
+    """GC pauses and their overlap with audio blocks."""
+    mode: str
+    pauses: int
+    window: int
+    pause_ms: Dict[str, float] = field(default_factory=dict)
+    by_generation: Dict[int, int] = field(default_factory=dict)
+    pauses_in_blocks: int = 0
+    explicit: int = 0
+    blocks: int = 0
+    deadline_misses: int = 0
+    misses_with_gc: int = 0
+
+    def describe(self) -> str:
+        """One-line summary for logging."""
+        if not self.window:
+            return f"gc ({self.mode}): no collections, misses {self.deadline_misses}/{self.blocks} blocks"
+        generations = ", ".join(
+            f"gen{generation} {count}" for generation, count in sorted(self.by_generation.items())
+        )
+        return (
+            f"gc ({self.mode}): {self.pauses} collections ({generations}), "
+            f"pause p50 {self.pause_ms['p50']:.2f} ms p99 {self.pause_ms['p99']:.2f} ms "
+            f"max {self.pause_ms['max']:.2f} ms, {self.pauses_in_blocks} inside blocks, "
+            f"{self.explicit} between blocks, misses {self.deadline_misses}/{self.blocks} blocks "
+            f"({self.misses_with_gc} with a collection)"
+        )
+
+class RealtimeGC:
+    """Applies a GC mode for the audio path and records every collection.
+
+    The audio thread brackets each block with block_started() and
+    block_finished(). A gc.callbacks hook times every collection into
+    preallocated arrays and notes whether it ran inside a block, so deadline
+    misses can be attributed to collections. CPython's collector is
+    process-wide: in "deferred" mode automatic collection is off for every
+    thread, and the audio thread alone runs collections after a block. A
+    generation that is due is collected only if its last measured pause
+    fits in `slack_fraction` of the time left before the block's deadline;
+    once its count reaches `max_backlog` times its threshold it is collected
+    regardless, so memory stays bounded.
+    """
+
+    def __init__(self, mode: str = "default", capacity: int = 1024, slack_fraction: float = 0.5,
+                 max_backlog: int = 10):
+        """
+        Initialize the controller. Nothing changes until install().
+
+        Args:
+            mode: One of GC_MODES
+            capacity: Number of recent collections kept for statistics
+            slack_fraction: Fraction of a block's remaining time a deferred
+                collection may use
+            max_backlog: Multiple of a generation's threshold after which it
+                is collected even without slack
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in GC_MODES:
+            raise ValueError(f"Unknown GC mode: {mode}")
+        self.mode = mode
+        self.capacity = capacity
+        self.slack_fraction = slack_fraction
+        self.max_backlog = max_backlog
+        self.installed = False
+        self._was_enabled = True
+        self._pause_start = np.zeros(capacity)
+        self._pause_duration = np.zeros(capacity)
+        self._generation = np.zeros(capacity, dtype=np.int8)
+        self._in_block = np.zeros(capacity, dtype=bool)
+        self._explicit = np.zeros(capacity, dtype=bool)
+        self._count = 0
+        self._started = 0.0
+        self._block_active = False
+        self._collecting = False
+        # Last pause per generation, to predict whether a collection fits
+        self._estimates = [0.0, 0.0, 0.0]
+        self.blocks = 0
+        self.deadline_misses = 0
+        self.misses_with_gc = 0
+        self.logger = logging.getLogger(__name__)
+
+    def install(self):
+        """Apply the mode and start recording collections.
+
+        Call once startup is done, so "freeze" and "deferred" move the
+        long-lived objects (modules, GUI, processors) to the permanent
+        generation.
+        """
+        if self.installed:
+            return
+        if self.mode != "default":
+            start = perf_counter()
+            gc.collect()
+            self._estimates[2] = perf_counter() - start
+            gc.freeze()
+            self.logger.info(f"Froze {gc.get_freeze_count()} startup objects")
+        if self.mode == "deferred":
+            self._was_enabled = gc.isenabled()
+            gc.disable()
+        gc.callbacks.append(self._on_gc)
+        self.installed = True
+
+    def uninstall(self):
+        """Stop recording and restore automatic collection."""
+        if not self.installed:
+            return
+        gc.callbacks.remove(self._on_gc)
+        if self.mode == "deferred" and self._was_enabled:
+            gc.enable()
+        if self.mode != "default":
+            gc.unfreeze()
+        self.installed = False
+
+    def _on_gc(self, phase: str, info: dict):
+        """gc.callbacks hook: time one collection."""
+        if phase == "start":
+            self._started = perf_counter()
+            return
+        slot = self._count % self.capacity
+        duration = perf_counter() - self._started
+        self._pause_start[slot] = self._started
+        self._pause_duration[slot] = duration
+        self._generation[slot] = info["generation"]
+        self._estimates[info["generation"]] = duration
+        self._in_block[slot] = self._block_active
+        self._explicit[slot] = self._collecting
+        self._count += 1
+
+    @property
+    def pauses(self) -> int:
+        """Total collections recorded."""
+        return self._count
+
+    def block_started(self) -> int:
+        """Mark the start of a block. Realtime-safe.
+
+        Returns:
+            Token for block_finished()
+        """
+        self._block_active = True
+        return self._count
+
+    def block_finished(self, token: int, render_time: float, budget: float):
+        """Mark the end of a block and, in deferred mode, collect if there is slack.
+
+        Args:
+            token: Value returned by block_started()
+            render_time: Seconds the block took
+            budget: Seconds the block was allowed to take
+        """
+        self._block_active = False
+        self.blocks += 1
+        if render_time > budget:
+            self.deadline_misses += 1
+            if self._count != token:
+                self.misses_with_gc += 1
+        if self.mode == "deferred" and self.installed:
+            self._collect_deferred(budget - render_time)
+
+    def _collect_deferred(self, slack: float):
+        """Run the oldest due collection that fits in the slack or is overdue."""
+        counts, thresholds = gc.get_count(), gc.get_threshold()
+        allowed = self.slack_fraction * slack
+        generation = None
+        # Like the automatic collector, an older generation is due once
+        # enough younger collections have happened
+        for candidate in (0, 1, 2):
+            if not thresholds[candidate] or counts[candidate] < thresholds[candidate]:
+                break
+            if (self._estimates[candidate] <= allowed
+                    or counts[candidate] >= self.max_backlog * thresholds[candidate]):
+                generation = candidate
+        if generation is None:
+            return
+        self._collecting = True
+        try:
+            gc.collect(generation)
+        finally:
+            self._collecting = False
+
+    def snapshot(self) -> GCSnapshot:
+        """Summarise the recorded collections."""
+        end = self._count
+        start = max(0, end - self.capacity)
+        slots = np.arange(start, end) % self.capacity
+        durations = self._pause_duration[slots]
+        generations = self._generation[slots]
+        snapshot = GCSnapshot(
+            mode=self.mode,
+            pauses=end,
+            window=len(durations),
+            pauses_in_blocks=int(np.count_nonzero(self._in_block[slots])),
+            explicit=int(np.count_nonzero(self._explicit[slots])),
+            blocks=self.blocks,
+            deadline_misses=self.deadline_misses,
+            misses_with_gc=self.misses_with_gc
+        )
+        if len(durations):
+            p50, p99 = np.percentile(durations, [50, 99]) * 1000
+            snapshot.pause_ms = {"p50": p50, "p99": p99, "max": durations.max() * 1000}
+            snapshot.by_generation = {
+                int(generation): int(np.count_nonzero(generations == generation))
+                for generation in np.unique(generations)
+            }
+        return snapshot
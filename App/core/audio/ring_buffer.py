@@ -0,0 +1,100 @@
+"""
+Ring Buffer Module - Preallocated single-producer/single-consumer sample buffer.
+"""
+
+from typing import Optional
+import numpy as np
+
+class SampleRingBuffer:
+    """Lock-free ring buffer for handing audio from the callback to a reader thread.
+
+    One thread writes (the audio callback), one thread reads (e.g. the GUI
+    timer). The writer never blocks or allocates: each block is copied into
+    preallocated storage with one slice assignment, or two when it wraps.
+    Positions are absolute sample counts. The writer announces the end of a
+    write before copying (`_reserved`) and publishes it afterwards
+    (`written`), so a reader can tell whether the samples it copied might
+    have been overwritten meanwhile and retry.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float32):
+        """
+        Initialize the buffer.
+
+        Args:
+            capacity: Number of most recent samples kept
+            dtype: Sample type stored
+        """
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._buffer = np.zeros(capacity, dtype=dtype)
+        self._reserved = 0
+        self.written = 0
+
+    def write(self, data: np.ndarray):
+        """Append samples. Realtime-safe; call from the producer thread only."""
+        n = len(data)
+        if n > self.capacity:
+            # Only the newest samples can be kept
+            self.written += n - self.capacity
+            data = data[-self.capacity:]
+            n = self.capacity
+        start = self.written % self.capacity
+        self._reserved = self.written + n
+        first = min(n, self.capacity - start)
+        self._buffer[start:start + first] = data[:first]
+        if first < n:
+            self._buffer[:n - first] = data[first:]
+        self.written += n
+
+    def read(self, position: int, out: np.ndarray, retries: int = 3) -> int:
+        """Copy len(out) samples starting at absolute `position` into `out`.
+
+        Samples that are not available (not yet written, or already
+        overwritten) are zero-filled. Call from the consumer thread only.
+
+        Args:
+            position: Absolute sample index of out[0]
+            out: Destination array
+            retries: Attempts made when the writer overtakes the copy
+
+        Returns:
+            Number of valid samples copied
+        """
+        n = len(out)
+        for _ in range(retries):
+            written = self.written
+            end = min(position + n, written)
+            begin = max(position, written - self.capacity, 0)
+            if end <= begin:
+                break
+            lo, hi = begin - position, end - position
+            self._copy(begin, out[lo:hi])
+            # Anything announced for writing since we started may have landed
+            # on top of the slots we copied
+            if self._reserved - begin <= self.capacity:
+                out[:lo] = 0
+                out[hi:] = 0
+                return hi - lo
+        out[:] = 0
+        return 0
+
+    def read_latest(self, out: np.ndarray, retries: int = 3) -> int:
+        """Copy the newest len(out) samples into `out`, oldest first.
+
+        Returns:
+            Number of valid samples (fewer than len(out) before the buffer fills)
+        """
+        return self.read(self.written - len(out), out, retries)
+
+    def _copy(self, position: int, out: np.ndarray):
+        """Copy len(out) samples from absolute `position`, handling wrap-around."""
+        n = len(out)
+        if not n:
+            return
+        start = position % self.capacity
+        first = min(n, self.capacity - start)
+        out[:first] = self._buffer[start:start + first]
+        if first < n:
+            out[first:] = self._buffer[:n - first]
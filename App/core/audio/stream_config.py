@@ -0,0 +1,142 @@
+"""
+Stream Configuration Module - Shared audio stream settings and latency validation.
+"""
+
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Optional, Union
+import numpy as np
+
+SUPPORTED_DTYPES = ("float32", "int16", "int32")
+
+@dataclass(frozen=True)
+class StreamConfig:
+    """Settings shared by the audio stream, engine, filters and visualizers."""
+    sample_rate: int = 44100
+    block_size: int = 2048
+    latency: Union[str, float] = 'high'
+    dtype: str = "float32"
+    device: Optional[Union[int, str]] = None
+    channels: int = 1
+
+    def __post_init__(self):
+        if self.sample_rate <= 0:
+            raise ValueError(f"Sample rate must be positive, got {self.sample_rate}")
+        if self.block_size <= 0:
+            raise ValueError(f"Block size must be positive, got {self.block_size}")
+        if self.channels < 1:
+            raise ValueError(f"Channel count must be at least 1, got {self.channels}")
+        if self.dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"Unsupported dtype '{self.dtype}', expected one of {SUPPORTED_DTYPES}")
+        if isinstance(self.latency, str) and self.latency not in ("low", "high"):
+            raise ValueError(f"Latency must be 'low', 'high' or seconds, got '{self.latency}'")
+
+    @property
+    def block_duration(self) -> float:
+        """Duration of one block in seconds (the callback deadline)."""
+        return self.block_size / self.sample_rate
+
+    def stream_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for sounddevice.OutputStream (without the callback)."""
+        return {
+            "samplerate": self.sample_rate,
+            "channels": self.channels,
+            "dtype": self.dtype,
+            "blocksize": self.block_size,
+            "latency": self.latency,
+            "device": self.device,
+        }
+
+    def with_overrides(self, **overrides) -> "StreamConfig":
+        """Get a copy of this configuration with some fields changed."""
+        return replace(self, **overrides)
+
+# Large blocks and 'high' latency: prefer stability over low latency
+DEFAULT_STREAM_CONFIG = StreamConfig()
+
+# Small blocks and low device latency, for machines that can keep up.
+# Check with validate_stream_config before using it.
+LOW_LATENCY_STREAM_CONFIG = StreamConfig(block_size=128, latency='low')
+
+PRESETS = {
+    "default": DEFAULT_STREAM_CONFIG,
+    "low_latency": LOW_LATENCY_STREAM_CONFIG,
+}
+
+def get_preset(name: str) -> StreamConfig:
+    """Get a named stream configuration preset.
+
+    Raises:
+        KeyError: If the preset does not exist
+    """
+    if name not in PRESETS:
+        raise KeyError(f"Unknown stream preset: {name}")
+    return PRESETS[name]
+
+@dataclass
+class LatencyValidation:
+    """Result of measuring callback render times against a configuration."""
+    config: StreamConfig
+    p50_utilisation: float
+    p99_utilisation: float
+    max_utilisation: float
+    max_allowed: float
+
+    @property
+    def passed(self) -> bool:
+        """Whether the p99 render time fits within the allowed share of the deadline."""
+        return self.p99_utilisation <= self.max_allowed
+
+    def describe(self) -> str:
+        """Human-readable one-line summary."""
+        status = "ok" if self.passed else "too slow"
+        return (
+            f"{self.config.block_size} frames @ {self.config.sample_rate} Hz: "
+            f"p50 {self.p50_utilisation:.1%}, p99 {self.p99_utilisation:.1%}, "
+            f"max {self.max_utilisation:.1%} of {self.config.block_duration * 1000:.2f} ms budget "
+            f"(limit {self.max_allowed:.0%}) -> {status}"
+        )
+
+def measure_render_times(generate_audio: Callable[[int], np.ndarray], block_size: int,
+                         blocks: int = 200, warmup: int = 10) -> np.ndarray:
+    """Time repeated calls to a block render function.
+
+    Args:
+        generate_audio: Function rendering `block_size` frames (e.g. AudioEngine.generate_noise)
+        block_size: Frames per call
+        blocks: Number of timed calls
+        warmup: Untimed calls made first
+
+    Returns:
+        Array of render times in seconds
+    """
+    for _ in range(warmup):
+        generate_audio(block_size)
+    times = np.empty(blocks)
+    for i in range(blocks):
+        start = time.perf_counter()
+        generate_audio(block_size)
+        times[i] = time.perf_counter() - start
+    return times
+
+def validate_stream_config(config: StreamConfig, generate_audio: Callable[[int], np.ndarray],
+                           blocks: int = 200, max_utilisation: float = 0.5) -> LatencyValidation:
+    """Check that rendering keeps up with a configuration's callback deadline.
+
+    Args:
+        config: Configuration to validate
+        generate_audio: Function rendering audio for the stream
+        blocks: Number of blocks to measure
+        max_utilisation: Largest allowed p99 render time as a share of the block duration
+
+    Returns:
+        LatencyValidation with the measured utilisation percentiles
+    """
+    utilisation = measure_render_times(generate_audio, config.block_size, blocks) / config.block_duration
+    return LatencyValidation(
+        config=config,
+        p50_utilisation=float(np.percentile(utilisation, 50)),
+        p99_utilisation=float(np.percentile(utilisation, 99)),
+        max_utilisation=float(utilisation.max()),
+        max_allowed=max_utilisation
+    )
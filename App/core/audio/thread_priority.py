@@ -0,0 +1,126 @@
+"""
+Thread Priority Module - CPU affinity and scheduling requests for the audio render thread (Linux).
+"""
+
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+@dataclass(frozen=True)
+class ThreadPolicy:
+    """What to request for the render thread.
+
+    Attributes:
+        cpus: Cores to pin the thread to; None leaves affinity alone
+        realtime_priority: SCHED_FIFO priority (1-99); None keeps the normal scheduler
+        nice: Nice value, used when SCHED_FIFO is not requested or not permitted
+    """
+    cpus: Optional[Tuple[int, ...]] = None
+    realtime_priority: Optional[int] = None
+    nice: Optional[int] = None
+
+    def __post_init__(self):
+        if self.cpus is not None and not self.cpus:
+            raise ValueError("CPU list must not be empty")
+        if self.realtime_priority is not None and not 1 <= self.realtime_priority <= 99:
+            raise ValueError(f"Realtime priority must be 1-99, got {self.realtime_priority}")
+        if self.nice is not None and not -20 <= self.nice <= 19:
+            raise ValueError(f"Nice value must be -20 to 19, got {self.nice}")
+
+    @property
+    def is_default(self) -> bool:
+        """True if the policy requests nothing."""
+        return self.cpus is None and self.realtime_priority is None and self.nice is None
+
+@dataclass
+class AppliedPolicy:
+    """What was actually applied to a thread, and what was refused."""
+    thread_id: int
+    cpus: Optional[Tuple[int, ...]] = None
+    scheduler: str = "normal"
+    nice: Optional[int] = None
+    errors: List[str] = field(default_factory=list)
+
+    def describe(self) -> str:
+        """One-line summary for logging."""
+        parts = [f"thread {self.thread_id}: scheduler {self.scheduler}"]
+        if self.cpus is not None:
+            parts.append(f"cpus {','.join(str(cpu) for cpu in self.cpus)}")
+        if self.nice is not None:
+            parts.append(f"nice {self.nice}")
+        if self.errors:
+            parts.append("not applied: " + "; ".join(self.errors))
+        return ", ".join(parts)
+
+def parse_cpus(text: str) -> Tuple[int, ...]:
+    """
+    Parse a CPU list such as "2,3" or "4-7".
+
+    Raises:
+        ValueError: If the list is malformed
+    """
+    cpus = []
+    for part in text.split(","):
+        first, _, last = part.strip().partition("-")
+        cpus.extend(range(int(first), int(last or first) + 1))
+    if not cpus:
+        raise ValueError(f"No CPUs in '{text}'")
+    return tuple(sorted(set(cpus)))
+
+def apply_thread_policy(policy: ThreadPolicy, thread_id: Optional[int] = None) -> AppliedPolicy:
+    """
+    Apply a policy to a thread, as far as the platform and privileges allow.
+
+    Linux accepts a thread's native id wherever a pid is expected, so this
+    can be called from the thread itself or, with its native id, from any
+    other thread. Every request that fails (no permission, unknown CPU,
+    unsupported platform) is recorded in `errors` instead of raising. If
+    SCHED_FIFO is refused, the nice value is still tried.
+
+    Args:
+        policy: Requested settings
+        thread_id: Native thread id (threading.get_native_id()); the calling thread if None
+
+    Returns:
+        What was applied
+    """
+    thread_id = thread_id if thread_id is not None else threading.get_native_id()
+    applied = AppliedPolicy(thread_id)
+
+    if policy.cpus is not None:
+        if hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(thread_id, policy.cpus)
+                applied.cpus = tuple(sorted(os.sched_getaffinity(thread_id)))
+            except OSError as e:
+                applied.errors.append(f"affinity {policy.cpus}: {e.strerror or e}")
+        else:
+            applied.errors.append("CPU affinity is not supported on this platform")
+
+    if policy.realtime_priority is not None:
+        if hasattr(os, "sched_setscheduler"):
+            try:
+                os.sched_setscheduler(thread_id, os.SCHED_FIFO, os.sched_param(policy.realtime_priority))
+                applied.scheduler = f"SCHED_FIFO {policy.realtime_priority}"
+            except OSError as e:
+                applied.errors.append(f"SCHED_FIFO {policy.realtime_priority}: {e.strerror or e}")
+        else:
+            applied.errors.append("SCHED_FIFO is not supported on this platform")
+
+    if policy.nice is not None and applied.scheduler == "normal":
+        if hasattr(os, "setpriority"):
+            try:
+                os.setpriority(os.PRIO_PROCESS, thread_id, policy.nice)
+                applied.nice = os.getpriority(os.PRIO_PROCESS, thread_id)
+            except OSError as e:
+                applied.errors.append(f"nice {policy.nice}: {e.strerror or e}")
+        else:
+            applied.errors.append("Thread nice values are not supported on this platform")
+    return applied
+
+def policy_from_args(cpus: Optional[str] = None, realtime_priority: Optional[int] = None,
+                     nice: Optional[int] = None) -> Optional[ThreadPolicy]:
+    """Policy from command-line values, or None if nothing was requested."""
+    policy = ThreadPolicy(parse_cpus(cpus) if cpus else None, realtime_priority, nice)
+    return None if policy.is_default else policy
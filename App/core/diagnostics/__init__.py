@@ -0,0 +1 @@
+"""Runtime diagnostics for the realtime audio path."""
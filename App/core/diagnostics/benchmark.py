@@ -0,0 +1,265 @@
+"""
+Benchmark Module - Throughput, block latency and allocation measurements for processors and chains.
+"""
+
+import platform
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from ..audio.audio_engine import AudioEngine
+from ..audio.stream_config import StreamConfig
+from ..processors.processor_factory import AudioProcessorFactory
+
+BLOCK_SIZES = (64, 256, 1024, 2048)
+DTYPES = ("float32", "float64")
+
+# Chains every run covers, generator first
+CANONICAL_CHAINS = (
+    ("xorshift", "bandpass"),
+    ("xorshift", "cascaded_v2"),
+    ("fractal", "cascaded"),
+)
+
+@dataclass
+class BenchmarkResult:
+    """Measurements for one processor or chain at one block size and dtype.
+
+    Attributes:
+        kind: "processor" or "chain"
+        name: Processor name, or chain names joined with "->"
+        block_size: Frames per block
+        dtype: Input dtype for filters, "native" for generators and chains
+        blocks: Number of timed blocks
+        throughput: Samples processed per second
+        latency: Per-block time percentiles in seconds (p50, p95, p99, max, mean)
+        alloc_peak_bytes: Peak memory allocated while processing one block
+        alloc_blocks: Memory blocks still allocated after one block (leak check)
+    """
+    kind: str
+    name: str
+    block_size: int
+    dtype: str
+    blocks: int
+    throughput: float
+    latency: Dict[str, float]
+    alloc_peak_bytes: int
+    alloc_blocks: int
+
+    @property
+    def key(self) -> Tuple[str, str, int, str]:
+        """Identity used to match results between runs."""
+        return (self.kind, self.name, self.block_size, self.dtype)
+
+@dataclass
+class Regression:
+    """A metric that got worse than the allowed threshold."""
+    key: Tuple[str, str, int, str]
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change (positive means worse)."""
+        if self.metric == "throughput":
+            return (self.baseline - self.current) / self.baseline
+        return (self.current - self.baseline) / self.baseline
+
+    def describe(self) -> str:
+        kind, name, block_size, dtype = self.key
+        return (f"{kind} {name} @ {block_size} ({dtype}): {self.metric} "
+                f"{self.baseline:.4g} -> {self.current:.4g} ({self.change:+.1%} worse)")
+
+def measure_block_function(process: Callable[[], Any], block_size: int, min_time: float = 0.2,
+                           min_blocks: int = 20, max_blocks: int = 10000) -> Tuple[np.ndarray, int, int]:
+    """
+    Time repeated calls of a block function.
+
+    One untimed call warms up first. Timing runs until both `min_time`
+    seconds and `min_blocks` calls have passed. Allocations are measured
+    on one extra call with tracemalloc, outside the timed loop.
+
+    Returns:
+        (per-block times in seconds, peak bytes for one block, blocks left allocated)
+    """
+    process()
+
+    times = []
+    started = time.perf_counter()
+    while len(times) < max_blocks and (len(times) < min_blocks or time.perf_counter() - started < min_time):
+        start = time.perf_counter()
+        process()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        snapshot_before = tracemalloc.take_snapshot()
+        result = process()
+        _, peak = tracemalloc.get_traced_memory()
+        # The returned block is not a leak; free it before counting what is left
+        del result
+        snapshot_after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    # Leave out tracemalloc's own bookkeeping and this function's locals
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    snapshot_before, snapshot_after = snapshot_before.filter_traces(ignore), snapshot_after.filter_traces(ignore)
+    remaining = sum(stat.count_diff for stat in snapshot_after.compare_to(snapshot_before, "lineno"))
+    return np.array(times), max(0, peak - before), max(0, remaining)
+
+def _result(kind: str, name: str, block_size: int, dtype: str, times: np.ndarray,
+            peak: int, remaining: int) -> BenchmarkResult:
+    return BenchmarkResult(
+        kind=kind,
+        name=name,
+        block_size=block_size,
+        dtype=dtype,
+        blocks=len(times),
+        throughput=block_size * len(times) / times.sum(),
+        latency={
+            "p50": float(np.percentile(times, 50)),
+            "p95": float(np.percentile(times, 95)),
+            "p99": float(np.percentile(times, 99)),
+            "max": float(times.max()),
+            "mean": float(times.mean()),
+        },
+        alloc_peak_bytes=int(peak),
+        alloc_blocks=int(remaining)
+    )
+
+def benchmark_processor(name: str, block_size: int, dtype: str = "float64", sample_rate: int = 44100,
+                        **timing) -> BenchmarkResult:
+    """
+    Benchmark one registered processor with its default parameters.
+
+    Generators render `block_size` frames per call; filters process a
+    block of noise in `dtype`.
+    """
+    registration = AudioProcessorFactory.get_processor_info(name)
+    if registration is None:
+        raise ValueError(f"Unknown processor type: {name}")
+    processor = AudioProcessorFactory.create(name)
+    if hasattr(processor, "set_sample_rate"):
+        processor.set_sample_rate(sample_rate)
+    parameters = registration.schema.defaults()
+
+    if registration.category == "noise":
+        dtype = "native"
+        process = lambda: processor.process_audio(block_size, parameters)
+    else:
+        block = np.random.default_rng(0).uniform(-1.0, 1.0, block_size).astype(dtype)
+        process = lambda: processor.process_audio(block, parameters)
+    return _result("processor", name, block_size, dtype, *measure_block_function(process, block_size, **timing))
+
+def benchmark_chain(chain: Sequence[str], block_size: int, sample_rate: int = 44100, **timing) -> BenchmarkResult:
+    """Benchmark a processor chain rendered by AudioEngine with default parameters."""
+    engine = AudioEngine(
+        {"processors": [{"type": name} for name in chain]},
+        stream_config=StreamConfig(sample_rate=sample_rate, block_size=block_size)
+    )
+    parameters = {}
+    for name in chain:
+        parameters.update(AudioProcessorFactory.get_processor_info(name).schema.defaults())
+    engine.set_parameters(**parameters)
+    times, peak, remaining = measure_block_function(lambda: engine.generate_noise(block_size), block_size, **timing)
+    return _result("chain", "->".join(chain), block_size, "native", times, peak, remaining)
+
+def run_suite(processors: Optional[Iterable[str]] = None, chains: Iterable[Sequence[str]] = CANONICAL_CHAINS,
+              block_sizes: Iterable[int] = BLOCK_SIZES, dtypes: Iterable[str] = DTYPES,
+              progress: Optional[Callable[[BenchmarkResult], None]] = None, **timing) -> List[BenchmarkResult]:
+    """
+    Benchmark every registered processor (or the given ones) and the chains.
+
+    Args:
+        processors: Processor names; all registered processors if None
+        chains: Processor chains to benchmark through AudioEngine
+        block_sizes: Block sizes to measure
+        dtypes: Input dtypes for filters (generators run once, natively)
+        progress: Called with each result as it completes
+        **timing: min_time / min_blocks / max_blocks for measure_block_function
+
+    Returns:
+        All results, processors first
+    """
+    if processors is None:
+        processors = [registration.name for registration in AudioProcessorFactory.get_registered_processors()]
+    block_sizes, dtypes = list(block_sizes), list(dtypes)
+
+    results = []
+    def add(result: BenchmarkResult):
+        results.append(result)
+        if progress is not None:
+            progress(result)
+
+    for name in processors:
+        category = AudioProcessorFactory.get_processor_info(name).category
+        for block_size in block_sizes:
+            for dtype in (dtypes[:1] if category == "noise" else dtypes):
+                add(benchmark_processor(name, block_size, dtype, **timing))
+    for chain in chains:
+        for block_size in block_sizes:
+            add(benchmark_chain(chain, block_size, **timing))
+    return results
+
+def environment() -> Dict[str, Any]:
+    """Machine and library details stored with each run."""
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+def to_json(results: Iterable[BenchmarkResult]) -> Dict[str, Any]:
+    """Serializable form of a run (results plus environment)."""
+    return {"environment": environment(), "results": [asdict(result) for result in results]}
+
+def from_json(data: Dict[str, Any]) -> List[BenchmarkResult]:
+    """Results from a dict written by to_json."""
+    return [BenchmarkResult(**result) for result in data["results"]]
+
+def compare_results(baseline: Iterable[BenchmarkResult], current: Iterable[BenchmarkResult],
+                    threshold: float = 0.10, metrics: Sequence[str] = ("throughput", "p95")) -> List[Regression]:
+    """
+    Find measurements that got worse than the baseline by more than `threshold`.
+
+    Throughput regresses when it drops; latency percentiles and allocation
+    peaks regress when they rise. Results missing from either run are
+    ignored.
+
+    Args:
+        baseline: Stored results
+        current: New results
+        threshold: Allowed relative change, e.g. 0.10 for 10%
+        metrics: "throughput", latency percentile names, or "alloc_peak_bytes"
+
+    Returns:
+        Regressions, worst first
+    """
+    reference = {result.key: result for result in baseline}
+    regressions = []
+    for result in current:
+        previous = reference.get(result.key)
+        if previous is None:
+            continue
+        for metric in metrics:
+            old, new = _metric(previous, metric), _metric(result, metric)
+            if not old:
+                continue
+            regression = Regression(result.key, metric, old, new)
+            if regression.change > threshold:
+                regressions.append(regression)
+    return sorted(regressions, key=lambda regression: regression.change, reverse=True)
+
+def _metric(result: BenchmarkResult, metric: str) -> float:
+    if metric == "throughput":
+        return result.throughput
+    if metric == "alloc_peak_bytes":
+        return float(result.alloc_peak_bytes)
+    return result.latency[metric]
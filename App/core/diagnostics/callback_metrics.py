@@ -0,0 +1,185 @@
+"""
+Callback Metrics Module - Realtime-safe timing and xrun recording for audio callbacks.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from threading import Thread, Event
+from typing import Dict, Optional
+import numpy as np
+
+# Bit positions for the sounddevice.CallbackFlags attributes we track
+STATUS_FLAGS = ("output_underflow", "output_overflow", "input_underflow", "input_overflow")
+
+# Utilisation histogram: 5% buckets up to 150% of the deadline, then one overflow bucket
+HISTOGRAM_EDGES = np.append(np.linspace(0.0, 1.5, 31), np.inf)
+
+def status_bits(status) -> int:
+    """Pack the xrun flags of a sounddevice status object into an int."""
+    bits = 0
+    if status:
+        for bit, name in enumerate(STATUS_FLAGS):
+            if getattr(status, name, False):
+                bits |= 1 << bit
+    return bits
+
+@dataclass
+class MetricsSnapshot:
+    """Statistics over the most recent callbacks, computed off the audio thread."""
+    blocks: int
+    window: int
+    render_ms: Dict[str, float] = field(default_factory=dict)
+    utilisation: Dict[str, float] = field(default_factory=dict)
+    deadline_misses: int = 0
+    xruns: Dict[str, int] = field(default_factory=dict)
+    window_xruns: Dict[str, int] = field(default_factory=dict)
+    histogram: np.ndarray = field(default_factory=lambda: np.zeros(len(HISTOGRAM_EDGES) - 1, dtype=np.int64))
+
+    def describe(self) -> str:
+        """One-line summary for periodic logging."""
+        if not self.window:
+            return f"callbacks: {self.blocks}, no timing data"
+        xruns = sum(self.xruns.values())
+        return (
+            f"callbacks: {self.blocks}, render p50 {self.render_ms['p50']:.2f} ms "
+            f"p99 {self.render_ms['p99']:.2f} ms max {self.render_ms['max']:.2f} ms, "
+            f"deadline p50 {self.utilisation['p50']:.0%} p99 {self.utilisation['p99']:.0%} "
+            f"max {self.utilisation['max']:.0%}, misses {self.deadline_misses}/{self.window}, "
+            f"xruns {xruns}"
+        )
+
+class CallbackMetrics:
+    """Fixed-size record of per-callback render time, deadline ratio and xrun flags.
+
+    `record` is called from the audio callback: it only writes into
+    preallocated arrays and bumps counters, with no locks, I/O or resizing.
+    There must be a single writer. Readers call `snapshot`, which copies the
+    ring and discards any slots the writer overwrote while it was copying.
+    """
+
+    def __init__(self, sample_rate: int = 44100, capacity: int = 4096):
+        """
+        Initialize metric storage.
+
+        Args:
+            sample_rate: Stream sample rate, used to turn frames into a deadline
+            capacity: Number of recent callbacks kept for percentiles and the histogram
+        """
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive, got {capacity}")
+        self.sample_rate = sample_rate
+        self.capacity = capacity
+        self._render_times = np.zeros(capacity)
+        self._utilisation = np.zeros(capacity)
+        self._flags = np.zeros(capacity, dtype=np.uint8)
+        self._xrun_counts = np.zeros(len(STATUS_FLAGS), dtype=np.int64)
+        self._count = 0
+
+    def record(self, render_time: float, frames: int, status=None):
+        """Record one callback. Realtime-safe.
+
+        Args:
+            render_time: Seconds spent producing the block
+            frames: Frames in the block
+            status: sounddevice.CallbackFlags passed to the callback, if any
+        """
+        slot = self._count % self.capacity
+        bits = status_bits(status)
+        self._render_times[slot] = render_time
+        self._utilisation[slot] = render_time * self.sample_rate / frames if frames else 0.0
+        self._flags[slot] = bits
+        if bits:
+            for bit in range(len(STATUS_FLAGS)):
+                if bits & (1 << bit):
+                    self._xrun_counts[bit] += 1
+        # Publish the slot only after it is fully written
+        self._count += 1
+
+    @property
+    def blocks(self) -> int:
+        """Total callbacks recorded."""
+        return self._count
+
+    def reset(self):
+        """Forget all recorded callbacks. Not safe while the stream is running."""
+        self._xrun_counts[:] = 0
+        self._count = 0
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Compute percentiles, xrun counts and the utilisation histogram."""
+        end = self._count
+        start = max(0, end - self.capacity)
+        slots = np.arange(start, end) % self.capacity
+        render_times = self._render_times[slots]
+        utilisation = self._utilisation[slots]
+        flags = self._flags[slots]
+        xrun_counts = self._xrun_counts.copy()
+
+        # Entries whose slots were reused during the copy (including the one
+        # being written right now) may be torn, so drop them
+        first_valid = max(start, self._count - self.capacity + 1)
+        keep = slice(first_valid - start, None)
+        render_times, utilisation, flags = render_times[keep], utilisation[keep], flags[keep]
+
+        snapshot = MetricsSnapshot(
+            blocks=end,
+            window=len(render_times),
+            xruns={name: int(count) for name, count in zip(STATUS_FLAGS, xrun_counts)},
+            window_xruns={
+                name: int(np.count_nonzero(flags & (1 << bit)))
+                for bit, name in enumerate(STATUS_FLAGS)
+            }
+        )
+        if len(render_times):
+            p50, p99 = np.percentile(render_times, [50, 99]) * 1000
+            snapshot.render_ms = {"p50": p50, "p99": p99, "max": render_times.max() * 1000}
+            p50, p99 = np.percentile(utilisation, [50, 99])
+            snapshot.utilisation = {"p50": p50, "p99": p99, "max": utilisation.max()}
+            snapshot.deadline_misses = int(np.count_nonzero(utilisation > 1.0))
+            snapshot.histogram = np.histogram(utilisation, HISTOGRAM_EDGES)[0]
+        return snapshot
+
+class MetricsReporter:
+    """Logs a CallbackMetrics summary line at a fixed interval from its own thread."""
+
+    def __init__(self, metrics: CallbackMetrics, interval: float = 10.0,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize the reporter.
+
+        Args:
+            metrics: Metrics to summarise
+            interval: Seconds between log lines
+            logger: Logger to write to; defaults to this module's logger
+        """
+        self.metrics = metrics
+        self.interval = interval
+        self.logger = logger or logging.getLogger(__name__)
+        self.stop_event = Event()
+        self.report_thread = None
+
+    def report_loop(self):
+        """Log a summary every interval while new callbacks arrive."""
+        last_blocks = -1
+        while not self.stop_event.wait(self.interval):
+            snapshot = self.metrics.snapshot()
+            if snapshot.blocks == last_blocks:
+                continue
+            last_blocks = snapshot.blocks
+            if snapshot.deadline_misses or any(snapshot.window_xruns.values()):
+                self.logger.warning(snapshot.describe())
+            else:
+                self.logger.info(snapshot.describe())
+
+    def start(self):
+        """Start periodic reporting."""
+        if self.report_thread is None or not self.report_thread.is_alive():
+            self.stop_event.clear()
+            self.report_thread = Thread(target=self.report_loop, daemon=True, name="MetricsThread")
+            self.report_thread.start()
+
+    def stop(self):
+        """Stop periodic reporting."""
+        self.stop_event.set()
+        if self.report_thread is not None:
+            self.report_thread.join(timeout=1.0)
@@ -0,0 +1,205 @@
+"""
+Processor Profiler Module - Per-processor block timings from the audio engine, with Chrome trace export.
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple, Union
+import numpy as np
+
+@dataclass
+class StageSummary:
+    """Timing statistics of one stage over the recorded blocks.
+
+    Attributes:
+        name: Processor name, "engine" for time outside the processors, or "block"
+        mean_ms: Mean time per block in milliseconds
+        p99_ms: 99th percentile in milliseconds
+        max_ms: Slowest block in milliseconds
+        budget_share: Mean fraction of the block's real-time budget spent here
+    """
+    name: str
+    mean_ms: float
+    p99_ms: float
+    max_ms: float
+    budget_share: float
+
+class ProcessorProfiler:
+    """Fixed-size record of how long each processor took on each block.
+
+    The engine brackets every block and every stage with perf_counter reads
+    and writes them into preallocated arrays, one row per block, so recording
+    costs a few float stores per stage and never allocates. As with
+    CallbackMetrics there must be a single writer; readers copy the ring and
+    drop the rows the writer may have overwritten meanwhile.
+
+    Time in the block that is not inside any stage (dtype conversion,
+    chunking, waiting for the GIL between stages) shows up as "engine".
+
+    Each row also records which chain it was rendered with, so timings
+    taken before a processor switch (see rename_stage) stay under the old
+    processor's name.
+    """
+
+    def __init__(self, stage_names: Sequence[str], sample_rate: int = 44100, capacity: int = 4096):
+        """
+        Initialize profile storage.
+
+        Args:
+            stage_names: Processor names in chain order
+            sample_rate: Stream sample rate, used to turn frames into a time budget
+            capacity: Number of recent blocks kept
+        """
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive, got {capacity}")
+        # Every chain the rows were rendered with; rows store an index into this
+        self.chains: List[Tuple[str, ...]] = [tuple(stage_names)]
+        self.sample_rate = sample_rate
+        self.capacity = capacity
+        self.origin = time.perf_counter()
+        self.thread_id = 0
+        self._block_start = np.zeros(capacity)
+        self._block_end = np.zeros(capacity)
+        self._frames = np.zeros(capacity, dtype=np.int64)
+        self._chain = np.zeros(capacity, dtype=np.int32)
+        self._stage_start = np.zeros((capacity, len(stage_names)))
+        self._stage_end = np.zeros((capacity, len(stage_names)))
+        self._chain_index = 0
+        self._count = 0
+
+    @property
+    def stage_names(self) -> Tuple[str, ...]:
+        """Processor names of the current chain."""
+        return self.chains[self._chain_index]
+
+    def rename_stage(self, index: int, name: str):
+        """Record that a stage now runs a different processor.
+
+        Blocks finished from now on are attributed to the new name; earlier
+        blocks keep the old one. Called from the thread switching processors.
+        """
+        names = list(self.stage_names)
+        names[index] = name
+        self.chains.append(tuple(names))
+        self._chain_index = len(self.chains) - 1
+
+    def record_stage(self, index: int, start: float, end: float):
+        """Record one stage of the block being rendered. Realtime-safe."""
+        slot = self._count % self.capacity
+        self._stage_start[slot, index] = start
+        self._stage_end[slot, index] = end
+
+    def end_block(self, start: float, end: float, frames: int):
+        """Record the whole block and publish its row. Realtime-safe."""
+        slot = self._count % self.capacity
+        self._block_start[slot] = start
+        self._block_end[slot] = end
+        self._frames[slot] = frames
+        self._chain[slot] = self._chain_index
+        if not self.thread_id:
+            self.thread_id = threading.get_ident()
+        # Publish the slot only after it is fully written
+        self._count += 1
+
+    @property
+    def blocks(self) -> int:
+        """Total blocks recorded."""
+        return self._count
+
+    def reset(self):
+        """Forget all recorded blocks. Not safe while the engine is rendering."""
+        self._count = 0
+
+    def _window(self):
+        """Copy the valid rows, oldest first: (block index, starts, ends, frames, chains, stage starts, stage ends)."""
+        end = self._count
+        start = max(0, end - self.capacity)
+        slots = np.arange(start, end) % self.capacity
+        rows = (
+            np.arange(start, end),
+            self._block_start[slots],
+            self._block_end[slots],
+            self._frames[slots],
+            self._chain[slots],
+            self._stage_start[slots],
+            self._stage_end[slots],
+        )
+        # Rows whose slots were reused during the copy may be torn, so drop them
+        keep = slice(max(start, self._count - self.capacity + 1) - start, None)
+        return tuple(row[keep] for row in rows)
+
+    def summary(self) -> List[StageSummary]:
+        """Per-stage statistics, followed by "engine" overhead and the whole "block"."""
+        _, block_start, block_end, frames, chains, stage_start, stage_end = self._window()
+        if not len(frames):
+            return []
+        budget = frames / self.sample_rate
+        stage_times = stage_end - stage_start
+        block_times = block_end - block_start
+        # One column per processor that ran at each position, in order of first use
+        columns = []
+        for index in range(stage_times.shape[1]):
+            names = np.array([self.chains[chain][index] for chain in chains])
+            for name in dict.fromkeys(names):
+                rows = names == name
+                columns.append((name, stage_times[rows, index], budget[rows]))
+        columns.append(("engine", block_times - stage_times.sum(axis=1), budget))
+        columns.append(("block", block_times, budget))
+        return [
+            StageSummary(
+                name=str(name),
+                mean_ms=float(times.mean() * 1000),
+                p99_ms=float(np.percentile(times, 99) * 1000),
+                max_ms=float(times.max() * 1000),
+                budget_share=float((times / budgets).mean())
+            )
+            for name, times, budgets in columns
+        ]
+
+    def describe(self) -> str:
+        """Summary table for logging."""
+        rows = self.summary()
+        if not rows:
+            return "profile: no blocks recorded"
+        lines = [f"{'stage':16} {'mean ms':>9} {'p99 ms':>9} {'max ms':>9} {'budget':>7}"]
+        for row in rows:
+            lines.append(f"{row.name:16} {row.mean_ms:9.3f} {row.p99_ms:9.3f} {row.max_ms:9.3f} "
+                         f"{row.budget_share:7.1%}")
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        Recorded blocks as Chrome trace-event JSON (chrome://tracing, Perfetto).
+
+        Each block is a complete ("X") event with its stages nested inside,
+        timestamped in microseconds since the profiler was created.
+        """
+        indices, block_start, block_end, frames, chains, stage_start, stage_end = self._window()
+        thread_id = self.thread_id
+        events: List[Dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": 0, "tid": thread_id, "args": {"name": "audio"}}
+        ]
+        for row, block in enumerate(indices):
+            args = {"block": int(block), "frames": int(frames[row])}
+            events.append(self._event("block", block_start[row], block_end[row], thread_id, args))
+            for index, name in enumerate(self.chains[chains[row]]):
+                events.append(self._event(name, stage_start[row, index], stage_end[row, index], thread_id, args))
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def _event(self, name: str, start: float, end: float, thread_id: int, args: dict) -> Dict[str, Any]:
+        return {
+            "name": name,
+            "ph": "X",
+            "ts": (start - self.origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": 0,
+            "tid": thread_id,
+            "args": args,
+        }
+
+    def export_chrome_trace(self, path: Union[str, Path]):
+        """Write chrome_trace() to a JSON file."""
+        Path(path).write_text(json.dumps(self.chrome_trace()))
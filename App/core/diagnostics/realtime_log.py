@@ -0,0 +1,190 @@
+"""
+Realtime Log Module - Fixed-format log records from the audio thread, forwarded to logging off-thread.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from threading import Thread, Event
+from typing import Dict, List, Optional
+import numpy as np
+
+@dataclass(frozen=True)
+class LogEvent:
+    """A message the audio thread can log by code.
+
+    Attributes:
+        name: Short name, e.g. "output_underflow"
+        level: logging level
+        message: Format string for one occurrence; receives `value`
+        summary: Format string for repeats within a window; receives
+            `count` and `window` (seconds)
+    """
+    name: str
+    level: int
+    message: str
+    summary: str
+
+class RealtimeLog:
+    """Single-producer queue of log records from the audio thread.
+
+    The audio thread calls push() with an event code and a number; it writes
+    into preallocated arrays and bumps a counter, with no locks, string
+    formatting or I/O. If the drainer falls behind and the ring is full, the
+    record is dropped and counted instead of blocking. A drainer thread
+    formats the records and hands them to `logging`.
+
+    Repeats are rate limited per event: the first `burst` occurrences in
+    each `window` seconds are logged individually, and the rest are folded
+    into one summary line when the window ends, e.g. "37 output underflows
+    in last 1s".
+    """
+
+    def __init__(self, capacity: int = 1024, window: float = 1.0, burst: int = 1,
+                 interval: float = 0.1, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the queue.
+
+        Args:
+            capacity: Records held before new ones are dropped
+            window: Aggregation window in seconds
+            burst: Occurrences per event and window logged individually
+            interval: Seconds between drains on the drainer thread
+            logger: Logger to forward to; defaults to this module's logger
+        """
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.window = window
+        self.burst = burst
+        self.interval = interval
+        self.logger = logger or logging.getLogger(__name__)
+        self.events: List[LogEvent] = []
+        self._codes: Dict[str, int] = {}
+        self._event_codes = np.zeros(capacity, dtype=np.int32)
+        self._values = np.zeros(capacity)
+        self._written = 0
+        self._read = 0
+        self.dropped = 0
+        self._reported_drops = 0
+        # Per event: start of the current window and occurrences in it
+        self._window_start: Dict[int, float] = {}
+        self._window_counts: Dict[int, int] = {}
+        self.stop_event = Event()
+        self.drain_thread = None
+
+    def define(self, name: str, level: int, message: str, summary: Optional[str] = None) -> int:
+        """
+        Define an event the audio thread can push. Not realtime-safe; call during setup.
+
+        Args:
+            name: Short name, unique per log
+            level: logging level
+            message: Format string for one occurrence, may use {value}
+            summary: Format string for repeats, may use {count} and {window};
+                defaults to "{count} <name>s in last {window:g}s"
+
+        Returns:
+            Event code for push(); the existing code if `name` is already defined
+        """
+        if name in self._codes:
+            return self._codes[name]
+        if summary is None:
+            summary = f"{{count}} {name.replace('_', ' ')}s in last {{window:g}}s"
+        self.events.append(LogEvent(name, level, message, summary))
+        self._codes[name] = len(self.events) - 1
+        return self._codes[name]
+
+    def code(self, name: str) -> int:
+        """Event code of a defined event."""
+        return self._codes[name]
+
+    def push(self, code: int, value: float = 0.0):
+        """Queue one record. Realtime-safe; single writer only.
+
+        Args:
+            code: Event code returned by define()
+            value: Number passed to the event's message
+        """
+        written = self._written
+        if written - self._read >= self.capacity:
+            self.dropped += 1
+            return
+        slot = written % self.capacity
+        self._event_codes[slot] = code
+        self._values[slot] = value
+        # Publish the slot only after it is fully written
+        self._written = written + 1
+
+    @property
+    def pending(self) -> int:
+        """Records waiting to be drained."""
+        return self._written - self._read
+
+    def drain(self, now: Optional[float] = None) -> int:
+        """
+        Forward queued records to the logger and close expired windows.
+
+        Called by the drainer thread; call directly when no thread runs.
+
+        Args:
+            now: Current monotonic time (for tests); time.monotonic() if None
+
+        Returns:
+            Number of records forwarded
+        """
+        now = time.monotonic() if now is None else now
+        self._flush_windows(now)
+
+        read, written = self._read, self._written
+        for index in range(read, written):
+            slot = index % self.capacity
+            code = int(self._event_codes[slot])
+            value = float(self._values[slot])
+            if code not in self._window_start:
+                self._window_start[code] = now
+                self._window_counts[code] = 0
+            self._window_counts[code] += 1
+            if self._window_counts[code] <= self.burst:
+                event = self.events[code]
+                self.logger.log(event.level, event.message.format(value=value))
+        # Free the slots only after they are read
+        self._read = written
+
+        dropped = self.dropped
+        if dropped != self._reported_drops:
+            self.logger.warning(f"Realtime log full, dropped {dropped - self._reported_drops} records")
+            self._reported_drops = dropped
+        return written - read
+
+    def _flush_windows(self, now: float, force: bool = False):
+        """Log summaries of windows that have ended (or all, if forced)."""
+        for code, start in list(self._window_start.items()):
+            if not force and now - start < self.window:
+                continue
+            count = self._window_counts.pop(code)
+            del self._window_start[code]
+            if count > self.burst:
+                event = self.events[code]
+                self.logger.log(event.level, event.summary.format(count=count, window=self.window))
+
+    def drain_loop(self):
+        """Drain every interval until stopped."""
+        while not self.stop_event.wait(self.interval):
+            self.drain()
+
+    def start(self):
+        """Start the drainer thread."""
+        if self.drain_thread is None or not self.drain_thread.is_alive():
+            self.stop_event.clear()
+            self.drain_thread = Thread(target=self.drain_loop, daemon=True, name="LogDrainThread")
+            self.drain_thread.start()
+
+    def stop(self):
+        """Stop the drainer thread, forward what is left and close all windows."""
+        self.stop_event.set()
+        if self.drain_thread is not None:
+            self.drain_thread.join(timeout=1.0)
+        now = time.monotonic()
+        self.drain(now)
+        self._flush_windows(now, force=True)
@@ -0,0 +1,201 @@
+"""
+Sampling Profiler Module - Periodic stack samples of the audio threads, written as collapsed stacks.
+"""
+
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union
+
+# Threads that render audio in the headless server (BlockRenderer). The GUI
+# app renders on the sound device's callback thread, which is not a
+# threading.Thread; add it with add_thread() (see AudioStream.callback_thread_ident).
+DEFAULT_THREADS = ("RenderThread",)
+
+class SamplingProfiler:
+    """Statistical profiler for a few named threads, or threads given by ident.
+
+    A background thread wakes every `interval` seconds, reads the current
+    frame of each target thread from sys._current_frames() and counts the
+    stack. The profiled threads run untouched (no trace hooks as with
+    cProfile), so the cost to them is only the GIL held while a sample is
+    taken. Results are written in the collapsed-stack format read by
+    flamegraph.pl, speedscope and inferno: one "thread;outer;...;inner count"
+    line per distinct stack.
+
+    Start and stop it from code, or with toggle() from a signal handler
+    (see install_signal_handler) to profile a running session in place.
+    """
+
+    def __init__(self, interval: float = 0.005, thread_names: Sequence[str] = DEFAULT_THREADS,
+                 output_dir: Optional[Union[str, Path]] = ".", max_depth: int = 128):
+        """
+        Initialize the profiler.
+
+        Args:
+            interval: Seconds between samples
+            thread_names: Names of the threads to sample
+            output_dir: Directory stop() writes each profile to; None to keep it in memory only
+            max_depth: Frames kept per stack, innermost first
+        """
+        if interval <= 0:
+            raise ValueError(f"Sampling interval must be positive, got {interval}")
+        self.interval = interval
+        self.thread_names = tuple(thread_names)
+        self.output_dir = Path(output_dir) if output_dir is not None else None
+        self.max_depth = max_depth
+        self.stacks: Dict[Tuple[str, ...], int] = {}
+        self.samples = 0
+        self.sampling_time = 0.0
+        self.stop_event = Event()
+        self.sample_thread = None
+        self._lock = Lock()
+        self._labels: Dict[object, str] = {}
+        self._targets: Dict[int, str] = {}
+        self._added: Dict[str, Union[int, Callable[[], Optional[int]]]] = {}
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def running(self) -> bool:
+        """Whether samples are being taken."""
+        return self.sample_thread is not None and self.sample_thread.is_alive()
+
+    def start(self):
+        """Start sampling, discarding the previous profile."""
+        if self.running:
+            return
+        with self._lock:
+            self.stacks = {}
+            self.samples = 0
+            self.sampling_time = 0.0
+        self.stop_event.clear()
+        self.sample_thread = Thread(target=self.sample_loop, daemon=True, name="SamplerThread")
+        self.sample_thread.start()
+        targets = ", ".join(self.thread_names + tuple(self._added))
+        self.logger.info(f"Sampling profiler started for {targets} every {self.interval * 1000:.1f} ms")
+
+    def stop(self) -> Optional[Path]:
+        """
+        Stop sampling and write the profile if an output directory is set.
+
+        Returns:
+            Path of the written profile, or None
+        """
+        if self.sample_thread is None:
+            return None
+        self.stop_event.set()
+        self.sample_thread.join(timeout=1.0)
+        self.sample_thread = None
+
+        path = None
+        if self.output_dir is not None:
+            path = self.output_dir / f"sampling-profile-{os.getpid()}-{time.strftime('%Y%m%d-%H%M%S')}.folded"
+            self.write(path)
+        overhead = self.sampling_time / self.samples * 1e6 if self.samples else 0.0
+        self.logger.info(f"Sampling profiler stopped: {self.samples} samples, "
+                         f"{overhead:.0f} us per sample" + (f", written to {path}" if path else ""))
+        return path
+
+    def toggle(self) -> bool:
+        """
+        Start sampling if stopped, otherwise stop and write the profile.
+
+        Returns:
+            Whether the profiler is running afterwards
+        """
+        if self.running:
+            self.stop()
+            return False
+        self.start()
+        return True
+
+    def install_signal_handler(self, signum: Optional[int] = None) -> bool:
+        """
+        Toggle the profiler on a signal (SIGUSR1 by default).
+
+        Returns:
+            False if the platform has no such signal (e.g. Windows)
+        """
+        signum = signum if signum is not None else getattr(signal, "SIGUSR1", None)
+        if signum is None:
+            return False
+        signal.signal(signum, lambda received, frame: self.toggle())
+        return True
+
+    def add_thread(self, name: str, ident: Union[int, Callable[[], Optional[int]]]):
+        """
+        Sample a thread by ident, e.g. a native callback thread missing from threading.enumerate().
+
+        Args:
+            name: Label for the thread's stacks
+            ident: threading.get_ident() of the thread, or a callable returning
+                it (None while unknown), looked up on every sample
+        """
+        self._added[name] = ident
+
+    def sample_loop(self):
+        """Take a sample every interval until stopped."""
+        while not self.stop_event.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        """Record the current stack of every target thread."""
+        start = time.perf_counter()
+        frames = sys._current_frames()
+        added = {}
+        for name, ident in self._added.items():
+            ident = ident() if callable(ident) else ident
+            if ident is not None:
+                added[ident] = name
+        if any(ident not in self._targets and ident not in added for ident in frames):
+            self._refresh_targets()
+
+        stacks = []
+        for ident, frame in frames.items():
+            name = added.get(ident) or self._targets.get(ident)
+            if name is None:
+                continue
+            labels = []
+            while frame is not None and len(labels) < self.max_depth:
+                labels.append(self._label(frame.f_code))
+                frame = frame.f_back
+            labels.append(name)
+            stacks.append(tuple(reversed(labels)))
+        del frames
+
+        with self._lock:
+            for stack in stacks:
+                self.stacks[stack] = self.stacks.get(stack, 0) + 1
+            self.samples += 1
+            self.sampling_time += time.perf_counter() - start
+
+    def _refresh_targets(self):
+        """Map thread idents to names; other threads map to None and are skipped."""
+        self._targets = {
+            thread.ident: (thread.name if thread.name in self.thread_names else None)
+            for thread in threading.enumerate()
+        }
+
+    def _label(self, code) -> str:
+        """Frame label "function (package/module.py:first line)", cached per code object."""
+        label = self._labels.get(code)
+        if label is None:
+            path = Path(code.co_filename)
+            label = f"{code.co_name} ({path.parent.name}/{path.name}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def collapsed(self) -> str:
+        """Profile in collapsed-stack format, most frequent stacks first."""
+        with self._lock:
+            stacks = sorted(self.stacks.items(), key=lambda item: item[1], reverse=True)
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in stacks)
+
+    def write(self, path: Union[str, Path]):
+        """Write collapsed() to a file."""
+        Path(path).write_text(self.collapsed())
@@ -1,13 +1,48 @@
 import numpy as np
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class FilterCoefficients:
+    """Linear (small-signal) description of a filter as first-order sections in series.
+    
+    Each row of `sections` is (b0, b1, a1) for
+    H(z) = (b0 + b1 z^-1) / (1 + a1 z^-1). `fir` optionally adds an FIR stage
+    (taps for z^0, z^-1, ...) and `gain` scales the result.
+    """
+    sections: np.ndarray
+    gain: float = 1.0
+    fir: Optional[np.ndarray] = None
+
+def onepole_lowpass_section(alpha: float) -> tuple:
+    """Section for y[n] = alpha * x[n] + (1-alpha) * y[n-1]."""
+    return (alpha, 0.0, -(1.0 - alpha))
 
 class FilterBase(ABC):
     """Base class for all audio filters."""
     
+    # Sample rate the coefficient mappings were tuned at
+    REFERENCE_SAMPLE_RATE = 44100
+    
     def __init__(self):
         # Filter states
         self.prev_x = 0.0
         self.prev_y = 0.0
+        self.sample_rate = self.REFERENCE_SAMPLE_RATE
+    
+    def set_sample_rate(self, sample_rate: int):
+        """Set the sample rate used for coefficient design.
+        
+        Args:
+            sample_rate: Stream sample rate in Hz
+        """
+        self.sample_rate = sample_rate
+    
+    def reset(self):
+        """Clear the filter state, as if freshly constructed."""
+        self.prev_x = 0.0
+        self.prev_y = 0.0
     
     @abstractmethod
     def process_audio(self, audio: np.ndarray, parameters: dict) -> np.ndarray:
@@ -22,6 +57,37 @@ class FilterBase(ABC):
         """
         pass
 
+    @abstractmethod
+    def coefficients(self, parameters: dict) -> FilterCoefficients:
+        """Get the filter's linear transfer function for the given parameters.
+        
+        Volume is not included. Nonlinear stages (soft clipping) are treated
+        as linear, which is exact for small signals.
+        
+        Args:
+            parameters: Dictionary of parameter key-value pairs
+            
+        Returns:
+            FilterCoefficients describing H(z)
+        """
+        pass
+
+    def _scale_coefficient(self, alpha):
+        """Adapt a one-pole coefficient tuned at the reference rate to the current rate.
+        
+        Keeps the pole's cutoff in Hz unchanged, so filters sound the same at
+        any sample rate. Returns alpha untouched at the reference rate.
+        
+        Args:
+            alpha: Coefficient (scalar or array) for y[n] = alpha * x[n] + (1-alpha) * y[n-1]
+            
+        Returns:
+            Coefficient for the current sample rate
+        """
+        if self.sample_rate == self.REFERENCE_SAMPLE_RATE:
+            return alpha
+        return 1.0 - np.power(1.0 - alpha, self.REFERENCE_SAMPLE_RATE / self.sample_rate)
+
     def _apply_volume(self, audio: np.ndarray, parameters: dict) -> np.ndarray:
         """Apply volume scaling to audio.
         
@@ -1,5 +1,5 @@
 import numpy as np
-from ..base import FilterBase
+from ..base import FilterBase, FilterCoefficients, onepole_lowpass_section
 
 class BandpassFilter(FilterBase):
     """Bandpass filter implementation."""
@@ -11,6 +11,13 @@ class BandpassFilter(FilterBase):
         self.hp_prev_y = 0.0
         self.lp_prev_y = 0.0
     
+    def reset(self):
+        """Clear the highpass and lowpass stage states."""
+        super().reset()
+        self.hp_prev_x = 0.0
+        self.hp_prev_y = 0.0
+        self.lp_prev_y = 0.0
+    
     def process_audio(self, audio: np.ndarray, parameters: dict) -> np.ndarray:
         """Apply bandpass filter to input signal.
         
@@ -24,17 +31,7 @@ class BandpassFilter(FilterBase):
         Returns:
             Filtered audio data
         """
-        # Get parameters with defaults
-        cutoff = parameters.get('cutoff', 0.5)
-        bandwidth = parameters.get('bandwidth', 0.5)
-        
-        # Map cutoff from 0-1 to reasonable filter coefficient (0.001 to 0.1)
-        base_alpha = 0.001 + cutoff * 0.099
-        
-        # Calculate high and low cutoffs based on bandwidth
-        bandwidth_offset = bandwidth * 0.05
-        high_alpha = min(0.1, base_alpha + bandwidth_offset)
-        low_alpha = max(0.001, base_alpha - bandwidth_offset)
+        high_alpha, low_alpha, gain_compensation = self._design(parameters)
         
         # Initialize output arrays
         hp = np.zeros_like(audio)
@@ -53,10 +50,35 @@ class BandpassFilter(FilterBase):
             lp[i] = low_alpha * hp[i] + (1 - low_alpha) * self.lp_prev_y
             self.lp_prev_y = lp[i]
         
-        # Base gain of 1.5x plus small bandwidth-dependent adjustment
-        gain_compensation = 1.5 + (0.2 * (1.0 - bandwidth))  # More gain for narrow bandwidth
         lp *= gain_compensation
         
         # Apply volume and clip
         output = self._apply_volume(lp, parameters)
         return self._clip_output(output)
+    
+    def _design(self, parameters: dict) -> tuple:
+        """Map parameters to (high-pass alpha, low-pass alpha, gain)."""
+        # Get parameters with defaults
+        cutoff = parameters.get('cutoff', 0.5)
+        bandwidth = parameters.get('bandwidth', 0.5)
+        
+        # Map cutoff from 0-1 to reasonable filter coefficient (0.001 to 0.1)
+        base_alpha = 0.001 + cutoff * 0.099
+        
+        # Calculate high and low cutoffs based on bandwidth
+        bandwidth_offset = bandwidth * 0.05
+        high_alpha = self._scale_coefficient(min(0.1, base_alpha + bandwidth_offset))
+        low_alpha = self._scale_coefficient(max(0.001, base_alpha - bandwidth_offset))
+        
+        # Base gain of 1.5x plus small bandwidth-dependent adjustment
+        gain_compensation = 1.5 + (0.2 * (1.0 - bandwidth))  # More gain for narrow bandwidth
+        return high_alpha, low_alpha, gain_compensation
+    
+    def coefficients(self, parameters: dict) -> FilterCoefficients:
+        """Get the high-pass and low-pass sections and gain compensation."""
+        high_alpha, low_alpha, gain_compensation = self._design(parameters)
+        sections = np.array([
+            (1.0, -1.0, -(1.0 - high_alpha)),  # y[n] = x[n] - x[n-1] + (1-alpha) * y[n-1]
+            onepole_lowpass_section(low_alpha)
+        ])
+        return FilterCoefficients(sections, gain=gain_compensation)
@@ -1,6 +1,9 @@
-from ..base import FilterBase
+from ..base import FilterBase, FilterCoefficients, onepole_lowpass_section
 import numpy as np
 
+# Length of the moving-average DC trend removed from each block
+DC_WINDOW = 64
+
 class CascadedOnePoleLowPass(FilterBase):
     """Low-pass filter implementation with variable pole count and resonance."""
     
@@ -10,6 +13,11 @@ class CascadedOnePoleLowPass(FilterBase):
         self.prev_x = np.zeros(4)
         self.prev_y = np.zeros(4)
     
+    def reset(self):
+        """Clear the per-pole states."""
+        self.prev_x = np.zeros(4)
+        self.prev_y = np.zeros(4)
+    
     def process_audio(self, audio: np.ndarray, parameters: dict) -> np.ndarray:
         """Apply multi-pole low-pass filter to input signal.
         
@@ -24,28 +32,7 @@ class CascadedOnePoleLowPass(FilterBase):
         Returns:
             Filtered audio data
         """
-        # Get parameters with defaults
-        cutoff = parameters.get('cutoff', 0.5)
-        resonance = parameters.get('resonance', 0.0)
-        poles = int(parameters.get('poles', 1))
-        
-        # Validate pole count
-        if poles < 1 or poles > 4:
-            raise ValueError("Pole count must be between 1 and 4")
-            
-        # Map cutoff with exponential curve for better control
-        alpha = 0.001 + np.power(cutoff, 3.0) * 0.999  # More aggressive curve
-        
-        # Calculate coefficients with steeper rolloff per pole
-        pole_alphas = []
-        for p in range(poles):
-            # Much steeper reduction per pole for better attenuation
-            pole_alpha = alpha / (5.0 ** p)  # Increased from 3.0 to 5.0
-            pole_alphas.append(pole_alpha)
-        
-        # Resonance increases with pole count for stronger effect
-        max_resonance = 0.95 + (poles * 0.01)  # More resonance for more poles
-        feedback = resonance * max_resonance
+        poles, pole_alphas, feedback = self._design(parameters)
         
         # Initialize output array
         output = np.zeros_like(audio)
@@ -78,7 +65,7 @@ class CascadedOnePoleLowPass(FilterBase):
         output = output - np.mean(output)
         
         # 2. Apply windowed DC removal
-        window_size = min(64, len(output))
+        window_size = min(DC_WINDOW, len(output))
         if window_size > 1:
             window = np.ones(window_size) / window_size
             dc_trend = np.convolve(output, window, mode='same')
@@ -87,13 +74,8 @@ class CascadedOnePoleLowPass(FilterBase):
         # 3. Ensure first sample starts at zero
         output = output - output[0]
         
-        # Apply gain compensation
-        base_gain = 1.0 + (0.05 * poles)  # Further reduced base gain
-        resonance_boost = 1.0
-        if feedback > 0:
-            resonance_boost = 1.0 + (feedback * 0.2)  # Further reduced resonance boost
-        
         # Apply gain after DC removal
+        base_gain, resonance_boost = self._gain(poles, feedback)
         output = output * base_gain * resonance_boost
         
         # Final DC check and removal
@@ -103,3 +85,63 @@ class CascadedOnePoleLowPass(FilterBase):
         # Apply volume and clip
         output = self._apply_volume(output, parameters)
         return self._clip_output(output)
+    
+    def _design(self, parameters: dict) -> tuple:
+        """Map parameters to (pole count, per-pole alphas, final-pole feedback).
+        
+        Raises:
+            ValueError: If the pole count is outside 1-4
+        """
+        # Get parameters with defaults
+        cutoff = parameters.get('cutoff', 0.5)
+        resonance = parameters.get('resonance', 0.0)
+        poles = int(parameters.get('poles', 1))
+        
+        # Validate pole count
+        if poles < 1 or poles > 4:
+            raise ValueError("Pole count must be between 1 and 4")
+            
+        # Map cutoff with exponential curve for better control
+        alpha = 0.001 + np.power(cutoff, 3.0) * 0.999  # More aggressive curve
+        
+        # Calculate coefficients with steeper rolloff per pole
+        pole_alphas = []
+        for p in range(poles):
+            # Much steeper reduction per pole for better attenuation
+            pole_alpha = alpha / (5.0 ** p)  # Increased from 3.0 to 5.0
+            pole_alphas.append(self._scale_coefficient(pole_alpha))
+        
+        # Resonance increases with pole count for stronger effect
+        max_resonance = 0.95 + (poles * 0.01)  # More resonance for more poles
+        feedback = resonance * max_resonance
+        return poles, pole_alphas, feedback
+    
+    def _gain(self, poles: int, feedback: float) -> tuple:
+        """Get (base gain, resonance boost) applied after DC removal."""
+        base_gain = 1.0 + (0.05 * poles)  # Further reduced base gain
+        resonance_boost = 1.0
+        if feedback > 0:
+            resonance_boost = 1.0 + (feedback * 0.2)  # Further reduced resonance boost
+        return base_gain, resonance_boost
+    
+    def coefficients(self, parameters: dict) -> FilterCoefficients:
+        """Get the pole sections, DC-trend removal and gain.
+        
+        The final pole's feedback on its own previous output moves its pole to
+        1 - a + a * feedback. The moving-average DC trend removal is the FIR
+        stage (delayed to be causal; the magnitude is unchanged). Per-block
+        mean removal only affects DC and is not modelled.
+        """
+        poles, pole_alphas, feedback = self._design(parameters)
+        sections = [onepole_lowpass_section(a) for a in pole_alphas]
+        if feedback > 0:
+            a = pole_alphas[-1]
+            sections[-1] = (a, 0.0, -(1.0 - a + a * feedback))
+        
+        # output - moving average; np.convolve(mode='same') centres the window
+        # on offset (DC_WINDOW - 1) // 2
+        fir = np.full(DC_WINDOW, -1.0 / DC_WINDOW)
+        fir[(DC_WINDOW - 1) // 2] += 1.0
+        
+        base_gain, resonance_boost = self._gain(poles, feedback)
+        return FilterCoefficients(np.array(sections), gain=base_gain * resonance_boost, fir=fir)
@@ -1,4 +1,4 @@
-from ..base import FilterBase
+from ..base import FilterBase, FilterCoefficients, onepole_lowpass_section
 import numpy as np
 
 class CascadedOnePoleLowPassV2(FilterBase):
@@ -9,6 +9,11 @@ class CascadedOnePoleLowPassV2(FilterBase):
         # Initialize state array for maximum possible poles (4) using float32
         self.prev_y = np.zeros(4, dtype=np.float32)
     
+    def reset(self):
+        """Clear the per-pole states."""
+        super().reset()
+        self.prev_y = np.zeros(4, dtype=np.float32)
+    
     def process_audio(self, audio: np.ndarray, parameters: dict) -> np.ndarray:
         """Apply multi-pole low-pass filter to input signal.
         
@@ -23,35 +28,13 @@ class CascadedOnePoleLowPassV2(FilterBase):
         Returns:
             Filtered audio data
         """
-        # Get parameters with defaults
-        cutoff = parameters.get('cutoff', 0.5)
-        resonance = parameters.get('resonance', 0.0)
-        poles = int(parameters.get('poles', 1))
-        
-        # Validate pole count
-        if poles < 1 or poles > 4:
-            raise ValueError("Pole count must be between 1 and 4")
-            
-        # Map cutoff frequency with better control
-        alpha = 0.005 + np.power(cutoff, 2.0) * 0.495  # More stable range
-        
-        # Calculate resonance feedback for self-oscillation
-        feedback = resonance  # Allow full resonance for self-oscillation
+        poles, pole_alphas, feedback = self._design(parameters)
+        one_minus_alphas = 1.0 - pole_alphas
         
         # Initialize arrays
         output = np.zeros_like(audio, dtype=np.float32)
         current = audio.astype(np.float32)
         
-        # Calculate filter coefficients
-        base_alpha = np.clip(alpha, 0.005, 0.5)  # Limit range for stability
-        pole_alphas = []
-        for p in range(poles):
-            # Less aggressive reduction per pole
-            pole_alpha = base_alpha / (1.3 ** p)
-            pole_alphas.append(pole_alpha)
-        pole_alphas = np.array(pole_alphas, dtype=np.float32)
-        one_minus_alphas = 1.0 - pole_alphas
-        
         # Resonance increases with pole count but stays controlled
         feedback_scale = 1.0
         if poles > 1:
@@ -83,19 +66,8 @@ class CascadedOnePoleLowPassV2(FilterBase):
             
             current = output
         
-        # Gain compensation
-        base_gain = 1.5  # Start with moderate gain
-        if poles > 1:
-            # Gentler gain boost per pole
-            base_gain *= (1.0 + 0.2 * (poles - 1))  # 20% boost per additional pole
-        
-        # Compensate for resonance attenuation
-        if feedback > 0:
-            # Increase gain with resonance
-            resonance_boost = 1.0 + (feedback * 0.5)  # Up to 50% boost at max resonance
-            base_gain *= resonance_boost
-        
         # Apply gain with soft clipping for smoother limiting
+        base_gain = self._gain(poles, feedback)
         output = np.tanh(output * base_gain)
         
         # DC offset removal
@@ -109,3 +81,59 @@ class CascadedOnePoleLowPassV2(FilterBase):
         
         # Ensure float32 output and clip
         return self._clip_output(output.astype(np.float32))
+    
+    def _design(self, parameters: dict) -> tuple:
+        """Map parameters to (pole count, float32 per-pole alphas, feedback).
+        
+        Raises:
+            ValueError: If the pole count is outside 1-4
+        """
+        # Get parameters with defaults
+        cutoff = parameters.get('cutoff', 0.5)
+        resonance = parameters.get('resonance', 0.0)
+        poles = int(parameters.get('poles', 1))
+        
+        # Validate pole count
+        if poles < 1 or poles > 4:
+            raise ValueError("Pole count must be between 1 and 4")
+            
+        # Map cutoff frequency with better control
+        alpha = 0.005 + np.power(cutoff, 2.0) * 0.495  # More stable range
+        
+        # Calculate resonance feedback for self-oscillation
+        feedback = resonance  # Allow full resonance for self-oscillation
+        
+        # Calculate filter coefficients
+        base_alpha = np.clip(alpha, 0.005, 0.5)  # Limit range for stability
+        pole_alphas = []
+        for p in range(poles):
+            # Less aggressive reduction per pole
+            pole_alpha = base_alpha / (1.3 ** p)
+            pole_alphas.append(self._scale_coefficient(pole_alpha))
+        return poles, np.array(pole_alphas, dtype=np.float32), feedback
+    
+    def _gain(self, poles: int, feedback: float) -> float:
+        """Get the output gain applied before the final soft clip."""
+        base_gain = 1.5  # Start with moderate gain
+        if poles > 1:
+            # Gentler gain boost per pole
+            base_gain *= (1.0 + 0.2 * (poles - 1))  # 20% boost per additional pole
+        
+        # Compensate for resonance attenuation
+        if feedback > 0:
+            # Increase gain with resonance
+            resonance_boost = 1.0 + (feedback * 0.5)  # Up to 50% boost at max resonance
+            base_gain *= resonance_boost
+        return base_gain
+    
+    def coefficients(self, parameters: dict) -> FilterCoefficients:
+        """Get the small-signal pole sections and gain.
+        
+        The tanh soft clips are linear for small signals. The resonance
+        feedback is taken from the final pole's state once per block, so it
+        adds a per-block offset rather than a resonant peak; only its gain
+        boost shows in the response.
+        """
+        poles, pole_alphas, feedback = self._design(parameters)
+        sections = np.array([onepole_lowpass_section(float(a)) for a in pole_alphas])
+        return FilterCoefficients(sections, gain=self._gain(poles, feedback))
@@ -15,3 +15,7 @@ class NoiseGenerator(ABC):
             numpy.ndarray: Generated noise samples in range [-1, 1]
         """
         pass
+    
+    def reset(self):
+        """Restart the noise sequence, as if freshly constructed."""
+        pass
@@ -26,6 +26,14 @@ class FractalNoiseGenerator(NoiseGenerator):
         self.lacunarity = lacunarity
         self.scale = scale
         self.seed = seed if seed is not None else 12345
+        self.initial_seed = self.seed
+        # process_audio() may change these; reset() restores them
+        self.initial_settings = (octave_count, persistence, lacunarity, scale)
+    
+    def reset(self):
+        """Restore the constructor settings and restart from the initial seed."""
+        self.octave_count, self.persistence, self.lacunarity, self.scale = self.initial_settings
+        self.seed = self.initial_seed
         
     def _xor_shift(self, seed: int) -> int:
         """Generate a single XOR-shift pseudorandom number."""
@@ -42,9 +50,29 @@ class FractalNoiseGenerator(NoiseGenerator):
             noise[i] = (self.seed / 0x7FFFFFFF) - 1.0
         return noise
         
-    def process_audio(self, audio_data):
-        """Process audio data (pass-through for noise generators)."""
-        return audio_data
+    def process_audio(self, frames_or_audio: int | np.ndarray, parameters: dict) -> np.ndarray:
+        """Generate or process audio.
+        
+        Args:
+            frames_or_audio: Number of frames to generate (int) or audio data to process (np.ndarray)
+            parameters: Dictionary containing optional parameters:
+                - octave_count, persistence, lacunarity, scale: Fractal settings
+                - seed: Random seed value (int)
+                
+        Returns:
+            Generated or processed audio data
+        """
+        if isinstance(frames_or_audio, int):
+            if parameters is not None:
+                self.octave_count = int(parameters.get('octave_count', self.octave_count))
+                self.persistence = parameters.get('persistence', self.persistence)
+                self.lacunarity = parameters.get('lacunarity', self.lacunarity)
+                self.scale = parameters.get('scale', self.scale)
+                self.seed = parameters.get('seed', self.seed)
+            return self.generate(frames_or_audio)
+        else:
+            # Pass through audio unchanged (generators only modify new audio)
+            return frames_or_audio
         
     def generate(self, frames: int) -> np.ndarray:
         """Generate fractal noise samples.
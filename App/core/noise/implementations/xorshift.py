@@ -11,6 +11,11 @@ class XorShiftGenerator(NoiseGenerator):
             seed: Initial seed value (default: 12345)
         """
         self.seed = seed
+        self.initial_seed = seed
+    
+    def reset(self):
+        """Restart from the initial seed."""
+        self.seed = self.initial_seed
     
     def _xor_shift(self, seed: int) -> int:
         """Generate a single XOR-shift pseudorandom number."""
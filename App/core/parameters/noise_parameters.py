@@ -1,14 +1,23 @@
-from .observer import Subject
+from .observer import ChangeObserver, ChangeSet, Observer, Subject
 from .parameter_builder import ParameterDefinitionBuilder as Param
 from .common_parameters import get_params
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Optional
 from ..processors.processor_factory import AudioProcessorFactory
 
 class NoiseParameters(Subject):
-    """Manages noise generation parameters and notifies observers of changes."""
+    """Manages noise generation parameters and notifies observers of changes.
+    
+    Updates that change nothing are dropped. Otherwise the version number
+    increases and each observer is notified: change observers get a
+    ChangeSet restricted to their subscribed keys (and are skipped if none
+    of those changed), plain observers get the full parameters dict.
+    """
     
     def __init__(self):
         super().__init__()
+        self.version = 0
+        self._subscriptions: Dict[int, Optional[frozenset]] = {}
         # Get initial parameters from the default noise generator
         noise_generators = AudioProcessorFactory.get_processors_by_category("noise")
         if noise_generators:
@@ -20,15 +29,19 @@ class NoiseParameters(Subject):
         else:
             self.parameters = {}
     
-    def update_parameters(self, **kwargs):
+    def validate(self, updates: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Update parameters and notify observers.
+        Validate parameter updates without applying them.
         
         Args:
-            **kwargs: Parameter key-value pairs to update
+            updates: Parameter key-value pairs
+            
+        Returns:
+            The validated values, as update_parameters() would store them
             
         Raises:
             KeyError: If an unknown parameter is provided
+            TypeError: If a parameter value has the wrong type
             ValueError: If a parameter value is invalid
         """
         # Get current processor info
@@ -38,32 +51,54 @@ class NoiseParameters(Subject):
         if not processor_info:
             raise ValueError(f"Unknown processor: {processor_name}")
             
-        # Validate parameters against processor's parameter definitions
-        for name, value in kwargs.items():
-            if name not in processor_info.parameters:
-                raise KeyError(f"Unknown parameter: {name}")
-                
-            param_def = processor_info.parameters[name]
+        # Validate parameters against processor's compiled schema
+        return processor_info.schema.validate(updates)
+    
+    def update_parameters(self, **kwargs):
+        """
+        Update parameters and notify observers.
+        
+        Args:
+            **kwargs: Parameter key-value pairs to update
             
-            # Type validation
-            if param_def["type"] == "float" and not isinstance(value, (int, float)):
-                raise TypeError(f"Parameter '{name}' must be a number")
-            elif param_def["type"] == "int" and not isinstance(value, int):
-                raise TypeError(f"Parameter '{name}' must be an integer")
-            elif param_def["type"] == "enum" and value not in param_def["enum_values"]:
-                raise ValueError(f"Invalid value for enum parameter '{name}': {value}")
-                
-            # Range validation
-            if param_def["range"]:
-                if value < param_def["range"].min_value or value > param_def["range"].max_value:
-                    raise ValueError(
-                        f"Parameter '{name}' value {value} is outside valid range "
-                        f"[{param_def['range'].min_value}, {param_def['range'].max_value}]"
-                    )
+        Raises:
+            KeyError: If an unknown parameter is provided
+            TypeError: If a parameter value has the wrong type
+            ValueError: If a parameter value is invalid
+        """
+        kwargs = self.validate(kwargs)
+        
+        # Drop values that are already current (the GUI resubmits all sliders)
+        changes = {
+            name: value for name, value in kwargs.items()
+            if name not in self.parameters or self.parameters[name] != value
+        }
+        if not changes:
+            return
         
         # Update parameters and notify observers
-        self.parameters.update(kwargs)
-        self.notify()
+        self.parameters.update(changes)
+        self.version += 1
+        self.notify(changes)
+    
+    def attach(self, observer: Observer, keys: Optional[Iterable[str]] = None):
+        """
+        Attach an observer, optionally subscribed to specific parameters.
+        
+        Args:
+            observer: Observer to notify
+            keys: Parameter names the observer cares about; defaults to the
+                observer's `subscribed_keys`, or all parameters
+        """
+        super().attach(observer)
+        if keys is None:
+            keys = getattr(observer, "subscribed_keys", None)
+        self._subscriptions[id(observer)] = frozenset(keys) if keys is not None else None
+    
+    def detach(self, observer: Observer):
+        """Detach an observer and its subscription."""
+        super().detach(observer)
+        self._subscriptions.pop(id(observer), None)
     
     def get_parameter(self, name: str, default: Optional[Any] = None) -> Any:
         """
@@ -117,7 +152,24 @@ class NoiseParameters(Subject):
             "current_value": self.parameters[name]
         }
     
-    def notify(self, _ = None):
-        """Notify observers with current parameter values."""
-        for observer in self.observers:
-            observer.update(self.parameters)
+    def notify(self, changes: Optional[Dict[str, Any]] = None):
+        """
+        Notify observers of changed parameters.
+        
+        Args:
+            changes: Changed parameters; all current values if None
+        """
+        if changes is None:
+            changes = dict(self.parameters)
+        view = MappingProxyType(self.parameters)
+        for observer in list(self.observers):
+            keys = self._subscriptions.get(id(observer))
+            relevant = changes if keys is None else {
+                name: value for name, value in changes.items() if name in keys
+            }
+            if not relevant:
+                continue
+            if isinstance(observer, ChangeObserver):
+                observer.on_changes(ChangeSet(relevant, self.version, view))
+            else:
+                observer.update(self.parameters)
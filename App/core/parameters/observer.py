@@ -1,10 +1,36 @@
-from typing import List, Any
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional
 
 class Observer:
     def update(self, *args, **kwargs):
         """Receive updates from subject."""
         pass
 
+@dataclass(frozen=True)
+class ChangeSet:
+    """Parameters that changed in one update.
+    
+    Attributes:
+        changes: Changed parameter names and their new values
+        version: Subject's version after the update, increasing by one per change set
+        parameters: Read-only view of all current values
+    """
+    changes: Dict[str, Any]
+    version: int
+    parameters: Mapping[str, Any]
+
+class ChangeObserver(Observer):
+    """Observer that receives change sets instead of the full parameters.
+    
+    `subscribed_keys` limits notifications to change sets touching those
+    parameters (None means all), and the change set is filtered to them.
+    """
+    subscribed_keys: Optional[FrozenSet[str]] = None
+    
+    def on_changes(self, change_set: ChangeSet):
+        """Receive the changed parameters."""
+        pass
+
 class Subject:
     def __init__(self):
         self.observers: List[Observer] = []
@@ -6,6 +6,10 @@ class ParameterRange:
     min_value: float
     max_value: float
 
+    def validate_value(self, value: float) -> bool:
+        """Check if a value is within the range."""
+        return self.min_value <= value <= self.max_value
+
 @dataclass
 class ParameterDefinition:
     type: str
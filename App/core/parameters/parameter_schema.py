@@ -0,0 +1,114 @@
+"""
+Parameter Schema Module - Validators compiled once from parameter definitions.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# What to do with numeric values outside their range
+REJECT = "reject"
+CLAMP = "clamp"
+
+# Accepted Python types per definition type (bool is an int, as before)
+_ACCEPTED_TYPES = {
+    "float": ((int, float), "a number"),
+    "int": ((int,), "an integer"),
+    "string": ((str,), "a string"),
+    "boolean": ((bool,), "a boolean"),
+}
+
+# Compiled check per parameter: (types, type description, min, max, enum values, clamp)
+_Check = Tuple[Optional[tuple], Optional[str], Optional[float], Optional[float], Optional[tuple], bool]
+
+class ParameterSchema:
+    """Flat validator for a set of parameter definitions.
+
+    The builder dicts are read once, at construction, into one tuple per
+    parameter holding the accepted types, the bounds and the enum values,
+    so validating a batch is a single loop with no nested dict lookups.
+    Batches are all-or-nothing: the first invalid value raises and nothing
+    is returned.
+    """
+
+    def __init__(self, definitions: Dict[str, Dict[str, Any]], policy: str = REJECT,
+                 policies: Optional[Dict[str, str]] = None):
+        """
+        Compile the schema.
+
+        Args:
+            definitions: Parameter name -> definition built by ParameterDefinitionBuilder
+            policy: REJECT or CLAMP for out-of-range numeric values
+            policies: Per-parameter overrides of `policy`
+        """
+        policies = policies or {}
+        for value in (policy, *policies.values()):
+            if value not in (REJECT, CLAMP):
+                raise ValueError(f"Range policy must be '{REJECT}' or '{CLAMP}', got '{value}'")
+
+        self.definitions = definitions
+        self._checks: Dict[str, _Check] = {}
+        for name, definition in definitions.items():
+            types, description = _ACCEPTED_TYPES.get(definition["type"], (None, None))
+            enum_values = definition.get("enum_values")
+            bounds = definition.get("range")
+            self._checks[name] = (
+                types,
+                description,
+                bounds.min_value if bounds is not None else None,
+                bounds.max_value if bounds is not None else None,
+                tuple(enum_values) if definition["type"] == "enum" else None,
+                policies.get(name, policy) == CLAMP,
+            )
+
+    @property
+    def names(self) -> frozenset:
+        """Names of the parameters in the schema."""
+        return frozenset(self._checks)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._checks
+
+    def defaults(self) -> Dict[str, Any]:
+        """Default value of every parameter."""
+        return {name: definition["default_value"] for name, definition in self.definitions.items()}
+
+    def validate(self, updates: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate a batch of parameter values in one pass.
+
+        Args:
+            updates: Parameter key-value pairs
+
+        Returns:
+            The validated values (clamped where the policy says so)
+
+        Raises:
+            KeyError: If an unknown parameter is provided
+            TypeError: If a value has the wrong type
+            ValueError: If a value is out of range or not an allowed enum value
+        """
+        checks = self._checks
+        validated = {}
+        for name, value in updates.items():
+            check = checks.get(name)
+            if check is None:
+                raise KeyError(f"Unknown parameter: {name}")
+            types, description, min_value, max_value, enum_values, clamp = check
+
+            if types is not None and not isinstance(value, types):
+                raise TypeError(f"Parameter '{name}' must be {description}")
+            if enum_values is not None and value not in enum_values:
+                raise ValueError(f"Invalid value for enum parameter '{name}': {value}")
+            if min_value is not None and (value < min_value or value > max_value):
+                if not clamp:
+                    raise ValueError(
+                        f"Parameter '{name}' value {value} is outside valid range "
+                        f"[{min_value}, {max_value}]"
+                    )
+                value = min(max(value, min_value), max_value)
+
+            validated[name] = value
+        return validated
+
+    def unknown(self, names: Iterable[str]) -> list:
+        """Names not in the schema, in the given order."""
+        return [name for name in names if name not in self._checks]
@@ -1,22 +1,13 @@
-from dataclasses import dataclass
-from typing import Any, Dict, Optional, Type, Union, List
-from enum import Enum
-
-@dataclass
-class ParameterRange:
-    """Defines a valid range for numeric parameters."""
-    min_value: Union[float, int]
-    max_value: Union[float, int]
-
-    def validate_value(self, value: Union[float, int]) -> bool:
-        """Check if a value is within the range."""
-        return self.min_value <= value <= self.max_value
+from typing import Any, Dict, Optional
+from .parameter_builder import ParameterRange
+from .parameter_schema import ParameterSchema
 
 class ParameterRegistry:
     """Central registry for parameter definitions."""
     
     def __init__(self):
         self._definitions: Dict[str, Dict[str, Any]] = {}
+        self._schema: Optional[ParameterSchema] = None
     
     def register(self, name: str, definition: Dict[str, Any]):
         """
@@ -32,6 +23,7 @@ class ParameterRegistry:
         if name in self._definitions:
             raise ValueError(f"Parameter {name} already registered")
         self._definitions[name] = definition
+        self._schema = None  # Recompiled on next validation
     
     def get_definition(self, name: str) -> Dict[str, Any]:
         """
@@ -62,34 +54,17 @@ class ParameterRegistry:
             
         Raises:
             KeyError: If an unknown parameter is provided
+            TypeError: If a parameter value has the wrong type
             ValueError: If a parameter value is invalid
         """
-        validated = {}
-        for name, value in parameters.items():
-            if name not in self._definitions:
-                raise KeyError(f"Unknown parameter: {name}")
-                
-            definition = self._definitions[name]
-            
-            # Type validation
-            if definition["type"] == "float" and not isinstance(value, (int, float)):
-                raise TypeError(f"Parameter '{name}' must be a number")
-            elif definition["type"] == "int" and not isinstance(value, int):
-                raise TypeError(f"Parameter '{name}' must be an integer")
-            elif definition["type"] == "enum" and value not in definition["enum_values"]:
-                raise ValueError(f"Invalid value for enum parameter '{name}': {value}")
-                
-            # Range validation
-            if definition["range"]:
-                if not definition["range"].validate_value(value):
-                    raise ValueError(
-                        f"Parameter '{name}' value {value} is outside valid range "
-                        f"[{definition['range'].min_value}, {definition['range'].max_value}]"
-                    )
-            
-            validated[name] = value
-            
-        return validated
+        return self.schema.validate(parameters)
+    
+    @property
+    def schema(self) -> ParameterSchema:
+        """Compiled schema of all registered parameters."""
+        if self._schema is None:
+            self._schema = ParameterSchema(self._definitions)
+        return self._schema
     
     def get_defaults(self) -> Dict[str, Any]:
         """Get dictionary of default values for all registered parameters."""
@@ -0,0 +1,117 @@
+"""
+Update Coalescer Module - Merge bursts of parameter changes into one delivery per display frame.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+# One delivery per 60 Hz display frame
+DEFAULT_FLUSH_INTERVAL = 1 / 60
+
+class UpdateCoalescer:
+    """Collects parameter changes and delivers them in batches.
+
+    Every submit() merges its changes into a pending dict (later values win)
+    and flush() hands the merged dict to the target in one call, so a slider
+    drag producing hundreds of changes per second costs one validation and
+    one observer notification per flush. The owner decides the flush rate,
+    normally a GUI timer running every `interval` seconds.
+
+    An optional fast path receives each change as it is submitted, for
+    consumers such as the audio engine that should not wait for the next
+    frame. With a `validate` function, only changes it accepts reach the
+    fast path. If the target rejects a flush, `restore` is called so the
+    fast-path consumer can return to the target's state.
+    """
+
+    def __init__(self, target: Callable[..., None], interval: float = DEFAULT_FLUSH_INTERVAL,
+                 fast_path: Optional[Callable[..., None]] = None,
+                 validate: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+                 restore: Optional[Callable[[], None]] = None):
+        """
+        Initialize the coalescer.
+
+        Args:
+            target: Called with the merged changes as keyword arguments,
+                e.g. NoiseParameters.update_parameters
+            interval: Flush period in seconds, used by the owner's timer
+            fast_path: Called with each submitted change as keyword arguments
+            validate: Checks a submitted change before the fast path sees it
+                and returns the values to pass on, e.g. NoiseParameters.validate;
+                raises KeyError, TypeError or ValueError to keep it from the fast path
+            restore: Called when the target rejects a flush, before the
+                exception propagates
+        """
+        if interval <= 0:
+            raise ValueError(f"Flush interval must be positive, got {interval}")
+        self.target = target
+        self.interval = interval
+        self.fast_path = fast_path
+        self.validate = validate
+        self.restore = restore
+        self._pending: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self.raw_updates = 0
+        self.delivered_updates = 0
+
+    @property
+    def interval_ms(self) -> int:
+        """Flush period in whole milliseconds, for QTimer."""
+        return max(1, round(self.interval * 1000))
+
+    @property
+    def has_pending(self) -> bool:
+        """Whether changes are waiting for the next flush."""
+        return bool(self._pending)
+
+    def submit(self, **changes):
+        """Queue parameter changes for the next flush.
+
+        Args:
+            **changes: Parameter key-value pairs
+        """
+        with self._lock:
+            self._pending.update(changes)
+            self.raw_updates += 1
+        if self.fast_path is None:
+            return
+        if self.validate is not None:
+            try:
+                changes = self.validate(changes)
+            except (KeyError, TypeError, ValueError):
+                return  # The flush reports it
+        self.fast_path(**changes)
+
+    def flush(self) -> bool:
+        """Deliver pending changes to the target.
+
+        Pending changes are cleared before delivery, so a rejected batch
+        is not retried; `restore` is called and the target's exception
+        propagates to the caller.
+
+        Returns:
+            True if anything was delivered
+        """
+        with self._lock:
+            if not self._pending:
+                return False
+            changes, self._pending = self._pending, {}
+        try:
+            self.target(**changes)
+        except Exception:
+            if self.restore is not None:
+                self.restore()
+            raise
+        self.delivered_updates += 1
+        return True
+
+    def reset_counters(self):
+        """Zero the raw and delivered update counts."""
+        self.raw_updates = 0
+        self.delivered_updates = 0
+
+    def describe(self) -> str:
+        """One-line summary of the update counts."""
+        ratio = self.raw_updates / self.delivered_updates if self.delivered_updates else 0.0
+        return (f"parameter updates: {self.raw_updates} raw, {self.delivered_updates} delivered "
+                f"({ratio:.1f}x coalesced)")
@@ -1,23 +1,111 @@
-from typing import Any, Dict, List, Type, Optional
-from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Type, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from threading import Lock, Thread
+import importlib
+import logging
+import time
+from ..parameters.parameter_schema import ParameterSchema
+
+@dataclass(frozen=True)
+class ProcessorCapabilities:
+    """What a processor supports, used by the engine to plan its processing chain.
+    
+    Attributes:
+        dtypes: Sample dtypes the processor accepts (filters) or produces
+            (generators); the first is its native format
+        multichannel: Handles (frames, channels) arrays
+        preferred_block_size: Block size the processor runs fastest at
+        min_block_size: Smallest block it processes correctly
+        max_block_size: Largest block it accepts in one call
+        latency: Algorithmic delay in samples
+    """
+    dtypes: Tuple[str, ...] = ("float64", "float32")
+    multichannel: bool = False
+    preferred_block_size: Optional[int] = None
+    min_block_size: int = 1
+    max_block_size: Optional[int] = None
+    latency: int = 0
+    
+    def __post_init__(self):
+        if not self.dtypes:
+            raise ValueError("At least one dtype must be supported")
+        if self.min_block_size < 1:
+            raise ValueError(f"Minimum block size must be at least 1, got {self.min_block_size}")
+        if self.max_block_size is not None and self.max_block_size < self.min_block_size:
+            raise ValueError(
+                f"Maximum block size {self.max_block_size} is below the minimum {self.min_block_size}"
+            )
+        if self.latency < 0:
+            raise ValueError(f"Latency must not be negative, got {self.latency}")
 
 @dataclass
 class ProcessorRegistration:
-    """Data class holding processor registration information."""
+    """Data class holding processor registration information.
+    
+    `processor_class` is either the class itself or a "module:Class"
+    import path, which is imported on first use so that names, categories
+    and parameters are available without loading implementation modules.
+    """
     name: str
-    processor_class: Type
+    processor_class: Union[Type, str]
     description: str
     category: str
     parameters: Dict[str, Dict[str, Any]]
+    capabilities: ProcessorCapabilities = field(default_factory=ProcessorCapabilities)
+    schema: ParameterSchema = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        # Compiled once here; every later validation uses the schema
+        self.schema = ParameterSchema(self.parameters)
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the implementation class has been imported."""
+        return not isinstance(self.processor_class, str)
+    
+    def load_class(self) -> Type:
+        """
+        Get the implementation class, importing it on first call.
+        
+        Raises:
+            ImportError: If the module cannot be imported
+            AttributeError: If the module has no such class
+        """
+        if isinstance(self.processor_class, str):
+            module_name, _, class_name = self.processor_class.partition(":")
+            self.processor_class = getattr(importlib.import_module(module_name), class_name)
+        return self.processor_class
 
 class AudioProcessorFactory:
-    """Factory for creating audio processor instances."""
+    """Factory for creating audio processor instances.
+    
+    Besides create(), the factory keeps a small pool of ready instances per
+    processor type. prewarm() fills it with instances that have already
+    processed a dummy block (so imports, first-call allocations and any
+    compilation are paid up front), checkout() hands one out with its state
+    reset, and release() returns one for reuse.
+    """
     _registry: Dict[str, ProcessorRegistration] = {}
+    _pools: Dict[str, List[Any]] = {}
+    _pool_lock = Lock()
+    
+    # Instances kept per processor type
+    POOL_SIZE = 2
+    
+    # Frames processed by each instance during warmup
+    WARMUP_FRAMES = 256
 
     @classmethod
-    def register(cls, name: str, processor_class: Type, description: str, 
-                category: str, parameters: Dict[str, Dict[str, Any]]) -> None:
-        """Register a new processor type."""
+    def register(cls, name: str, processor_class: Union[Type, str], description: str, 
+                category: str, parameters: Dict[str, Dict[str, Any]],
+                capabilities: Optional[ProcessorCapabilities] = None) -> None:
+        """Register a new processor type.
+        
+        `processor_class` may be a "module:Class" path to defer the import
+        until the first create().
+        """
+        if isinstance(processor_class, str) and ":" not in processor_class:
+            raise ValueError(f"Processor class path must look like 'module:Class', got '{processor_class}'")
         if name in cls._registry:
             raise ValueError(f"Processor '{name}' is already registered")
             
@@ -26,7 +114,8 @@ class AudioProcessorFactory:
             processor_class=processor_class,
             description=description,
             category=category,
-            parameters=parameters
+            parameters=parameters,
+            capabilities=capabilities or ProcessorCapabilities()
         )
         cls._registry[name] = registration
 
@@ -38,35 +127,14 @@ class AudioProcessorFactory:
             
         registration = cls._registry[name]
         
-        # Validate parameters against registered definitions
-        for param_name, param_value in kwargs.items():
-            if param_name not in registration.parameters:
-                raise ValueError(f"Unknown parameter '{param_name}' for processor '{name}'")
-            
-            param_def = registration.parameters[param_name]
-            
-            # Type validation
-            if param_def["type"] == "float" and not isinstance(param_value, (int, float)):
-                raise TypeError(f"Parameter '{param_name}' must be a number")
-            elif param_def["type"] == "int" and not isinstance(param_value, int):
-                raise TypeError(f"Parameter '{param_name}' must be an integer")
-            elif param_def["type"] == "string" and not isinstance(param_value, str):
-                raise TypeError(f"Parameter '{param_name}' must be a string")
-            elif param_def["type"] == "boolean" and not isinstance(param_value, bool):
-                raise TypeError(f"Parameter '{param_name}' must be a boolean")
-            elif param_def["type"] == "enum" and param_value not in param_def["enum_values"]:
-                raise ValueError(f"Invalid value for enum parameter '{param_name}': {param_value}")
-            
-            # Range validation
-            if param_def["range"] is not None:
-                if param_value < param_def["range"].min_value or param_value > param_def["range"].max_value:
-                    raise ValueError(
-                        f"Parameter '{param_name}' value {param_value} is outside valid range "
-                        f"[{param_def['range'].min_value}, {param_def['range'].max_value}]"
-                    )
+        # Validate parameters against the compiled schema
+        unknown = registration.schema.unknown(kwargs)
+        if unknown:
+            raise ValueError(f"Unknown parameter '{unknown[0]}' for processor '{name}'")
+        kwargs = registration.schema.validate(kwargs)
 
         # Create instance with validated parameters
-        return registration.processor_class(**kwargs)
+        return registration.load_class()(**kwargs)
 
     @classmethod
     def get_registered_processors(cls) -> List[ProcessorRegistration]:
@@ -82,3 +150,101 @@ class AudioProcessorFactory:
     def get_processors_by_category(cls, category: str) -> List[ProcessorRegistration]:
         """Get all processors in a specific category."""
         return [reg for reg in cls._registry.values() if reg.category == category]
+
+    @classmethod
+    def checkout(cls, name: str) -> Any:
+        """Get an instance with default parameters, from the pool if one is ready.
+        
+        Pooled instances are reset, so they behave like freshly created ones.
+        
+        Raises:
+            ValueError: If the processor type is unknown
+        """
+        with cls._pool_lock:
+            pool = cls._pools.get(name)
+            instance = pool.pop() if pool else None
+        if instance is None:
+            return cls.create(name)
+        if hasattr(instance, "reset"):
+            instance.reset()
+        return instance
+
+    @classmethod
+    def release(cls, name: str, instance: Any) -> bool:
+        """Return an instance created with default parameters to the pool.
+        
+        Returns:
+            False if the pool was full and the instance was dropped
+        """
+        with cls._pool_lock:
+            pool = cls._pools.setdefault(name, [])
+            if len(pool) >= cls.POOL_SIZE:
+                return False
+            pool.append(instance)
+            return True
+
+    @classmethod
+    def pooled(cls, name: str) -> int:
+        """Number of ready instances of a processor type."""
+        with cls._pool_lock:
+            return len(cls._pools.get(name, []))
+
+    @classmethod
+    def clear_pools(cls):
+        """Drop all pooled instances."""
+        with cls._pool_lock:
+            cls._pools.clear()
+
+    @classmethod
+    def prewarm(cls, names: Optional[Iterable[str]] = None, count: int = 1,
+                frames: Optional[int] = None) -> Dict[str, float]:
+        """Create, warm up and pool instances of processor types.
+        
+        Each instance processes one dummy block before it is pooled. A type
+        that fails to warm up is logged and skipped.
+        
+        Args:
+            names: Processor types to warm; all registered types if None
+            count: Instances per type (the pool keeps at most POOL_SIZE)
+            frames: Dummy block length; defaults to WARMUP_FRAMES
+        
+        Returns:
+            Seconds spent warming each type that succeeded
+        """
+        logger = logging.getLogger(__name__)
+        frames = frames or cls.WARMUP_FRAMES
+        timings = {}
+        for name in list(names if names is not None else cls._registry):
+            start = time.perf_counter()
+            try:
+                for _ in range(count):
+                    instance = cls.create(name)
+                    cls.warm_up(instance, cls._registry[name].category, frames)
+                    cls.release(name, instance)
+            except Exception as e:
+                logger.warning(f"Could not prewarm processor '{name}': {e}")
+                continue
+            timings[name] = time.perf_counter() - start
+        return timings
+
+    @classmethod
+    def prewarm_in_background(cls, names: Optional[Iterable[str]] = None, **kwargs) -> Thread:
+        """Run prewarm() on a daemon thread and return the started thread."""
+        thread = Thread(target=cls.prewarm, args=(names,), kwargs=kwargs, name="PrewarmThread", daemon=True)
+        thread.start()
+        return thread
+
+    @staticmethod
+    def warm_up(instance: Any, category: str, frames: int):
+        """Run an instance once on a dummy block with default parameters.
+        
+        Generators render `frames` samples; other processors filter quiet
+        noise. The caller resets the instance before real use.
+        """
+        import numpy as np  # Kept out of module scope so registration stays import-light
+        
+        if category == "noise":
+            instance.process_audio(frames, {})
+        else:
+            dummy = np.random.default_rng(0).uniform(-0.01, 0.01, frames)
+            instance.process_audio(dummy, {})
@@ -1,55 +1,106 @@
-from ..noise.implementations.xorshift import XorShiftGenerator
-from ..noise.implementations.fractal import FractalNoiseGenerator
-from ..filters.implementations.bandpass import BandpassFilter
-from ..filters.implementations.cascaded_onepole_lowpass import CascadedOnePoleLowPass
-from ..filters.implementations.cascaded_onepole_lowpass_v2 import CascadedOnePoleLowPassV2
-from .processor_factory import AudioProcessorFactory
+import logging
+from .processor_factory import AudioProcessorFactory, ProcessorCapabilities
 from ..parameters.parameter_builder import ParameterDefinitionBuilder as Param
 from ..parameters.common_parameters import get_params
 
-def register_processors():
-    """Register all available audio processors."""
+# Entry point group for third-party processors; each entry point names a
+# function that takes the factory and registers processors with it
+PLUGIN_GROUP = "noise_playground.processors"
+
+# Implementations are imported on first create(), relative to this package's root
+_CORE = __package__.rpartition(".")[0]
+
+logger = logging.getLogger(__name__)
+
+# Built-in processors render mono float64, except the V2 filter which works in float32
+_FLOAT64_MONO = ProcessorCapabilities(dtypes=("float64",))
+
+def register_processors(plugins: bool = True):
+    """Register all available audio processors.
+    
+    Only metadata is registered here; implementation modules are imported
+    when a processor is first created.
+    
+    Args:
+        plugins: Also register processors from installed plugin packages
+    """
     # Register noise generators
     AudioProcessorFactory.register(
         name="xorshift",
-        processor_class=XorShiftGenerator,
+        processor_class=f"{_CORE}.noise.implementations.xorshift:XorShiftGenerator",
         description="XOR shift random number generator",
         category="noise",
-        parameters=get_params("volume")
+        parameters=get_params("volume"),
+        capabilities=_FLOAT64_MONO
     )
 
     AudioProcessorFactory.register(
         name="fractal",
-        processor_class=FractalNoiseGenerator,
+        processor_class=f"{_CORE}.noise.implementations.fractal:FractalNoiseGenerator",
         description="Fractal noise generator with octaves",
         category="noise",
         parameters={
             **get_params("volume", "octave_count", "persistence", "lacunarity", "scale"),
             "noise_type": Param().enum(["XOR Shift"]).default("XOR Shift").display("Base Noise Type").build()
-        }
+        },
+        capabilities=_FLOAT64_MONO
     )
 
     # Register filters
     AudioProcessorFactory.register(
         name="bandpass",
-        processor_class=BandpassFilter,
+        processor_class=f"{_CORE}.filters.implementations.bandpass:BandpassFilter",
         description="Bandpass filter",
         category="filter",
-        parameters=get_params("cutoff", "bandwidth")
+        parameters=get_params("cutoff", "bandwidth"),
+        capabilities=_FLOAT64_MONO
     )
 
     AudioProcessorFactory.register(
         name="cascaded",
-        processor_class=CascadedOnePoleLowPass,
+        processor_class=f"{_CORE}.filters.implementations.cascaded_onepole_lowpass:CascadedOnePoleLowPass",
         description="Cascaded one-pole lowpass filter",
         category="filter",
-        parameters=get_params("cutoff", "resonance", "poles")
+        parameters=get_params("cutoff", "resonance", "poles"),
+        capabilities=ProcessorCapabilities(
+            dtypes=("float64",),
+            min_block_size=64  # Needs a full DC_WINDOW for its per-block DC removal
+        )
     )
 
     AudioProcessorFactory.register(
         name="cascaded_v2",
-        processor_class=CascadedOnePoleLowPassV2,
+        processor_class=f"{_CORE}.filters.implementations.cascaded_onepole_lowpass_v2:CascadedOnePoleLowPassV2",
         description="Improved cascaded one-pole lowpass filter",
         category="filter",
-        parameters=get_params("cutoff", "resonance", "poles")
+        parameters=get_params("cutoff", "resonance", "poles"),
+        capabilities=ProcessorCapabilities(dtypes=("float32",))
     )
+    
+    if plugins:
+        discover_plugins()
+
+def discover_plugins(group: str = PLUGIN_GROUP) -> list:
+    """
+    Register processors from installed packages' entry points.
+    
+    A plugin that fails to load is logged and skipped.
+    
+    Args:
+        group: Entry point group to scan
+        
+    Returns:
+        Names of the entry points that registered successfully
+    """
+    # Imported here; scanning installed packages is only needed for plugins
+    from importlib.metadata import entry_points
+    
+    loaded = []
+    for entry_point in entry_points(group=group):
+        try:
+            entry_point.load()(AudioProcessorFactory)
+        except Exception as e:
+            logger.warning(f"Skipping processor plugin '{entry_point.name}': {e}")
+            continue
+        loaded.append(entry_point.name)
+    return loaded
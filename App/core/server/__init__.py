@@ -0,0 +1 @@
+"""Headless audio servers for feeding noise to other processes."""
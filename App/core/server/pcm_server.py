@@ -0,0 +1,291 @@
+"""
+PCM Server Module - Streams rendered noise to local clients over TCP or Unix sockets.
+
+One render thread drives the audio engine; every block is encoded once per
+sample format and fanned out to all connected clients through per-client
+bounded queues. A separate control socket accepts JSON lines with parameter
+updates.
+
+Protocol:
+    Data socket: a client may send one JSON line, e.g. {"format": "int16"},
+    within `hello_timeout` seconds of connecting; otherwise the server's
+    default format is used. The server then sends raw little-endian mono PCM.
+
+    Control socket: each line is a JSON object. {"command": "stats"} returns
+    server statistics; any other object is treated as parameter updates.
+    Every line gets a single JSON line reply with an "ok" field.
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+import numpy as np
+from ..audio.audio_engine import AudioEngineBase
+from ..audio.block_renderer import BlockRenderer
+from ..audio.realtime_gc import RealtimeGC
+from ..audio.thread_priority import ThreadPolicy
+from ..audio.stream_config import StreamConfig, DEFAULT_STREAM_CONFIG
+from ..parameters.parameter_definitions import get_registry
+
+SAMPLE_FORMATS = ("float32", "int16")
+SLOW_CLIENT_POLICIES = ("drop_oldest", "drop_newest", "disconnect")
+
+def encode_block(audio: np.ndarray, sample_format: str) -> bytes:
+    """Encode a block of [-1, 1] samples as little-endian PCM bytes.
+
+    Args:
+        audio: Audio samples
+        sample_format: "float32" or "int16"
+
+    Returns:
+        Encoded PCM bytes
+    """
+    if sample_format == "float32":
+        return audio.astype('<f4').tobytes()
+    if sample_format == "int16":
+        return (np.clip(audio, -1.0, 1.0) * 32767.0).astype('<i2').tobytes()
+    raise ValueError(f"Unknown sample format: {sample_format}")
+
+@dataclass
+class ClientConnection:
+    """State for one connected data client."""
+    client_id: int
+    writer: asyncio.StreamWriter
+    queue: asyncio.Queue
+    sample_format: str
+    blocks_sent: int = 0
+    blocks_dropped: int = 0
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get a JSON-serialisable summary of this client."""
+        return {
+            "id": self.client_id,
+            "format": self.sample_format,
+            "queued": self.queue.qsize(),
+            "sent": self.blocks_sent,
+            "dropped": self.blocks_dropped,
+        }
+
+class PCMServer:
+    """Fans out identical PCM blocks from one audio engine to many clients."""
+
+    def __init__(self, engine: AudioEngineBase, config: Optional[StreamConfig] = None,
+                 default_format: str = "float32", queue_size: int = 8,
+                 slow_client_policy: str = "drop_oldest", hello_timeout: float = 0.2,
+                 gc_control: Optional[RealtimeGC] = None, thread_policy: Optional[ThreadPolicy] = None):
+        """
+        Initialize the server.
+
+        Args:
+            engine: Audio engine rendering the stream
+            config: Stream settings; block size and sample rate pace rendering.
+                Uses DEFAULT_STREAM_CONFIG if None
+            default_format: Sample format for clients that do not send a hello line
+            queue_size: Maximum blocks buffered per client
+            slow_client_policy: What to do when a client's queue is full:
+                "drop_oldest" discards the oldest queued block, "drop_newest"
+                discards the new block and "disconnect" closes the client
+            hello_timeout: Seconds to wait for a client's optional hello line
+            gc_control: Passed to the block renderer to keep collections between blocks
+            thread_policy: CPU affinity and scheduling for the render thread
+
+        Raises:
+            ValueError: If the format or policy is unknown
+        """
+        if default_format not in SAMPLE_FORMATS:
+            raise ValueError(f"Unknown sample format: {default_format}")
+        if slow_client_policy not in SLOW_CLIENT_POLICIES:
+            raise ValueError(f"Unknown slow client policy: {slow_client_policy}")
+
+        self.engine = engine
+        self.config = config or DEFAULT_STREAM_CONFIG
+        self.default_format = default_format
+        self.queue_size = queue_size
+        self.slow_client_policy = slow_client_policy
+        self.hello_timeout = hello_timeout
+
+        self.parameters: Dict[str, Any] = {}
+        self.clients: Dict[int, ClientConnection] = {}
+        self.disconnected_slow_clients = 0
+        self.servers: List[asyncio.AbstractServer] = []
+        self.renderer = BlockRenderer(
+            self.engine.generate_noise,
+            self._on_block,
+            block_size=self.config.block_size,
+            sample_rate=self.config.sample_rate,
+            gc_control=gc_control,
+            thread_policy=thread_policy
+        )
+        self.loop = None
+        self._next_client_id = 0
+        self.logger = logging.getLogger(__name__)
+
+    async def start(self, host: Optional[str] = "127.0.0.1", port: Optional[int] = 0,
+                    unix_path: Optional[str] = None, control_host: Optional[str] = "127.0.0.1",
+                    control_port: Optional[int] = 0, control_unix_path: Optional[str] = None):
+        """Open the data and control listeners and start rendering.
+
+        Pass `port=None` or `control_port=None` to disable the TCP listener
+        for that socket. Port 0 picks a free port; see `addresses`.
+        """
+        self.loop = asyncio.get_running_loop()
+
+        if port is not None:
+            self.servers.append(await asyncio.start_server(self._handle_client, host, port))
+        if unix_path is not None:
+            self.servers.append(await asyncio.start_unix_server(self._handle_client, unix_path))
+        if control_port is not None:
+            self.servers.append(await asyncio.start_server(self._handle_control, control_host, control_port))
+        if control_unix_path is not None:
+            self.servers.append(await asyncio.start_unix_server(self._handle_control, control_unix_path))
+
+        self.renderer.start()
+
+    @property
+    def addresses(self) -> List[Any]:
+        """Bound socket addresses, data listeners first."""
+        return [sock.getsockname() for server in self.servers for sock in server.sockets]
+
+    async def stop(self):
+        """Stop rendering, close listeners and disconnect all clients."""
+        self.renderer.stop()
+        for server in self.servers:
+            server.close()
+            await server.wait_closed()
+        self.servers.clear()
+        tasks = [client.task for client in self.clients.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _on_block(self, audio: np.ndarray):
+        """Render thread hook: encode once per format and hand off to the loop."""
+        formats = {client.sample_format for client in list(self.clients.values())}
+        if not formats:
+            return
+        payloads = {sample_format: encode_block(audio, sample_format) for sample_format in formats}
+        self.loop.call_soon_threadsafe(self._fan_out, payloads)
+
+    def _fan_out(self, payloads: Dict[str, bytes]):
+        """Queue a block for every client, applying the slow-client policy."""
+        for client in list(self.clients.values()):
+            payload = payloads.get(client.sample_format)
+            if payload is None:
+                continue
+            if client.queue.full():
+                if self.slow_client_policy == "disconnect":
+                    self.disconnected_slow_clients += 1
+                    self.clients.pop(client.client_id, None)
+                    client.task.cancel()
+                    continue
+                client.blocks_dropped += 1
+                if self.slow_client_policy == "drop_newest":
+                    continue
+                client.queue.get_nowait()
+            client.queue.put_nowait(payload)
+
+    async def _read_hello(self, reader: asyncio.StreamReader) -> str:
+        """Read the optional format hello line from a new client."""
+        try:
+            line = await asyncio.wait_for(reader.readline(), self.hello_timeout)
+        except asyncio.TimeoutError:
+            return self.default_format
+        if not line.strip():
+            return self.default_format
+        hello = json.loads(line)
+        if not isinstance(hello, dict):
+            raise ValueError("Hello must be a JSON object")
+        sample_format = hello.get("format", self.default_format)
+        if sample_format not in SAMPLE_FORMATS:
+            raise ValueError(f"Unknown sample format: {sample_format}")
+        return sample_format
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve one data client until it disconnects."""
+        try:
+            sample_format = await self._read_hello(reader)
+        except (ValueError, json.JSONDecodeError) as e:
+            writer.write(json.dumps({"ok": False, "error": str(e)}).encode() + b"\n")
+            writer.close()
+            return
+
+        self._next_client_id += 1
+        client = ClientConnection(
+            client_id=self._next_client_id,
+            writer=writer,
+            queue=asyncio.Queue(maxsize=self.queue_size),
+            sample_format=sample_format
+        )
+        client.task = asyncio.current_task()
+        self.clients[client.client_id] = client
+        try:
+            while True:
+                payload = await client.queue.get()
+                writer.write(payload)
+                await writer.drain()
+                client.blocks_sent += 1
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            await self._close_client(client)
+
+    async def _close_client(self, client: ClientConnection):
+        """Forget a client and close its socket."""
+        self.clients.pop(client.client_id, None)
+        client.writer.close()
+        try:
+            await client.writer.wait_closed()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+
+    def apply_parameters(self, updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate parameter updates and pass the merged set to the engine.
+
+        Raises:
+            KeyError: If an unknown parameter is provided
+            ValueError: If a parameter value is invalid
+        """
+        validated = get_registry().validate_parameters(updates)
+        self.parameters = {**self.parameters, **validated}
+        self.engine.set_parameters(**self.parameters)
+        return self.parameters
+
+    def stats(self) -> Dict[str, Any]:
+        """Get server and per-client statistics."""
+        return {
+            "clients": len(self.clients),
+            "blocks_rendered": self.renderer.blocks_rendered,
+            "late_blocks": self.renderer.late_blocks,
+            "dropped_blocks": sum(client.blocks_dropped for client in self.clients.values()),
+            "disconnected_slow_clients": self.disconnected_slow_clients,
+            "client_stats": [client.stats() for client in self.clients.values()],
+        }
+
+    def _handle_control_line(self, line: bytes) -> Dict[str, Any]:
+        """Handle one control message and build its reply."""
+        try:
+            message = json.loads(line)
+            if not isinstance(message, dict):
+                raise ValueError("Control message must be a JSON object")
+            if message.get("command") == "stats":
+                return {"ok": True, "stats": self.stats()}
+            return {"ok": True, "parameters": self.apply_parameters(message)}
+        except (ValueError, KeyError, TypeError) as e:
+            return {"ok": False, "error": str(e)}
+
+    async def _handle_control(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve one control client, replying to each JSON line."""
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                reply = self._handle_control_line(line)
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
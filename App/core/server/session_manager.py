@@ -0,0 +1,335 @@
+"""
+Session Manager Module - Hosts many independent audio engines on a shared render pool.
+
+Every session owns its own AudioEngine (chain, parameters and seed). A single
+scheduler thread dispatches block renders to a thread or process pool in
+earliest-deadline-first order and tracks each session's realtime factor
+(render time / block duration). New sessions are admitted only while the
+estimated aggregate load fits the configured CPU budget.
+"""
+
+import heapq
+import itertools
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Condition, Semaphore, Thread, Event
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+import numpy as np
+from ..audio.audio_engine import AudioEngine
+from ..audio.stream_config import StreamConfig
+
+ADMISSION_POLICIES = ("reject", "degrade")
+EXECUTOR_KINDS = ("thread", "process")
+
+class AdmissionError(RuntimeError):
+    """Raised when a new session would exceed the aggregate CPU budget."""
+    pass
+
+def _render_block(engine: AudioEngine, frames: int) -> Tuple[np.ndarray, AudioEngine, float]:
+    """Render one block and time it.
+
+    Runs in pool workers. The engine is returned so that, with a process pool,
+    the updated filter and generator state travels back to the session.
+    """
+    start = time.perf_counter()
+    audio = engine.generate_noise(frames)
+    return audio, engine, time.perf_counter() - start
+
+@dataclass
+class SessionStats:
+    """Render statistics for one session."""
+    blocks_rendered: int = 0
+    deadline_misses: int = 0
+    total_render_time: float = 0.0
+    max_render_time: float = 0.0
+    realtime_factor: float = 0.0
+
+class Session:
+    """One client's engine, parameters and render schedule."""
+
+    def __init__(self, session_id: int, engine: AudioEngine, degraded: bool = False, output_blocks: int = 4,
+                 on_block: Optional[Callable[[int, np.ndarray], None]] = None):
+        self.session_id = session_id
+        self.engine = engine
+        self.block_size = engine.stream_config.block_size
+        self.sample_rate = engine.stream_config.sample_rate
+        self.degraded = degraded
+        self.on_block = on_block
+        self.output: Deque[np.ndarray] = deque(maxlen=output_blocks)
+        self.stats = SessionStats()
+        self.estimated_load = 0.0
+        self.next_due = 0.0
+        self.closed = False
+
+    @property
+    def block_duration(self) -> float:
+        """Duration of one block in seconds."""
+        return self.block_size / self.sample_rate
+
+    @property
+    def load(self) -> float:
+        """Measured realtime factor, or the admission estimate before any render."""
+        return self.stats.realtime_factor if self.stats.blocks_rendered else self.estimated_load
+
+    def set_parameters(self, **parameters):
+        """Set this session's engine parameters."""
+        self.engine.set_parameters(**parameters)
+
+    def record_render(self, render_time: float, finished: float, due: float, smoothing: float):
+        """Update statistics after a block finished rendering."""
+        stats = self.stats
+        ratio = render_time / self.block_duration
+        if stats.blocks_rendered == 0:
+            stats.realtime_factor = ratio
+        else:
+            stats.realtime_factor += smoothing * (ratio - stats.realtime_factor)
+        stats.blocks_rendered += 1
+        stats.total_render_time += render_time
+        stats.max_render_time = max(stats.max_render_time, render_time)
+        if finished > due:
+            stats.deadline_misses += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Get a JSON-serialisable summary of this session."""
+        return {
+            "id": self.session_id,
+            "degraded": self.degraded,
+            "blocks": self.stats.blocks_rendered,
+            "deadline_misses": self.stats.deadline_misses,
+            "realtime_factor": self.stats.realtime_factor,
+            "max_render_ms": self.stats.max_render_time * 1000.0,
+        }
+
+class SessionManager:
+    """Schedules block renders for many sessions, earliest deadline first."""
+
+    def __init__(self, workers: Optional[int] = None, executor: str = "thread",
+                 cpu_budget: float = 0.75, admission_policy: str = "reject",
+                 lookahead_blocks: float = 1.0, smoothing: float = 0.1):
+        """
+        Initialize the session manager.
+
+        Args:
+            workers: Pool size (defaults to the CPU count)
+            executor: "thread" or "process". Thread workers share one core's
+                worth of Python execution because of the GIL; process workers
+                scale across cores at the cost of shipping engine state per block
+            cpu_budget: Fraction of each core that sessions may use in total
+            admission_policy: "reject" raises AdmissionError when the budget is
+                exceeded; "degrade" admits the session as best effort, scheduled
+                only after every guaranteed session
+            lookahead_blocks: How many block durations before its deadline a
+                block is dispatched
+            smoothing: Weight of the newest sample in the realtime factor average
+        """
+        if executor not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor kind: {executor}")
+        if admission_policy not in ADMISSION_POLICIES:
+            raise ValueError(f"Unknown admission policy: {admission_policy}")
+
+        self.workers = workers or os.cpu_count() or 1
+        self.executor_kind = executor
+        self.cpu_budget = cpu_budget
+        self.admission_policy = admission_policy
+        self.lookahead_blocks = lookahead_blocks
+        self.smoothing = smoothing
+
+        self.sessions: Dict[int, Session] = {}
+        self.rejected_sessions = 0
+        self._ids = itertools.count(1)
+        self._sequence = itertools.count()
+        # One deadline-ordered heap per priority class: guaranteed, then degraded
+        self._queues: Tuple[List[Tuple[float, int, Session]], ...] = ([], [])
+        self._condition = Condition()
+        self._slots = Semaphore(self.workers)
+        self._stop_event = Event()
+        self._executor: Optional[Executor] = None
+        self._scheduler_thread = None
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def capacity(self) -> float:
+        """Total realtime factor the pool can sustain within the CPU budget."""
+        cores = self.workers if self.executor_kind == "process" else 1
+        return cores * self.cpu_budget
+
+    def aggregate_load(self) -> float:
+        """Sum of realtime factors of all guaranteed (non-degraded) sessions."""
+        return sum(session.load for session in list(self.sessions.values()) if not session.degraded)
+
+    def open_session(self, config: Optional[Dict[str, Any]] = None, parameters: Optional[Dict[str, Any]] = None,
+                     seed: Optional[int] = None, stream_config: Optional[StreamConfig] = None,
+                     on_block: Optional[Callable[[int, np.ndarray], None]] = None) -> Session:
+        """Create a session, probe its cost and schedule it if admitted.
+
+        Args:
+            config: AudioEngine configuration (defaults to the engine's default chain)
+            parameters: Initial engine parameters
+            seed: Seed for the chain's generator
+            stream_config: Block size and sample rate for the session's engine
+            on_block: Optional callback receiving (session_id, block) after each render
+
+        Returns:
+            The admitted session
+
+        Raises:
+            AdmissionError: If the budget would be exceeded and the policy is "reject"
+        """
+        engine = AudioEngine(config, stream_config)
+        if seed is not None and engine.processors and hasattr(engine.processors[0], "seed"):
+            engine.processors[0].seed = seed
+        engine.set_parameters(**(parameters or {}))
+
+        session = Session(next(self._ids), engine, on_block=on_block)
+
+        # Probe with a throwaway copy so the session's own state stays untouched
+        # (best of two, the first render also pays one-off warm-up costs)
+        probe_engine = AudioEngine(config, stream_config)
+        probe_engine.set_parameters(**(parameters or {}))
+        probe_time = min(_render_block(probe_engine, session.block_size)[2] for _ in range(2))
+        session.estimated_load = probe_time / session.block_duration
+
+        if self.aggregate_load() + session.estimated_load > self.capacity:
+            if self.admission_policy == "reject":
+                self.rejected_sessions += 1
+                raise AdmissionError(
+                    f"Session needs realtime factor {session.estimated_load:.3f}, "
+                    f"{self.capacity - self.aggregate_load():.3f} available"
+                )
+            session.degraded = True
+            self.logger.warning(f"Session {session.session_id} admitted as degraded")
+
+        self.sessions[session.session_id] = session
+        session.next_due = time.monotonic() + session.block_duration
+        self._schedule(session)
+        return session
+
+    def close_session(self, session_id: int):
+        """Stop rendering a session and forget it."""
+        session = self.sessions.pop(session_id, None)
+        if session is not None:
+            session.closed = True
+
+    def _schedule(self, session: Session):
+        """Queue a session's next block in its priority class by deadline."""
+        with self._condition:
+            heapq.heappush(
+                self._queues[int(session.degraded)],
+                (session.next_due, next(self._sequence), session)
+            )
+            self._condition.notify()
+
+    def _next_job(self) -> Optional[Tuple[Session, float]]:
+        """Wait for the most urgent block whose dispatch time has come.
+
+        Degraded sessions only get a slot when no guaranteed block is ready.
+        """
+        with self._condition:
+            while not self._stop_event.is_set():
+                now = time.monotonic()
+                wait = 0.1
+                for queue in self._queues:
+                    while queue and queue[0][2].closed:
+                        heapq.heappop(queue)
+                    if not queue:
+                        continue
+                    due, _, session = queue[0]
+                    delay = due - self.lookahead_blocks * session.block_duration - now
+                    if delay <= 0:
+                        heapq.heappop(queue)
+                        return session, due
+                    wait = min(wait, delay)
+                # Re-check on wake-up: a new session may have an earlier deadline
+                self._condition.wait(wait)
+        return None
+
+    def _scheduler_loop(self):
+        """Dispatch renders while a pool slot is free, earliest deadline first."""
+        while not self._stop_event.is_set():
+            if not self._slots.acquire(timeout=0.1):
+                continue
+            job = self._next_job()
+            if job is None:
+                self._slots.release()
+                break
+            session, due = job
+            future = self._executor.submit(_render_block, session.engine, session.block_size)
+            future.add_done_callback(
+                lambda done, session=session, due=due: self._on_rendered(session, due, done)
+            )
+
+    def _on_rendered(self, session: Session, due: float, future):
+        """Record a finished render and schedule the session's next block."""
+        self._slots.release()
+        finished = time.monotonic()
+        try:
+            audio, engine, render_time = future.result()
+        except Exception as e:
+            self.logger.error(f"Session {session.session_id} render failed: {e}")
+            self.close_session(session.session_id)
+            return
+
+        if self.executor_kind == "process":
+            # Keep parameters set while the block was in flight
+            engine.parameters = session.engine.parameters
+            session.engine = engine
+        session.record_render(render_time, finished, due, self.smoothing)
+        session.output.append(audio)
+        if session.on_block is not None:
+            session.on_block(session.session_id, audio)
+
+        if not session.closed and not self._stop_event.is_set():
+            session.next_due = due + session.block_duration
+            if finished > session.next_due:
+                # Too far behind: skip ahead instead of rendering a backlog
+                session.next_due = finished + session.block_duration
+            self._schedule(session)
+
+    def start(self):
+        """Start the worker pool and scheduler thread."""
+        if self._scheduler_thread is not None and self._scheduler_thread.is_alive():
+            return
+        self._stop_event.clear()
+        if self.executor_kind == "process":
+            # Forked workers would inherit locks held by other threads (the
+            # import lock, logging) and could hang; start them from a clean
+            # process, and before the scheduler thread exists
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+            # Non-forking pools start every worker on the first submit; pay the
+            # interpreter startup here instead of on the first deadlines
+            self._executor.submit(os.getpid).result()
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="SessionRender")
+        self._scheduler_thread = Thread(target=self._scheduler_loop, daemon=True, name="SessionScheduler")
+        self._scheduler_thread.start()
+
+    def stop(self):
+        """Stop scheduling and shut down the worker pool."""
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._scheduler_thread is not None:
+            self._scheduler_thread.join(timeout=1.0)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def summary(self) -> Dict[str, Any]:
+        """Get aggregate and per-session statistics."""
+        sessions = [session.summary() for session in list(self.sessions.values())]
+        return {
+            "sessions": len(sessions),
+            "degraded_sessions": sum(1 for s in sessions if s["degraded"]),
+            "rejected_sessions": self.rejected_sessions,
+            "aggregate_load": self.aggregate_load(),
+            "capacity": self.capacity,
+            "deadline_misses": sum(s["deadline_misses"] for s in sessions),
+            "session_stats": sessions,
+        }
@@ -1,9 +1,21 @@
 """Base class for filter frequency response visualization."""
 
 from abc import ABC, abstractmethod
+from typing import Optional, Type
 import numpy as np
+from ..filters.base import FilterBase
+from .transfer_function import ResponseCache, RESPONSE_CACHE
+from .response_table import ResponseTable, load_table
 
 class FilterResponseVisualizer(ABC):
+    def __init__(self, sample_rate: int = 44100):
+        """Initialize visualizer.
+        
+        Args:
+            sample_rate: Stream sample rate in Hz used to map coefficients to frequencies
+        """
+        self.sample_rate = sample_rate
+    
     @abstractmethod
     def calculate_response(self, freqs: np.ndarray, parameters: dict) -> np.ndarray:
         """Calculate frequency response in dB for given frequencies and parameters.
@@ -16,3 +28,56 @@ class FilterResponseVisualizer(ABC):
             Array of response values in dB
         """
         pass
+
+class CoefficientResponseVisualizer(FilterResponseVisualizer):
+    """Visualizer showing a filter's exact response, computed from its coefficients.
+    
+    Subclasses set `filter_class`; the filter's own coefficient design is
+    used, so the curve always matches what the DSP does.
+    """
+    
+    filter_class: Type[FilterBase] = None
+    
+    def __init__(self, sample_rate: int = 44100, cache: Optional[ResponseCache] = None):
+        """Initialize visualizer.
+        
+        Args:
+            sample_rate: Stream sample rate in Hz
+            cache: Response cache; shared RESPONSE_CACHE if None
+        """
+        super().__init__(sample_rate)
+        self.filter = self.filter_class()
+        self.filter.set_sample_rate(sample_rate)
+        self.cache = cache or RESPONSE_CACHE
+    
+    def calculate_response(self, freqs: np.ndarray, parameters: dict) -> np.ndarray:
+        """Calculate the filter's frequency response in dB."""
+        return self.cache.response_db(self.filter, parameters, freqs)
+
+class MeasuredResponseVisualizer(CoefficientResponseVisualizer):
+    """Visualizer for nonlinear filters, interpolating a measured response table.
+    
+    Tables are built offline by scripts/build_response_tables.py and are
+    looked up by frequency in Hz. Falls back to the small-signal coefficient
+    response when no table is available.
+    """
+    
+    table_name: str = None
+    
+    def __init__(self, sample_rate: int = 44100, cache: Optional[ResponseCache] = None,
+                 table: Optional[ResponseTable] = None):
+        """Initialize visualizer.
+        
+        Args:
+            sample_rate: Stream sample rate in Hz
+            cache: Response cache for the coefficient fallback
+            table: Response table; loads the shipped `table_name` table if None
+        """
+        super().__init__(sample_rate, cache)
+        self.table = table if table is not None else load_table(self.table_name)
+    
+    def calculate_response(self, freqs: np.ndarray, parameters: dict) -> np.ndarray:
+        """Interpolate the measured response in dB."""
+        if self.table is None:
+            return super().calculate_response(freqs, parameters)
+        return self.table.response_db(parameters, freqs)
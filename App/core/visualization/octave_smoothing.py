@@ -0,0 +1,87 @@
+"""
+Octave Smoothing Module - Fractional-octave spectrum smoothing with a precomputed sparse matrix.
+"""
+
+import numpy as np
+
+OCTAVE_FRACTIONS = (1, 3, 6, 12, 24)
+
+class OctaveSmoother:
+    """Averages FFT power over 1/N-octave bands centred on a log-spaced grid.
+
+    The band membership of every FFT bin is worked out once, stored as a
+    CSR-style sparse matrix (row pointers, bin indices, weights), and applied
+    to each spectrum with one gather-multiply-reduce. Bands narrower than the
+    bin spacing (low frequencies, narrow fractions) fall back to linear
+    interpolation between the two nearest bins, so every output point is
+    defined.
+    """
+
+    def __init__(self, freqs: np.ndarray, fraction: int, min_freq: float = 20.0,
+                 max_freq: float = 20000.0, points_per_octave: int = None):
+        """
+        Build the smoothing matrix.
+
+        Args:
+            freqs: FFT bin frequencies (ascending, e.g. np.fft.rfftfreq)
+            fraction: N in 1/N octave, one of OCTAVE_FRACTIONS
+            min_freq: Lowest output frequency
+            max_freq: Highest output frequency
+            points_per_octave: Output grid density; defaults to 2N, at least 12
+        """
+        if fraction not in OCTAVE_FRACTIONS:
+            raise ValueError(f"Octave fraction must be one of {OCTAVE_FRACTIONS}, got {fraction}")
+        max_freq = min(max_freq, freqs[-1])
+        self.fraction = fraction
+        self.points_per_octave = points_per_octave or max(2 * fraction, 12)
+        n_points = int(np.floor(np.log2(max_freq / min_freq) * self.points_per_octave)) + 1
+        self.centers = min_freq * 2.0 ** (np.arange(n_points) / self.points_per_octave)
+
+        half_band = 2.0 ** (1.0 / (2 * fraction))
+        lower = np.searchsorted(freqs, self.centers / half_band, side='left')
+        upper = np.searchsorted(freqs, self.centers * half_band, side='right')
+
+        indptr = [0]
+        indices = []
+        weights = []
+        for center, lo, hi in zip(self.centers, lower, upper):
+            if hi > lo:
+                # Mean power of the bins inside the band
+                indices.extend(range(lo, hi))
+                weights.extend([1.0 / (hi - lo)] * (hi - lo))
+            else:
+                # Band falls between two bins: interpolate
+                right = min(max(lo, 1), len(freqs) - 1)
+                left = right - 1
+                t = (center - freqs[left]) / (freqs[right] - freqs[left])
+                indices.extend([left, right])
+                weights.extend([1.0 - t, t])
+            indptr.append(len(indices))
+
+        self.indptr = np.array(indptr)
+        self.indices = np.array(indices)
+        self.weights = np.array(weights)
+        self.n_bins = len(freqs)
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored matrix entries."""
+        return len(self.indices)
+
+    def apply(self, power: np.ndarray) -> np.ndarray:
+        """Smooth a power spectrum onto the log-frequency grid.
+
+        Args:
+            power: Power per FFT bin, length len(freqs)
+
+        Returns:
+            Smoothed power at `centers`
+        """
+        return np.add.reduceat(self.weights * power[self.indices], self.indptr[:-1])
+
+    def dense(self) -> np.ndarray:
+        """The smoothing matrix as a dense (points, bins) array, for inspection and tests."""
+        matrix = np.zeros((len(self.centers), self.n_bins))
+        rows = np.repeat(np.arange(len(self.centers)), np.diff(self.indptr))
+        np.add.at(matrix, (rows, self.indices), self.weights)
+        return matrix
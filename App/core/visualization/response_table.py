@@ -0,0 +1,97 @@
+"""
+Response Table Module - Measured filter responses stored on a parameter grid.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+import numpy as np
+
+# Tables shipped with the app
+TABLE_DIR = Path(__file__).parent / "tables"
+
+@dataclass
+class ResponseTable:
+    """Magnitude responses in dB measured over a grid of filter parameters.
+
+    `magnitude_db` has one axis per entry of `parameter_names` (in order)
+    plus a final frequency axis matching `freqs`. Lookups interpolate
+    linearly between grid points (clamped at the edges) and linearly in
+    log-frequency, so nothing is computed beyond a few weighted sums.
+    """
+    filter_type: str
+    parameter_names: List[str]
+    axes: List[np.ndarray]
+    freqs: np.ndarray
+    magnitude_db: np.ndarray
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        expected = tuple(len(axis) for axis in self.axes) + (len(self.freqs),)
+        if self.magnitude_db.shape != expected:
+            raise ValueError(f"Table shape {self.magnitude_db.shape} does not match axes {expected}")
+
+    def save(self, path: Union[str, Path]):
+        """Write the table as a compressed .npz (magnitudes stored as float16)."""
+        arrays = {f"axis_{name}": axis for name, axis in zip(self.parameter_names, self.axes)}
+        np.savez_compressed(
+            path,
+            filter_type=np.array(self.filter_type),
+            parameter_names=np.array(self.parameter_names),
+            freqs=self.freqs,
+            magnitude_db=self.magnitude_db.astype(np.float16),
+            metadata_keys=np.array(list(self.metadata.keys())),
+            metadata_values=np.array([str(value) for value in self.metadata.values()]),
+            **arrays
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ResponseTable":
+        """Read a table written by save()."""
+        with np.load(path) as data:
+            names = [str(name) for name in data["parameter_names"]]
+            return cls(
+                filter_type=str(data["filter_type"]),
+                parameter_names=names,
+                axes=[data[f"axis_{name}"] for name in names],
+                freqs=data["freqs"],
+                magnitude_db=data["magnitude_db"].astype(np.float32),
+                metadata=dict(zip(data["metadata_keys"].tolist(), data["metadata_values"].tolist()))
+            )
+
+    def lookup(self, parameters: dict) -> np.ndarray:
+        """Interpolate the response at `parameters` on the table's own frequencies.
+
+        Missing parameters use the first grid value.
+        """
+        result = np.zeros(len(self.freqs), dtype=np.float64)
+        corners = [()]
+        weights = [1.0]
+        for name, axis in zip(self.parameter_names, self.axes):
+            value = float(parameters.get(name, axis[0]))
+            upper = int(np.clip(np.searchsorted(axis, value), 1, max(1, len(axis) - 1)))
+            if len(axis) == 1:
+                steps = [(0, 1.0)]
+            else:
+                t = float(np.clip((value - axis[upper - 1]) / (axis[upper] - axis[upper - 1]), 0.0, 1.0))
+                steps = [(upper - 1, 1.0 - t), (upper, t)]
+            corners = [corner + (index,) for corner in corners for index, _ in steps]
+            weights = [weight * w for weight in weights for _, w in steps]
+        for corner, weight in zip(corners, weights):
+            if weight:
+                result += weight * self.magnitude_db[corner]
+        return result
+
+    def response_db(self, parameters: dict, freqs: np.ndarray) -> np.ndarray:
+        """Interpolate the response at `parameters` onto the requested frequencies."""
+        response = np.interp(np.log2(freqs), np.log2(self.freqs), self.lookup(parameters))
+        return np.clip(response, -60, 24)
+
+def table_path(filter_type: str) -> Path:
+    """Location of the shipped table for a filter type."""
+    return TABLE_DIR / f"{filter_type}.npz"
+
+def load_table(filter_type: str) -> Optional[ResponseTable]:
+    """Load the shipped table for a filter type, or None if there is none."""
+    path = table_path(filter_type)
+    return ResponseTable.load(path) if path.exists() else None
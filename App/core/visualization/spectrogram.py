@@ -0,0 +1,116 @@
+"""
+Spectrogram Module - Incremental STFT into a fixed-size scrolling image.
+"""
+
+from typing import Optional, Tuple
+import numpy as np
+from ..audio.ring_buffer import SampleRingBuffer
+from .spectrum_analyzer import REFERENCE_FFT_SIZE
+
+class IncrementalSTFT:
+    """Computes only the new STFT columns each update and keeps a bounded history.
+
+    Columns are read from the audio tap at absolute sample positions, so each
+    update costs time proportional to the audio that arrived since the last
+    one, never to the history length. The history lives in a preallocated
+    ring with every row stored twice (at `row` and `row + history`), which
+    makes the time-ordered image a contiguous slice: `image` returns a view
+    and nothing is reallocated while scrolling.
+    """
+
+    def __init__(self, sample_rate: int = 44100, fft_size: int = 1024, hop: int = 512,
+                 history: int = 512, db_range: Tuple[float, float] = (-60.0, 24.0),
+                 dtype=np.uint8, max_columns_per_update: int = 64):
+        """
+        Initialize the STFT.
+
+        Args:
+            sample_rate: Sample rate in Hz
+            fft_size: Points per column
+            hop: Samples between column starts
+            history: Number of columns kept
+            db_range: Levels mapped to the bottom and top of the uint8 range
+            dtype: np.uint8 (quantised to db_range) or np.float16 (dB values)
+            max_columns_per_update: When further behind than this, older
+                columns are skipped so one update stays cheap
+        """
+        if hop <= 0 or hop > fft_size:
+            raise ValueError(f"Hop must be in [1, fft_size], got {hop}")
+        if np.dtype(dtype) not in (np.dtype(np.uint8), np.dtype(np.float16)):
+            raise ValueError(f"Image dtype must be uint8 or float16, got {np.dtype(dtype)}")
+        self.sample_rate = sample_rate
+        self.fft_size = fft_size
+        self.hop = hop
+        self.history = history
+        self.db_range = db_range
+        self.max_columns_per_update = max_columns_per_update
+        self.window = np.hanning(fft_size).astype(np.float32)
+        # Same calibration as the spectrum display
+        self.level_scale = 2 * float(np.sqrt(np.sum(np.hanning(REFERENCE_FFT_SIZE) ** 2) / np.sum(self.window ** 2.0)))
+        self.freqs = np.fft.rfftfreq(fft_size, d=1.0 / sample_rate)
+        self._image = np.zeros((2 * history, len(self.freqs)), dtype=dtype)
+        self._scratch = np.zeros(fft_size + (max_columns_per_update - 1) * hop, dtype=np.float32)
+        self.head = 0
+        self.columns_written = 0
+        self.columns_skipped = 0
+        self.position: Optional[int] = None
+
+    @property
+    def image(self) -> np.ndarray:
+        """(history, bins) view of the spectrogram, oldest column first."""
+        return self._image[self.head:self.head + self.history]
+
+    @property
+    def column_duration(self) -> float:
+        """Seconds between columns."""
+        return self.hop / self.sample_rate
+
+    def reset(self):
+        """Clear the history and restart from the newest audio."""
+        self._image[:] = 0
+        self.head = 0
+        self.columns_written = 0
+        self.position = None
+
+    def update(self, tap: SampleRingBuffer) -> int:
+        """Compute the columns that became available since the last update.
+
+        Returns:
+            Number of new columns written
+        """
+        written = tap.written
+        if self.position is None:
+            self.position = max(0, written - self.fft_size)
+        pending = (written - self.position - self.fft_size) // self.hop + 1
+        if pending <= 0:
+            return 0
+        if pending > self.max_columns_per_update:
+            skipped = pending - self.max_columns_per_update
+            self.position += skipped * self.hop
+            self.columns_skipped += skipped
+            pending = self.max_columns_per_update
+
+        span = self.fft_size + (pending - 1) * self.hop
+        samples = self._scratch[:span]
+        tap.read(self.position, samples)
+        frames = np.lib.stride_tricks.sliding_window_view(samples, self.fft_size)[::self.hop]
+        magnitude = np.abs(np.fft.rfft(frames * self.window, axis=-1))
+        self._write_columns(self._to_levels(magnitude))
+        self.position += pending * self.hop
+        return pending
+
+    def _to_levels(self, magnitude: np.ndarray) -> np.ndarray:
+        """Convert magnitudes to the image's dB representation."""
+        db = 20 * np.log10(np.maximum(magnitude * self.level_scale, 1e-6))
+        if self._image.dtype == np.float16:
+            return db.astype(np.float16)
+        low, high = self.db_range
+        return np.clip((db - low) * (255.0 / (high - low)), 0, 255).astype(np.uint8)
+
+    def _write_columns(self, columns: np.ndarray):
+        """Append columns to the ring, writing both copies of each row."""
+        rows = (self.head + np.arange(len(columns))) % self.history
+        self._image[rows] = columns
+        self._image[rows + self.history] = columns
+        self.head = (self.head + len(columns)) % self.history
+        self.columns_written += len(columns)
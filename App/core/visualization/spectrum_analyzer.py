@@ -0,0 +1,198 @@
+"""
+Spectrum Analyzer Module - Cached, budgeted FFT analysis for the spectrum display.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+import numpy as np
+from .octave_smoothing import OctaveSmoother
+
+FFT_SIZES = (512, 1024, 2048, 4096, 8192, 16384, 32768)
+
+# Display levels are calibrated to a single 2048-point Hann frame, so other
+# FFT sizes are rescaled to show noise at the same dB level
+REFERENCE_FFT_SIZE = 2048
+
+@dataclass
+class AnalysisPlan:
+    """Everything about an FFT size that does not depend on the signal."""
+    fft_size: int
+    window: np.ndarray
+    level_scale: float
+    freqs: np.ndarray
+    mask: np.ndarray
+    display_freqs: np.ndarray
+
+class SpectrumAnalyzer:
+    """Magnitude spectrum in dB with Welch and exponential averaging.
+
+    Windows, frequency grids and display masks are built once per FFT size
+    and reused. Welch averaging splits the input into overlapping segments
+    and averages their power; exponential averaging then blends each result
+    with the previous ones. The result is either smoothed with a 5-bin
+    kernel on the linear FFT grid or, when `octave_fraction` is set,
+    averaged over 1/N-octave bands onto a log-frequency grid. The number of
+    Welch segments is reduced automatically when analysis takes longer than
+    `cpu_budget`, and raised again when there is headroom.
+    """
+
+    def __init__(self, sample_rate: int = 44100, fft_size: int = 2048, overlap: float = 0.5,
+                 segments: int = 1, averaging: float = 0.0, octave_fraction: Optional[int] = None,
+                 min_freq: float = 20.0, max_freq: float = 20000.0, cpu_budget: float = 0.005):
+        """
+        Initialize the analyzer.
+
+        Args:
+            sample_rate: Sample rate in Hz
+            fft_size: Points per FFT, one of FFT_SIZES
+            overlap: Fraction of each Welch segment shared with the next, in [0, 1)
+            segments: Maximum number of Welch segments averaged per frame
+            averaging: Exponential averaging weight of the previous spectrum, in [0, 1)
+            octave_fraction: N for 1/N-octave smoothing (see OCTAVE_FRACTIONS), or
+                None for the 5-bin linear smoothing
+            min_freq: Lowest displayed frequency (exclusive)
+            max_freq: Highest displayed frequency (exclusive)
+            cpu_budget: Target seconds of analysis per displayed frame
+        """
+        self.sample_rate = sample_rate
+        self.min_freq = min_freq
+        self.max_freq = max_freq
+        self.cpu_budget = cpu_budget
+        self.smoothing_kernel = np.hanning(5) / 5
+        self._plans: Dict[int, AnalysisPlan] = {}
+        self._smoothers: Dict[Tuple[int, int], OctaveSmoother] = {}
+        self.octave_fraction = octave_fraction
+        self._average_power: Optional[np.ndarray] = None
+        self._frame_time = 0.0
+        self.configure(fft_size=fft_size, overlap=overlap, segments=segments, averaging=averaging)
+
+    def configure(self, fft_size: Optional[int] = None, overlap: Optional[float] = None,
+                  segments: Optional[int] = None, averaging: Optional[float] = None,
+                  octave_fraction: Optional[int] = None):
+        """Change analysis settings; omitted settings are kept.
+
+        Pass octave_fraction=0 to switch back to linear smoothing.
+
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        fft_size = self.plan.fft_size if fft_size is None else fft_size
+        overlap = self.overlap if overlap is None else overlap
+        segments = self.segments if segments is None else segments
+        averaging = self.averaging if averaging is None else averaging
+        octave_fraction = self.octave_fraction if octave_fraction is None else octave_fraction
+        if fft_size not in FFT_SIZES:
+            raise ValueError(f"FFT size must be one of {FFT_SIZES}, got {fft_size}")
+        if not 0.0 <= overlap < 1.0:
+            raise ValueError(f"Overlap must be in [0, 1), got {overlap}")
+        if segments < 1:
+            raise ValueError(f"Segment count must be at least 1, got {segments}")
+        if not 0.0 <= averaging < 1.0:
+            raise ValueError(f"Averaging must be in [0, 1), got {averaging}")
+
+        self.plan = self._get_plan(fft_size)
+        self.smoother = self._get_smoother(fft_size, octave_fraction) if octave_fraction else None
+        self.octave_fraction = octave_fraction or None
+        self.overlap = overlap
+        self.segments = segments
+        self.averaging = averaging
+        self.hop = max(1, int(fft_size * (1.0 - overlap)))
+        self.effective_segments = segments
+        self.reset()
+
+    def reset(self):
+        """Forget the exponential average."""
+        self._average_power = None
+
+    @property
+    def samples_needed(self) -> int:
+        """Input length that fills every Welch segment."""
+        return self.plan.fft_size + (self.segments - 1) * self.hop
+
+    @property
+    def frame_time(self) -> float:
+        """Smoothed seconds spent per analyze() call."""
+        return self._frame_time
+
+    def _get_plan(self, fft_size: int) -> AnalysisPlan:
+        """Get the cached plan for an FFT size, building it on first use."""
+        plan = self._plans.get(fft_size)
+        if plan is None:
+            window = np.hanning(fft_size)
+            reference_power = np.sum(np.hanning(REFERENCE_FFT_SIZE) ** 2)
+            freqs = np.fft.rfftfreq(fft_size, d=1.0 / self.sample_rate)
+            mask = (freqs > self.min_freq) & (freqs < self.max_freq)
+            plan = AnalysisPlan(
+                fft_size=fft_size,
+                window=window,
+                level_scale=float(np.sqrt(reference_power / np.sum(window ** 2))),
+                freqs=freqs,
+                mask=mask,
+                display_freqs=freqs[mask]
+            )
+            self._plans[fft_size] = plan
+        return plan
+
+    def _get_smoother(self, fft_size: int, fraction: int) -> OctaveSmoother:
+        """Get the cached octave smoothing matrix for an FFT size and fraction."""
+        key = (fft_size, fraction)
+        smoother = self._smoothers.get(key)
+        if smoother is None:
+            smoother = OctaveSmoother(self._plans[fft_size].freqs, fraction, self.min_freq, self.max_freq)
+            self._smoothers[key] = smoother
+        return smoother
+
+    def analyze(self, samples: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute the display spectrum of the newest samples.
+
+        Args:
+            samples: Recent audio, oldest first; at least fft_size long
+
+        Returns:
+            (frequencies, levels in dB) restricted to the display range
+        """
+        start = time.perf_counter()
+        plan = self.plan
+        n = plan.fft_size
+        if len(samples) < n:
+            raise ValueError(f"Need at least {n} samples, got {len(samples)}")
+
+        # Newest segments first, so a shorter input still covers the latest audio
+        available = 1 + (len(samples) - n) // self.hop
+        count = min(self.effective_segments, available)
+        end = len(samples)
+        frames = np.lib.stride_tricks.sliding_window_view(samples[end - n - (count - 1) * self.hop:end], n)[::self.hop]
+        power = np.abs(np.fft.rfft(frames * plan.window, axis=-1)) ** 2
+        power = power.mean(axis=0)
+
+        if self.averaging and self._average_power is not None:
+            power = self.averaging * self._average_power + (1.0 - self.averaging) * power
+        self._average_power = power
+
+        if self.smoother is not None:
+            freqs = self.smoother.centers
+            # Same overall gain as the 5-bin kernel so both modes read alike
+            magnitude = np.sqrt(self.smoother.apply(power)) * plan.level_scale * self.smoothing_kernel.sum()
+        else:
+            freqs = plan.display_freqs
+            magnitude = np.sqrt(power) * plan.level_scale
+            magnitude = np.convolve(magnitude, self.smoothing_kernel, mode='same')[plan.mask]
+        levels = 20 * np.log10(np.clip(magnitude * 2, 1e-3, None))  # *2 to match RMS scaling
+        levels = np.clip(levels, -60, 24)
+
+        self._adapt_segments(time.perf_counter() - start)
+        return freqs, levels
+
+    def _adapt_segments(self, elapsed: float):
+        """Trade Welch segments for time to stay within the CPU budget."""
+        self._frame_time = elapsed if not self._frame_time else 0.8 * self._frame_time + 0.2 * elapsed
+        per_segment = self._frame_time / self.effective_segments
+        if self._frame_time > self.cpu_budget and self.effective_segments > 1:
+            self.effective_segments = max(1, int(self.cpu_budget / per_segment))
+        elif self.effective_segments < self.segments and self._frame_time + per_segment < 0.5 * self.cpu_budget:
+            self.effective_segments += 1
+        else:
+            return
+        # Expected cost at the new segment count
+        self._frame_time = per_segment * self.effective_segments
@@ -0,0 +1,108 @@
+"""
+Transfer Function Module - Evaluate filter coefficients on a frequency grid, with caching.
+"""
+
+from collections import OrderedDict
+from typing import Tuple
+import numpy as np
+from ..filters.base import FilterBase, FilterCoefficients
+
+def frequency_response(coefficients: FilterCoefficients, freqs: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Evaluate H(z) on the unit circle at the given frequencies.
+
+    All sections are evaluated together as a (sections, frequencies) array
+    and multiplied along the section axis.
+
+    Args:
+        coefficients: Filter sections, FIR stage and gain
+        freqs: Frequencies in Hz
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Complex response at each frequency
+    """
+    z_inv = np.exp(-2j * np.pi * np.asarray(freqs, dtype=float) / sample_rate)
+    sections = coefficients.sections
+    numerator = sections[:, 0, None] + sections[:, 1, None] * z_inv
+    denominator = 1.0 + sections[:, 2, None] * z_inv
+    response = coefficients.gain * np.prod(numerator / denominator, axis=0)
+    if coefficients.fir is not None:
+        # polyval expects the highest power first
+        response = response * np.polyval(coefficients.fir[::-1], z_inv)
+    return response
+
+def magnitude_db(response: np.ndarray) -> np.ndarray:
+    """Convert a complex response to dB, clipped to the display range."""
+    response_db = 20 * np.log10(np.clip(np.abs(response), 1e-6, None))
+    return np.clip(response_db, -60, 24)
+
+class ResponseCache:
+    """LRU cache of filter responses in dB.
+
+    Keys are (filter class, sample rate, quantised parameters, frequency
+    grid), so dragging a slider back over values already seen costs a dict
+    lookup. Responses are computed from the quantised parameters, so a
+    cached entry is exactly what a fresh evaluation would give.
+    """
+
+    def __init__(self, maxsize: int = 256, resolution: float = 1e-4):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Number of responses kept
+            resolution: Step that float parameters are rounded to
+        """
+        self.maxsize = maxsize
+        self.resolution = resolution
+        self._entries: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def quantise(self, parameters: dict) -> Tuple[tuple, dict]:
+        """Round float parameters to the cache resolution.
+
+        Returns:
+            (hashable key, quantised parameter dict)
+        """
+        quantised = {}
+        for name, value in parameters.items():
+            if isinstance(value, float):
+                value = round(value / self.resolution) * self.resolution
+            quantised[name] = value
+        return tuple(sorted((name, repr(value)) for name, value in quantised.items())), quantised
+
+    def response_db(self, filter: FilterBase, parameters: dict, freqs: np.ndarray) -> np.ndarray:
+        """Get the filter's response in dB, computing it on a cache miss.
+
+        Args:
+            filter: Filter instance (its sample rate is part of the key)
+            parameters: Filter parameters
+            freqs: Frequency grid in Hz
+
+        Returns:
+            Response in dB; treat as read-only, it is shared with the cache
+        """
+        freqs = np.asarray(freqs, dtype=float)
+        parameter_key, quantised = self.quantise(parameters)
+        key = (type(filter), filter.sample_rate, parameter_key, len(freqs), hash(freqs.tobytes()))
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+        self.misses += 1
+        response = magnitude_db(frequency_response(filter.coefficients(quantised), freqs, filter.sample_rate))
+        response.flags.writeable = False
+        self._entries[key] = response
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return response
+
+    def clear(self):
+        """Drop all cached responses."""
+        self._entries.clear()
+
+# Shared by all visualizers so switching filters keeps earlier results
+RESPONSE_CACHE = ResponseCache()
@@ -1,19 +1,27 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QSlider, QLabel, QComboBox
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from core.parameters.noise_parameters import NoiseParameters
 from core.parameters.parameter_definitions import get_registry
-from typing import Dict, Any
+from core.parameters.update_coalescer import UpdateCoalescer
+from typing import Dict, Any, Optional
 
 class NoiseControlsWidget(QWidget):
     """Widget containing noise parameter controls."""
     
-    def __init__(self, parameters: NoiseParameters):
+    def __init__(self, parameters: NoiseParameters, coalescer: Optional[UpdateCoalescer] = None):
         super().__init__()
         self.parameters = parameters
         self.registry = get_registry()
         self.sliders: Dict[str, QSlider] = {}
         self.generator_combo = None
         self.filter_combo = None
+        
+        # Slider changes are batched and delivered once per display frame
+        self.coalescer = coalescer or UpdateCoalescer(parameters.update_parameters)
+        self.flush_timer = QTimer()
+        self.flush_timer.timeout.connect(self._flush_updates)
+        self.flush_timer.start(self.coalescer.interval_ms)
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -35,19 +43,23 @@ class NoiseControlsWidget(QWidget):
         
         self.setLayout(layout)
     
-    def _on_slider_changed(self):
-        """Handle slider value changes."""
-        params = {}
-        for param_name, slider in self.sliders.items():
-            definition = self.registry.get_definition(param_name)
-            if definition.range:
-                # Convert slider value back to parameter range
-                min_val = definition.range.min_value
-                max_val = definition.range.max_value
-                resolution = slider.maximum()
-                value = min_val + (slider.value() / resolution) * (max_val - min_val)
-                params[param_name] = value
-        self._update_parameters(params)
+    def _on_slider_changed(self, param_name: str, slider_value: int):
+        """Queue the moved slider's value for the next flush."""
+        definition = self.registry.get_definition(param_name)
+        if definition.range:
+            # Convert slider value back to parameter range
+            min_val = definition.range.min_value
+            max_val = definition.range.max_value
+            resolution = self.sliders[param_name].maximum()
+            value = min_val + (slider_value / resolution) * (max_val - min_val)
+            self.coalescer.submit(**{param_name: value})
+    
+    def _flush_updates(self):
+        """Deliver queued slider changes with validation."""
+        try:
+            self.coalescer.flush()
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Parameter update error: {str(e)}")
     
     def _add_combo_boxes(self, layout):
         """Add generator and filter type selectors."""
@@ -121,7 +133,8 @@ class NoiseControlsWidget(QWidget):
                 slider.setPageStep(0)
                 
                 self.sliders[param_name] = slider
-                slider.valueChanged.connect(self._on_slider_changed)
+                slider.valueChanged.connect(
+                    lambda slider_value, name=param_name: self._on_slider_changed(name, slider_value))
                 self.param_layout.addWidget(slider)
 
     def _on_selection_changed(self):
@@ -145,7 +158,8 @@ class NoiseControlsWidget(QWidget):
                 value = min_val + (slider.value() / resolution) * (max_val - min_val)
                 params[param_name] = value
                 
-        # Update all parameters at once
+        # Update all parameters at once, after any queued slider changes
+        self._flush_updates()
         self._update_parameters(params)
     
     def _update_parameters(self, params: Dict[str, Any]):
@@ -1,12 +1,16 @@
 from PyQt6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout
 from core.parameters.noise_parameters import NoiseParameters
+from core.audio.stream_config import StreamConfig
+from core.parameters.update_coalescer import UpdateCoalescer
 from gui.PyQt_gui import NoiseControlsWidget
 from gui.waveform_view import WaveformView
+from gui.spectrogram_view import SpectrogramView
 
 class MainWindow(QMainWindow):
     """Main application window."""
     
-    def __init__(self, parameters: NoiseParameters):
+    def __init__(self, parameters: NoiseParameters, stream_config: StreamConfig = None,
+                 coalescer: UpdateCoalescer = None):
         super().__init__()
         self.setWindowTitle("Noise Playground")
         self.resize(800, 600)
@@ -21,14 +25,24 @@ class MainWindow(QMainWindow):
         left_layout = QVBoxLayout(left_panel)
         
         # Add noise controls
-        controls = NoiseControlsWidget(parameters)
-        left_layout.addWidget(controls)
+        self.controls = NoiseControlsWidget(parameters, coalescer)
+        left_layout.addWidget(self.controls)
         left_layout.addStretch()  # Push controls to top
         
+        # Create right panel with spectrum above spectrogram
+        right_panel = QWidget()
+        right_layout = QVBoxLayout(right_panel)
+        right_layout.setContentsMargins(0, 0, 0, 0)
+        
         # Create waveform view and register as observer
-        self.waveform_view = WaveformView()
+        self.waveform_view = WaveformView(stream_config)
         parameters.attach(self.waveform_view)
+        right_layout.addWidget(self.waveform_view, stretch=3)
+        
+        # Create spectrogram view; fed from the same audio tap as the waveform view
+        self.spectrogram_view = SpectrogramView(stream_config)
+        right_layout.addWidget(self.spectrogram_view, stretch=2)
         
         # Add widgets to main layout
         main_layout.addWidget(left_panel, stretch=1)  # Controls take 1/4 of width
-        main_layout.addWidget(self.waveform_view, stretch=3)  # Waveform takes 3/4 of width
+        main_layout.addWidget(right_panel, stretch=3)  # Views take 3/4 of width
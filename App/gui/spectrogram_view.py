@@ -0,0 +1,61 @@
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+from PyQt6.QtCore import QTimer, QRectF
+import pyqtgraph as pg
+from core.audio.stream_config import StreamConfig, DEFAULT_STREAM_CONFIG
+from core.audio.ring_buffer import SampleRingBuffer
+from core.visualization.spectrogram import IncrementalSTFT
+from typing import Optional
+
+class SpectrogramView(QWidget):
+    """Scrolling spectrogram (waterfall) of the audio output."""
+
+    def __init__(self, stream_config: Optional[StreamConfig] = None, history: int = 512):
+        super().__init__()
+        self.stream_config = stream_config or DEFAULT_STREAM_CONFIG
+        self.stft = IncrementalSTFT(self.stream_config.sample_rate, history=history)
+        self.tap = None
+
+        # Set up update timer
+        self.update_timer = QTimer()
+        self.update_timer.timeout.connect(self._update_image)
+        self.update_timer.start(50)  # 20 FPS
+
+        self._setup_ui()
+
+    def _setup_ui(self):
+        """Setup the user interface."""
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.plot_widget = pg.PlotWidget()
+        self.plot_widget.setBackground('#2b2b2b')
+        self.plot_widget.setMouseEnabled(x=False, y=False)
+        self.plot_widget.getViewBox().setMenuEnabled(False)
+        label_style = {'color': '#8f8f8f', 'font-size': '10pt'}
+        self.plot_widget.setLabel('left', 'Hz', **label_style)
+        self.plot_widget.setLabel('bottom', 's', **label_style)
+
+        # Image rows are time (oldest first), columns are frequency bins
+        self.image_item = pg.ImageItem(axisOrder='row-major')
+        self.image_item.setLookupTable(pg.colormap.get('inferno').getLookupTable(nPts=256))
+        self.image_item.setImage(self.stft.image.T, autoLevels=False, levels=(0, 255))
+        duration = self.stft.history * self.stft.column_duration
+        self.image_item.setRect(QRectF(-duration, 0, duration, self.stream_config.sample_rate / 2))
+        self.plot_widget.addItem(self.image_item)
+        self.plot_widget.setYRange(0, min(20000, self.stream_config.sample_rate / 2))
+
+        layout.addWidget(self.plot_widget)
+        self.setLayout(layout)
+
+    def attach_tap(self, tap: SampleRingBuffer):
+        """Set the ring buffer the audio stream writes samples into."""
+        self.tap = tap
+        self.stft.reset()
+
+    def _update_image(self):
+        """Add the STFT columns for audio that arrived since the last tick."""
+        if self.tap is None or not self.isVisible():
+            return
+        if self.stft.update(self.tap):
+            # Transposed view of the ring; no copy of the history is made
+            self.image_item.setImage(self.stft.image.T, autoLevels=False, levels=(0, 255))
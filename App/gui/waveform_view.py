@@ -1,42 +1,51 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox
 from PyQt6.QtCore import QTimer
 import pyqtgraph as pg
 import numpy as np
-from core.parameters.observer import Observer
+from core.parameters.observer import ChangeObserver, ChangeSet
+from core.audio.stream_config import StreamConfig, DEFAULT_STREAM_CONFIG
+from core.audio.ring_buffer import SampleRingBuffer
+from core.visualization.spectrum_analyzer import SpectrumAnalyzer, FFT_SIZES
+from core.visualization.octave_smoothing import OCTAVE_FRACTIONS
+from types import MappingProxyType
+from typing import Optional
 from core.visualization.implementations import BandpassResponseVisualizer, CascadedLowpassResponseV2Visualizer, CascadedLowpassResponseVisualizer
 
-class WaveformView(QWidget, Observer):
+class WaveformView(QWidget, ChangeObserver):
     """Widget for displaying frequency domain analysis and filter response."""
     
-    def __init__(self):
+    # Only filter settings affect the response curve
+    subscribed_keys = frozenset({'filter_type', 'cutoff', 'resonance', 'bandwidth', 'poles'})
+    
+    def __init__(self, stream_config: Optional[StreamConfig] = None):
         QWidget.__init__(self)
-        Observer.__init__(self)
-        
-        # Buffer for storing waveform data
-        self.buffer_size = 2048
-        self.waveform_buffer = np.zeros(self.buffer_size)
+        ChangeObserver.__init__(self)
+        self.stream_config = stream_config or DEFAULT_STREAM_CONFIG
         
         # Frequency domain settings
-        self.sample_rate = 44100
-        self.freq_data = np.fft.rfftfreq(self.buffer_size, d=1.0/self.sample_rate)
+        self.sample_rate = self.stream_config.sample_rate
+        self.analyzer = SpectrumAnalyzer(self.sample_rate, segments=4, averaging=0.5, octave_fraction=6)
+        
+        # Buffer for storing waveform data, filled from the audio tap on the GUI timer
+        self.tap = None
+        self.last_read_position = 0
+        self._resize_buffer()
         
         # Filter visualization
         self.filter_visualizers = {
-            'bandpass': BandpassResponseVisualizer(),
-            'cascaded': CascadedLowpassResponseVisualizer(),
-            'cascaded_v2': CascadedLowpassResponseV2Visualizer()
+            'bandpass': BandpassResponseVisualizer(self.sample_rate),
+            'cascaded': CascadedLowpassResponseVisualizer(self.sample_rate),
+            'cascaded_v2': CascadedLowpassResponseV2Visualizer(self.sample_rate)
         }
         self.current_visualizer = self.filter_visualizers['bandpass']  # Default
         self.current_parameters = {}
+        self.response_freqs = np.logspace(np.log10(20), np.log10(20000), 1000)
         
         # Set up update timer
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self._update_plot)
         self.update_timer.start(50)  # 20 FPS
         
-        # Flag for new data
-        self.has_new_data = False
-        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -44,6 +53,26 @@ class WaveformView(QWidget, Observer):
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         
+        # FFT size selector: larger sizes resolve low frequencies better
+        analysis_layout = QHBoxLayout()
+        analysis_layout.addWidget(QLabel("FFT Size"))
+        self.fft_size_combo = QComboBox()
+        self.fft_size_combo.addItems([str(size) for size in FFT_SIZES])
+        self.fft_size_combo.setCurrentText(str(self.analyzer.plan.fft_size))
+        self.fft_size_combo.currentTextChanged.connect(lambda text: self.set_fft_size(int(text)))
+        analysis_layout.addWidget(self.fft_size_combo)
+        
+        # Fractional-octave smoothing selector
+        analysis_layout.addWidget(QLabel("Smoothing"))
+        self.smoothing_combo = QComboBox()
+        self.smoothing_combo.addItems([f"1/{fraction} oct" for fraction in OCTAVE_FRACTIONS])
+        self.smoothing_combo.setCurrentText(f"1/{self.analyzer.octave_fraction} oct")
+        self.smoothing_combo.currentIndexChanged.connect(
+            lambda index: self.set_octave_fraction(OCTAVE_FRACTIONS[index]))
+        analysis_layout.addWidget(self.smoothing_combo)
+        analysis_layout.addStretch()
+        layout.addLayout(analysis_layout)
+        
         # Create plot widget with dark theme
         self.plot_widget = pg.PlotWidget()
         self.plot_widget.setBackground('#2b2b2b')
@@ -102,63 +131,71 @@ class WaveformView(QWidget, Observer):
         self.setLayout(layout)
         
         # Initialize filter response with defaults after UI setup
-        self.update({
+        defaults = {
             'generator_type': 'White Noise',
             'filter_type': 'Bandpass',
             'volume': 0.5,
             'cutoff': 0.5,
             'bandwidth': 0.5
-        })
+        }
+        self.on_changes(ChangeSet(defaults, 0, MappingProxyType(defaults)))
     
-    def update_waveform(self, data: np.ndarray):
-        """Update the waveform display with new data."""
-        if not self.isVisible():
-            return
-            
-        # Update buffer with new data
-        self.waveform_buffer = np.roll(self.waveform_buffer, -len(data))
-        self.waveform_buffer[-len(data):] = data
-        self.has_new_data = True
+    def attach_tap(self, tap: SampleRingBuffer):
+        """Set the ring buffer the audio stream writes displayed samples into."""
+        self.tap = tap
+        self.last_read_position = tap.written
+        self._resize_buffer()
+    
+    def _resize_buffer(self):
+        """Size the sample buffer for the analyzer, within what the tap keeps."""
+        size = self.analyzer.samples_needed
+        if self.tap is not None:
+            size = min(size, self.tap.capacity)
+        self.waveform_buffer = np.zeros(size)
     
-    def update(self, parameters: dict):
-        """Update from NoiseParameters (Observer pattern)."""
-        # Store parameters
-        self.current_parameters = parameters.copy()
+    def set_fft_size(self, fft_size: int):
+        """Change the analysis FFT size."""
+        self.analyzer.configure(fft_size=fft_size)
+        self._resize_buffer()
+        self.last_read_position = -1  # Redraw on the next tick
+    
+    def set_octave_fraction(self, fraction: int):
+        """Change the 1/N-octave smoothing of the spectrum curve."""
+        self.analyzer.configure(octave_fraction=fraction)
+        self.last_read_position = -1  # Redraw on the next tick
+    
+    def on_changes(self, change_set: ChangeSet):
+        """Update from NoiseParameters when a filter setting changes."""
+        # Store the current filter settings
+        self.current_parameters = {
+            name: value for name, value in change_set.parameters.items() if name in self.subscribed_keys
+        }
         
         # Update current visualizer based on filter type
-        filter_type = parameters.get('filter_type', 'bandpass').lower()
-        if filter_type in self.filter_visualizers:
-            self.current_visualizer = self.filter_visualizers[filter_type]
+        if 'filter_type' in change_set.changes:
+            filter_type = change_set.changes['filter_type'].lower()
+            if filter_type in self.filter_visualizers:
+                self.current_visualizer = self.filter_visualizers[filter_type]
         
         self._update_filter_response()
     
     def _update_filter_response(self):
         """Update the filter response curve."""
-        # Generate frequency response points
-        freqs = np.logspace(np.log10(20), np.log10(20000), 1000)
-        
         # Calculate response using current visualizer
-        response_db = self.current_visualizer.calculate_response(freqs, self.current_parameters)
+        response_db = self.current_visualizer.calculate_response(self.response_freqs, self.current_parameters)
         
         # Update filter curve
-        self.filter_curve.setData(freqs, response_db)
+        self.filter_curve.setData(self.response_freqs, response_db)
     
     def _update_plot(self):
         """Update the plot if there's new data."""
-        if self.has_new_data and self.isVisible():
-            # Apply window function to reduce spectral leakage
-            window = np.hanning(len(self.waveform_buffer))
-            windowed_data = self.waveform_buffer * window
-            
-            # Compute FFT
-            fft = np.abs(np.fft.rfft(windowed_data))
-            
-            # Convert to dB with proper scaling and smoothing
-            fft_smoothed = np.convolve(fft, np.hanning(5)/5, mode='same')  # Smooth the spectrum
-            fft_db = 20 * np.log10(np.clip(fft_smoothed * 2, 1e-3, None))  # *2 to match RMS scaling
-            fft_db = np.clip(fft_db, -60, 24)  # Allow peaks up to +6dB
+        if self.tap is None or self.tap.written == self.last_read_position or not self.isVisible():
+            return
             
-            # Update spectrum curve (skip DC and nyquist)
-            valid_freqs = (self.freq_data > 20) & (self.freq_data < 20000)
-            self.spectrum_curve.setData(self.freq_data[valid_freqs], fft_db[valid_freqs])
-            self.has_new_data = False
+        # Pull the newest samples written by the audio thread
+        self.last_read_position = self.tap.written
+        self.tap.read_latest(self.waveform_buffer)
+        
+        # Averaged spectrum in dB over the display range (skips DC and nyquist)
+        freqs, levels = self.analyzer.analyze(self.waveform_buffer)
+        self.spectrum_curve.setData(freqs, levels)
@@ -0,0 +1,80 @@
+from core.audio.audio_engine import AudioEngine
+from core.audio.realtime_gc import GC_MODES, RealtimeGC
+from core.audio.stream_config import StreamConfig
+from core.audio.thread_priority import policy_from_args
+from core.diagnostics.sampling_profiler import SamplingProfiler
+from core.processors.processor_registry import register_processors
+from core.server.pcm_server import PCMServer, SAMPLE_FORMATS, SLOW_CLIENT_POLICIES
+import argparse
+import asyncio
+import logging
+import signal
+
+def parse_args():
+    """Parse command line options for the headless server."""
+    parser = argparse.ArgumentParser(description="Stream noise to local clients without a sound card.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5510, help="PCM data port")
+    parser.add_argument("--unix", help="Also serve PCM data on this Unix socket path")
+    parser.add_argument("--control-port", type=int, default=5511, help="JSON control port")
+    parser.add_argument("--control-unix", help="Also accept control messages on this Unix socket path")
+    parser.add_argument("--block-size", type=int, default=2048)
+    parser.add_argument("--sample-rate", type=int, default=44100)
+    parser.add_argument("--format", choices=SAMPLE_FORMATS, default="float32")
+    parser.add_argument("--queue-size", type=int, default=8, help="Blocks buffered per client")
+    parser.add_argument("--slow-client-policy", choices=SLOW_CLIENT_POLICIES, default="drop_oldest")
+    parser.add_argument("--gc-mode", choices=GC_MODES, default="default",
+                        help="Keep garbage collection out of rendered blocks (see core.audio.realtime_gc)")
+    parser.add_argument("--cpus", help="Pin the render thread to these cores, e.g. 2,3 or 4-7")
+    parser.add_argument("--rt-priority", type=int, help="Request SCHED_FIFO at this priority (1-99) for the render thread")
+    parser.add_argument("--nice", type=int, help="Nice value for the render thread if SCHED_FIFO is not used")
+    parser.add_argument("--profile-dir", default=".", help="Where SIGUSR1 sampling profiles are written")
+    return parser.parse_args()
+
+async def serve(args):
+    """Run the PCM server until interrupted."""
+    register_processors()
+    stream_config = StreamConfig(sample_rate=args.sample_rate, block_size=args.block_size)
+    gc_control = RealtimeGC(args.gc_mode)
+    server = PCMServer(
+        AudioEngine(stream_config=stream_config),  # Uses default noise+bandpass config
+        stream_config,
+        default_format=args.format,
+        queue_size=args.queue_size,
+        slow_client_policy=args.slow_client_policy,
+        gc_control=gc_control,
+        thread_policy=policy_from_args(args.cpus, args.rt_priority, args.nice)
+    )
+    await server.start(
+        host=args.host,
+        port=args.port,
+        unix_path=args.unix,
+        control_host=args.host,
+        control_port=args.control_port,
+        control_unix_path=args.control_unix
+    )
+    logging.info(f"Serving PCM on {server.addresses}")
+    gc_control.install()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    
+    # `kill -USR1 <pid>` starts sampling the render thread; a second signal writes the profile
+    sampling_profiler = SamplingProfiler(output_dir=args.profile_dir)
+    loop.add_signal_handler(signal.SIGUSR1, sampling_profiler.toggle)
+    try:
+        await stop.wait()
+    finally:
+        sampling_profiler.stop()
+        await server.stop()
+        gc_control.uninstall()
+        logging.info(gc_control.snapshot().describe())
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    asyncio.run(serve(parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -1,45 +1,123 @@
 from core.audio.audio_engine import AudioEngine
 from core.audio.audio_stream import AudioStream
+from core.audio.stream_config import DEFAULT_STREAM_CONFIG, get_preset, validate_stream_config
 from core.audio.audio_parameter_observer import AudioParameterObserver
+from core.audio.realtime_gc import RealtimeGC
+from core.audio.thread_priority import policy_from_args
+from core.diagnostics.callback_metrics import MetricsReporter
+from core.diagnostics.sampling_profiler import SamplingProfiler
 from core.parameters.noise_parameters import NoiseParameters
+from core.parameters.update_coalescer import UpdateCoalescer
+from core.processors.processor_factory import AudioProcessorFactory
 from core.processors.processor_registry import register_processors
-from gui.main_window import MainWindow
-from PyQt6.QtWidgets import QApplication
+import logging
 import signal
 import sys
 
+# Written on exit when started with --profile; open in chrome://tracing or Perfetto
+PROFILE_TRACE_PATH = "processor_profile.json"
+
 def signal_handler(signum, frame):
     """Handle interrupt signals gracefully."""
     print("\nSignal received. Cleaning up...")
     sys.exit(0)
 
+def choose_stream_config():
+    """Use the low-latency preset if requested and this machine keeps up with it."""
+    if "--low-latency" not in sys.argv:
+        return DEFAULT_STREAM_CONFIG
+    
+    candidate = get_preset("low_latency")
+    validation = validate_stream_config(candidate, AudioEngine(stream_config=candidate).generate_noise)
+    print(validation.describe())
+    if validation.passed:
+        return candidate
+    print("Low-latency settings too demanding, falling back to defaults")
+    return DEFAULT_STREAM_CONFIG
+
+def option_value(name: str, default=None):
+    """Value of a --name=value command-line argument."""
+    for arg in sys.argv:
+        if arg.startswith(f"--{name}="):
+            return arg.split("=", 1)[1]
+    return default
+
+def choose_gc_mode() -> str:
+    """GC mode from a --gc-mode=<default|freeze|deferred> argument."""
+    return option_value("gc-mode", "default")
+
+def choose_thread_policy():
+    """Audio thread policy from --cpus=2,3, --rt-priority=N and --nice=N arguments."""
+    priority, nice = option_value("rt-priority"), option_value("nice")
+    return policy_from_args(
+        option_value("cpus"),
+        int(priority) if priority is not None else None,
+        int(nice) if nice is not None else None
+    )
+
 def main():
     # Set up signal handling for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
     
-    # Initialize Qt Application
-    app = QApplication(sys.argv)
-    
-    # Register available processors
+    # Register available processors (metadata only; classes load on first use)
     register_processors()
     
     # Create components
+    stream_config = choose_stream_config()
     parameters = NoiseParameters()
-    audio_engine = AudioEngine()  # Uses default noise+bandpass config
+    audio_engine = AudioEngine(stream_config=stream_config)  # Uses default noise+bandpass config
+    logging.getLogger(__name__).info("Execution plan: %s", audio_engine.describe_plan())
+    
+    # Warm the other filters in the background so switching to one from the
+    # filter selector (AudioParameterObserver -> select_filter) is as fast as steady state
+    AudioProcessorFactory.prewarm_in_background([
+        registration.name for registration in AudioProcessorFactory.get_processors_by_category("filter")
+        if registration.name not in audio_engine.processor_types
+    ])
+    
+    if "--profile" in sys.argv:
+        audio_engine.enable_profiling()
+    
+    # Import the GUI toolkit only once the audio side is set up
+    from PyQt6.QtWidgets import QApplication
+    from gui.main_window import MainWindow
+    
+    # Initialize Qt Application
+    app = QApplication(sys.argv)
     
     # Create and show main window first to have access to waveform view
-    window = MainWindow(parameters)
+    # Validated slider drags reach the engine immediately; observers run once per frame, and a
+    # rejected frame puts the engine back on the parameter model's values
+    coalescer = UpdateCoalescer(
+        parameters.update_parameters,
+        fast_path=audio_engine.apply_changes,
+        validate=parameters.validate,
+        restore=lambda: audio_engine.set_parameters(**parameters.parameters)
+    )
+    window = MainWindow(parameters, stream_config, coalescer)
     window.show()
     
     # Create audio stream with waveform view
-    audio_stream = AudioStream(lambda x: None, window.waveform_view)
+    gc_control = RealtimeGC(choose_gc_mode())
+    audio_stream = AudioStream(lambda x: None, window.waveform_view, stream_config, gc_control=gc_control,
+                               thread_policy=choose_thread_policy())
+    window.spectrogram_view.attach_tap(audio_stream.waveform_tap)
     audio_observer = AudioParameterObserver(audio_engine, audio_stream)
     parameters.attach(audio_observer)
+    metrics_reporter = MetricsReporter(audio_stream.metrics)
+    
+    # `kill -USR1 <pid>` starts sampling the audio thread; a second signal writes the profile
+    sampling_profiler = SamplingProfiler()
+    sampling_profiler.add_thread("AudioCallback", lambda: audio_stream.callback_thread_ident)
+    sampling_profiler.install_signal_handler()
     
     try:
         
-        # Start audio processing
+        # Start audio processing; startup objects are frozen before the first block
+        gc_control.install()
         audio_observer.start()
+        metrics_reporter.start()
         
         # Run Qt event loop
         app.exec()
@@ -48,7 +126,17 @@ def main():
         print(f"Error: {e}")
     finally:
         # Cleanup audio
+        metrics_reporter.stop()
+        sampling_profiler.stop()
         audio_observer.stop()
+        gc_control.uninstall()
+        logging.getLogger(__name__).info(gc_control.snapshot().describe())
+        logging.getLogger(__name__).info(coalescer.describe())
+        profiler = audio_engine.disable_profiling()
+        if profiler is not None:
+            profiler.export_chrome_trace(PROFILE_TRACE_PATH)
+            logging.getLogger(__name__).info("Processor profile (trace in %s):\n%s",
+                                             PROFILE_TRACE_PATH, profiler.describe())
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Benchmark every registered processor and the canonical chains, or compare two runs for regressions."""
+from pathlib import Path
+import argparse
+import json
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from App.core.diagnostics.benchmark import (
+    BLOCK_SIZES, CANONICAL_CHAINS, DTYPES, compare_results, from_json, run_suite, to_json
+)
+from App.core.processors.processor_registry import register_processors
+
+def print_result(result):
+    print(f"{result.kind:9} {result.name:24} {result.block_size:5} {result.dtype:7} "
+          f"{result.throughput / 1e6:8.2f} Msamples/s  p50 {result.latency['p50'] * 1e6:8.1f} us  "
+          f"p99 {result.latency['p99'] * 1e6:8.1f} us  {result.alloc_peak_bytes:8d} B/block")
+
+def run(args) -> int:
+    """Run the suite, write JSON, and optionally compare with a baseline."""
+    register_processors()
+    chains = CANONICAL_CHAINS if not args.no_chains else ()
+    results = run_suite(
+        processors=args.processors,
+        chains=chains,
+        block_sizes=args.block_sizes,
+        dtypes=args.dtypes,
+        progress=print_result,
+        min_time=args.min_time
+    )
+    if args.output:
+        Path(args.output).write_text(json.dumps(to_json(results), indent=2))
+        print(f"wrote {len(results)} results to {args.output}")
+    if args.baseline:
+        return report(from_json(json.loads(Path(args.baseline).read_text())), results, args.threshold)
+    return 0
+
+def compare(args) -> int:
+    """Compare two stored runs."""
+    baseline = from_json(json.loads(Path(args.baseline).read_text()))
+    current = from_json(json.loads(Path(args.current).read_text()))
+    return report(baseline, current, args.threshold)
+
+def report(baseline, current, threshold: float) -> int:
+    regressions = compare_results(baseline, current, threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression.describe()}")
+    print(f"{len(regressions)} regression(s) beyond {threshold:.0%}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmark suite")
+    run_parser.add_argument("--processors", nargs="+", help="Processor names (default: all registered)")
+    run_parser.add_argument("--block-sizes", nargs="+", type=int, default=list(BLOCK_SIZES))
+    run_parser.add_argument("--dtypes", nargs="+", default=list(DTYPES), choices=DTYPES)
+    run_parser.add_argument("--no-chains", action="store_true", help="Skip the processor chains")
+    run_parser.add_argument("--min-time", type=float, default=0.2, help="Seconds of timing per measurement")
+    run_parser.add_argument("--output", help="Write results as JSON")
+    run_parser.add_argument("--baseline", help="Compare against this stored run")
+    run_parser.add_argument("--threshold", type=float, default=0.10, help="Allowed relative slowdown")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="Compare two stored runs")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="Allowed relative slowdown")
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args()
+    sys.exit(args.handler(args))
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Stream through the virtual device while another thread churns cyclic garbage, per GC mode."""
+from collections import deque
+from pathlib import Path
+import argparse
+import json
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+def churn(stop: threading.Event, rate: int):
+    """Allocate reference cycles like a busy GUI thread, `rate` per millisecond.
+
+    The most recent ones are kept alive for a while, so some survive into
+    the oldest generation and eventually trigger full collections.
+    """
+    recent = deque(maxlen=rate * 200)
+    while not stop.is_set():
+        for _ in range(rate):
+            node = {"items": [1, 2, 3]}
+            node["self"] = node
+            recent.append(node)
+        time.sleep(0.001)
+
+def measure(mode: str, args) -> dict:
+    """Run one mode (in a fresh process, as freezing is process-wide)."""
+    from App.core.audio.audio_engine import AudioEngine
+    from App.core.audio.audio_stream import AudioStream
+    from App.core.audio.output_backend import VirtualOutputBackend
+    from App.core.audio.realtime_gc import RealtimeGC
+    from App.core.audio.stream_config import StreamConfig
+    from App.core.processors.processor_registry import register_processors
+
+    register_processors(plugins=False)
+    # Long-lived state the collector has to traverse on every full collection
+    heap = [{"index": index, "values": [index] * 4} for index in range(args.heap_objects)]
+
+    stream_config = StreamConfig(block_size=args.block_size)
+    engine = AudioEngine(stream_config=stream_config)
+    backend = VirtualOutputBackend(realtime=True, max_blocks=args.blocks, record=False)
+    gc_control = RealtimeGC(mode)
+    stream = AudioStream(engine.generate_noise, config=stream_config, backend=backend, gc_control=gc_control)
+
+    stop = threading.Event()
+    churner = threading.Thread(target=churn, args=(stop, args.churn_rate), daemon=True, name="ChurnThread")
+    gc_control.install()
+    churner.start()
+    stream.start()
+    backend.wait()
+    stream.stop()
+    stop.set()
+    churner.join()
+    gc_control.uninstall()
+
+    metrics = stream.metrics.snapshot()
+    snapshot = gc_control.snapshot()
+    return {
+        "heap": len(heap),
+        "blocks": metrics.blocks,
+        "misses": metrics.deadline_misses,
+        "underflows": backend.stream.underflows,
+        "render_max": metrics.render_ms["max"],
+        "collections": snapshot.pauses,
+        "in_blocks": snapshot.pauses_in_blocks,
+        "pause_max": snapshot.pause_ms.get("max", 0.0),
+        "misses_with_gc": snapshot.misses_with_gc,
+    }
+
+def run_benchmark(args) -> None:
+    """Run every mode in a fresh interpreter and print the results."""
+    print(f"{args.blocks} blocks of {args.block_size} frames, {args.heap_objects} long-lived objects, "
+          f"{args.churn_rate} cycles/ms of garbage")
+    print(f"{'mode':<10}{'misses':>8}{'underflows':>12}{'render max':>12}{'GCs':>7}"
+          f"{'in blocks':>11}{'pause max':>11}{'GC misses':>11}")
+    for mode in args.modes:
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", mode, "--blocks", str(args.blocks),
+             "--block-size", str(args.block_size), "--heap-objects", str(args.heap_objects),
+             "--churn-rate", str(args.churn_rate)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.splitlines()[-1])
+        print(f"{mode:<10}{result['misses']:>8}{result['underflows']:>12}{result['render_max']:>10.2f}ms"
+              f"{result['collections']:>7}{result['in_blocks']:>11}{result['pause_max']:>9.2f}ms"
+              f"{result['misses_with_gc']:>11}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modes", nargs="+", default=["default", "freeze", "deferred"])
+    parser.add_argument("--blocks", type=int, default=400)
+    parser.add_argument("--block-size", type=int, default=512)
+    parser.add_argument("--heap-objects", type=int, default=500000)
+    parser.add_argument("--churn-rate", type=int, default=200, help="Reference cycles created per millisecond")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        print(json.dumps(measure(args.child, args)))
+    else:
+        run_benchmark(args)
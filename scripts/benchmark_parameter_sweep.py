@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Compare ParameterSweep against running one filter instance per parameter set."""
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+from App.core.processors.processor_registry import register_processors
+from App.core.analysis.parameter_sweep import ParameterSweep, sequential_sweep
+
+def build_grid(filter_type: str, n_params: int) -> dict:
+    """Build a cutoff sweep with the filter's other parameters fixed."""
+    grid = {"cutoff": np.linspace(0.0, 1.0, n_params)}
+    if filter_type == "bandpass":
+        grid["bandwidth"] = 0.5
+    else:
+        grid["resonance"] = 0.3
+        grid["poles"] = 2
+    return grid
+
+def run_benchmark(filter_types, n_params: int, frames: int, block_size: int) -> None:
+    """Time sweep vs sequential rendering and print the speedup per filter."""
+    register_processors()
+    print(f"{n_params} parameter sets, {frames} frames, block size {block_size}")
+    print(f"{'filter':<14}{'sequential (s)':>16}{'sweep (s)':>12}{'speedup':>10}{'max |diff|':>14}")
+    for filter_type in filter_types:
+        grid = build_grid(filter_type, n_params)
+
+        start = time.perf_counter()
+        reference = sequential_sweep(filter_type, grid, frames, block_size=block_size)
+        sequential_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = ParameterSweep(filter_type, grid).run(frames, block_size=block_size)
+        sweep_time = time.perf_counter() - start
+
+        max_diff = np.max(np.abs(result.output - reference))
+        print(f"{filter_type:<14}{sequential_time:>16.3f}{sweep_time:>12.3f}"
+              f"{sequential_time / sweep_time:>9.1f}x{max_diff:>14.2e}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--filters", nargs="+", default=["bandpass", "cascaded", "cascaded_v2"])
+    parser.add_argument("--params", type=int, default=256, help="Number of parameter sets")
+    parser.add_argument("--frames", type=int, default=8192)
+    parser.add_argument("--block-size", type=int, default=2048)
+    args = parser.parse_args()
+    run_benchmark(args.filters, args.params, args.frames, args.block_size)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Compare per-update validation cost of the compiled schema with the previous dict-lookup validator."""
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from App.core.parameters.common_parameters import COMMON_PARAMS
+from App.core.parameters.parameter_schema import ParameterSchema
+
+def dict_lookup_validate(definitions: dict, parameters: dict) -> dict:
+    """The validator NoiseParameters, ParameterRegistry and the factory each used to carry."""
+    validated = {}
+    for name, value in parameters.items():
+        if name not in definitions:
+            raise KeyError(f"Unknown parameter: {name}")
+        param_def = definitions[name]
+        if param_def["type"] == "float" and not isinstance(value, (int, float)):
+            raise TypeError(f"Parameter '{name}' must be a number")
+        elif param_def["type"] == "int" and not isinstance(value, int):
+            raise TypeError(f"Parameter '{name}' must be an integer")
+        elif param_def["type"] == "enum" and value not in param_def["enum_values"]:
+            raise ValueError(f"Invalid value for enum parameter '{name}': {value}")
+        if param_def["range"]:
+            if value < param_def["range"].min_value or value > param_def["range"].max_value:
+                raise ValueError(f"Parameter '{name}' value {value} is outside valid range")
+        validated[name] = value
+    return validated
+
+def time_per_update(validate, updates: list, repeats: int) -> float:
+    """Best-of-repeats time per validated update in microseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for update in updates:
+            validate(update)
+        best = min(best, time.perf_counter() - start)
+    return best / len(updates) * 1e6
+
+def run_benchmark(updates_count: int, batch_size: int, repeats: int) -> None:
+    """Time both validators on slider-style batches and print the results."""
+    names = ["cutoff", "resonance", "bandwidth", "poles", "volume"][:batch_size]
+    updates = [
+        {name: (step % 4 + 1 if name == "poles" else (step % 100) / 100) for name in names}
+        for step in range(updates_count)
+    ]
+    schema = ParameterSchema(COMMON_PARAMS)
+
+    before = time_per_update(lambda update: dict_lookup_validate(COMMON_PARAMS, update), updates, repeats)
+    after = time_per_update(schema.validate, updates, repeats)
+    print(f"{updates_count} updates of {len(names)} parameters, best of {repeats}")
+    print(f"{'validator':<14}{'us/update':>12}")
+    print(f"{'dict lookups':<14}{before:>12.2f}")
+    print(f"{'schema':<14}{after:>12.2f}")
+    print(f"speedup {before / after:.1f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--updates", type=int, default=100000)
+    parser.add_argument("--batch-size", type=int, default=5, help="Parameters per update (1-5)")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    run_benchmark(args.updates, args.batch_size, args.repeats)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Measure first-block latency after a filter switch, cold vs prewarmed, against steady state."""
+from pathlib import Path
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+def measure(filter_type: str, prewarm: bool, block_size: int, blocks: int) -> dict:
+    """Switch the engine's filter and time the first and following blocks (run in a fresh process)."""
+    from App.core.audio.audio_engine import AudioEngine
+    from App.core.audio.stream_config import StreamConfig
+    from App.core.processors.processor_factory import AudioProcessorFactory
+    from App.core.processors.processor_registry import register_processors
+
+    register_processors(plugins=False)
+    engine = AudioEngine(stream_config=StreamConfig(block_size=block_size))
+    engine.generate_noise(block_size)
+    if prewarm:
+        AudioProcessorFactory.prewarm([filter_type])
+
+    start = time.perf_counter()
+    engine.switch_processor(1, filter_type)
+    engine.generate_noise(block_size)
+    first = time.perf_counter() - start
+
+    steady = []
+    for _ in range(blocks):
+        start = time.perf_counter()
+        engine.generate_noise(block_size)
+        steady.append(time.perf_counter() - start)
+    return {"first": first, "steady": statistics.median(steady)}
+
+def run_benchmark(filters, block_size: int, blocks: int) -> None:
+    """Run each filter cold and prewarmed in fresh interpreters and print the results."""
+    print(f"block size {block_size}, steady state = median of {blocks} blocks (ms)")
+    print(f"{'filter':<14}{'mode':<10}{'first block':>13}{'steady':>10}{'first/steady':>14}")
+    for filter_type in filters:
+        for prewarm in (False, True):
+            output = subprocess.run(
+                [sys.executable, __file__, "--child", filter_type, "--block-size", str(block_size),
+                 "--blocks", str(blocks)] + (["--prewarm"] if prewarm else []),
+                capture_output=True, text=True, check=True
+            ).stdout
+            result = json.loads(output)
+            mode = "prewarm" if prewarm else "cold"
+            print(f"{filter_type:<14}{mode:<10}{result['first'] * 1000:>13.2f}{result['steady'] * 1000:>10.2f}"
+                  f"{result['first'] / result['steady']:>13.2f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--filters", nargs="+", default=["bandpass", "cascaded", "cascaded_v2"])
+    parser.add_argument("--block-size", type=int, default=2048)
+    parser.add_argument("--blocks", type=int, default=30)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--prewarm", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        print(json.dumps(measure(args.child, args.prewarm, args.block_size, args.blocks)))
+    else:
+        run_benchmark(args.filters, args.block_size, args.blocks)
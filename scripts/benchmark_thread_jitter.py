@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Measure render-thread wake-up jitter under synthetic CPU load, with and without pinning and SCHED_FIFO."""
+from pathlib import Path
+import argparse
+import multiprocessing
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from App.core.audio.audio_engine import AudioEngine
+from App.core.audio.stream_config import StreamConfig
+from App.core.audio.thread_priority import ThreadPolicy, apply_thread_policy, parse_cpus
+from App.core.processors.processor_registry import register_processors
+
+def burn(stop):
+    """Spin until stopped (one load process per core)."""
+    while not stop.is_set():
+        sum(range(10000))
+
+def measure(policy: ThreadPolicy, args) -> dict:
+    """Render paced blocks on a fresh thread with `policy` and record how late each one started."""
+    stream_config = StreamConfig(block_size=args.block_size)
+    engine = AudioEngine(stream_config=stream_config)
+    lateness = np.zeros(args.blocks)
+    render = np.zeros(args.blocks)
+    result = {}
+
+    def render_loop():
+        result["applied"] = apply_thread_policy(policy) if not policy.is_default else None
+        block_duration = stream_config.block_duration
+        next_due = time.monotonic() + block_duration
+        for index in range(args.blocks):
+            delay = next_due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            start = time.monotonic()
+            lateness[index] = start - next_due
+            engine.generate_noise(args.block_size)
+            render[index] = time.monotonic() - start
+            next_due += block_duration
+
+    thread = threading.Thread(target=render_loop, name="RenderThread")
+    thread.start()
+    thread.join()
+    late = lateness * 1000
+    return {
+        "applied": result["applied"],
+        "p50": np.percentile(late, 50),
+        "p99": np.percentile(late, 99),
+        "max": late.max(),
+        "misses": int(np.count_nonzero(lateness + render > stream_config.block_duration)),
+    }
+
+def run_benchmark(args) -> None:
+    """Run each configuration with and without load and print wake-up lateness."""
+    register_processors(plugins=False)
+    cpus = parse_cpus(args.cpus) if args.cpus else (max(os.sched_getaffinity(0)),)
+    configurations = [
+        ("unpinned", ThreadPolicy()),
+        ("pinned", ThreadPolicy(cpus=cpus)),
+        ("pinned+fifo", ThreadPolicy(cpus=cpus, realtime_priority=args.rt_priority)),
+    ]
+    load = args.load if args.load is not None else os.cpu_count()
+    print(f"{args.blocks} blocks of {args.block_size} frames, {load} load processes, pinning to {cpus}")
+    print(f"{'configuration':<14}{'load':<6}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}{'misses':>8}  applied")
+    for loaded in (False, True):
+        stop = multiprocessing.Event()
+        workers = [
+            multiprocessing.Process(target=burn, args=(stop,), daemon=True)
+            for _ in range(load if loaded else 0)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            for name, policy in configurations:
+                result = measure(policy, args)
+                applied = result["applied"].describe() if result["applied"] else "-"
+                print(f"{name:<14}{'yes' if loaded else 'no':<6}{result['p50']:>9.3f}{result['p99']:>9.3f}"
+                      f"{result['max']:>9.3f}{result['misses']:>8}  {applied}")
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.join()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--blocks", type=int, default=500)
+    parser.add_argument("--block-size", type=int, default=256)
+    parser.add_argument("--cpus", help="Cores to pin to (default: the last available core)")
+    parser.add_argument("--rt-priority", type=int, default=10)
+    parser.add_argument("--load", type=int, help="Busy processes for the loaded runs (default: one per core)")
+    run_benchmark(parser.parse_args())
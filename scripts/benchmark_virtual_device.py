@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Run the audio callback on the virtual output device and report deadline misses."""
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from App.core.audio.audio_engine import AudioEngine
+from App.core.audio.audio_stream import AudioStream
+from App.core.audio.output_backend import VirtualOutputBackend
+from App.core.audio.stream_config import StreamConfig
+from App.core.processors.processor_registry import register_processors
+
+def run_benchmark(args) -> None:
+    """Stream each filter chain through the virtual device and print callback statistics."""
+    register_processors()
+    stream_config = StreamConfig(sample_rate=args.sample_rate, block_size=args.block_size)
+    mode = f"realtime, {args.jitter * 1000:.2f} ms mean jitter" if args.realtime else "fast"
+    print(f"{args.blocks} blocks of {args.block_size} frames @ {args.sample_rate} Hz ({mode})")
+    print(f"{'filter':<14}{'wall (s)':>10}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+          f"{'p99 load':>10}{'misses':>8}{'underflows':>12}")
+    for filter_type in args.filters:
+        engine = AudioEngine(
+            {"processors": [{"type": "xorshift"}, {"type": filter_type}]},
+            stream_config
+        )
+        backend = VirtualOutputBackend(
+            realtime=args.realtime, jitter=args.jitter, max_blocks=args.blocks,
+            record=False, record_path=args.record, seed=args.seed
+        )
+        stream = AudioStream(engine.generate_noise, config=stream_config, backend=backend)
+
+        start = time.perf_counter()
+        stream.start()
+        backend.wait()
+        elapsed = time.perf_counter() - start
+        stream.stop()
+
+        snapshot = stream.metrics.snapshot()
+        print(f"{filter_type:<14}{elapsed:>10.2f}{snapshot.render_ms['p50']:>9.3f}"
+              f"{snapshot.render_ms['p99']:>9.3f}{snapshot.render_ms['max']:>9.3f}"
+              f"{snapshot.utilisation['p99']:>10.1%}{snapshot.deadline_misses:>8}"
+              f"{backend.stream.underflows:>12}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--filters", nargs="+", default=["bandpass", "cascaded", "cascaded_v2"])
+    parser.add_argument("--blocks", type=int, default=500)
+    parser.add_argument("--block-size", type=int, default=2048)
+    parser.add_argument("--sample-rate", type=int, default=44100)
+    parser.add_argument("--realtime", action="store_true", help="Pace callbacks at the device rate")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Mean scheduling delay in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--record", help="Append rendered samples to this raw file")
+    run_benchmark(parser.parse_args())
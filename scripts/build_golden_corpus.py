@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Render the golden-output corpus, or check current output against the stored one."""
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from App.core.analysis.golden_corpus import CORPUS_PATH, GoldenCorpus, build_corpus, verify_corpus
+from App.core.processors.processor_registry import register_processors
+
+def run(args) -> int:
+    """Build or check the corpus. Returns the process exit code."""
+    register_processors(plugins=False)
+    path = Path(args.path)
+    start = time.perf_counter()
+
+    if args.check:
+        if not path.exists():
+            print(f"no corpus at {path}")
+            return 1
+        corpus = GoldenCorpus.load(path)
+        mismatches = verify_corpus(corpus, exact=args.exact)
+        for mismatch in mismatches:
+            print(f"{mismatch.name}: {mismatch.reason} (max error {mismatch.max_error:.3g}, "
+                  f"tolerance {mismatch.tolerance:.3g})")
+        print(f"{len(corpus.entries) - len(mismatches)}/{len(corpus.entries)} cases match "
+              f"in {time.perf_counter() - start:.1f}s")
+        return 1 if mismatches else 0
+
+    corpus = build_corpus(stride=args.stride)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    corpus.save(path)
+    for name, entry in corpus.entries.items():
+        print(f"{name:32} {entry.digest}  {entry.dtype}")
+    print(f"{len(corpus.entries)} cases in {time.perf_counter() - start:.1f}s -> "
+          f"{path} ({path.stat().st_size / 1024:.0f} KiB)")
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--path", default=str(CORPUS_PATH))
+    parser.add_argument("--stride", type=int, default=16, help="Decimation of the stored reference arrays")
+    parser.add_argument("--check", action="store_true",
+                        help="Re-render and compare against the stored corpus instead of writing it")
+    parser.add_argument("--exact", action="store_true", help="With --check, require bit-exact output")
+    sys.exit(run(parser.parse_args()))
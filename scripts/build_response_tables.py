@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Measure filter responses over parameter grids and write the shipped .npz tables."""
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from App.core.analysis.characterisation import DEFAULT_GRIDS, characterise, compare_tables
+from App.core.processors.processor_registry import register_processors
+from App.core.visualization.response_table import ResponseTable, table_path
+
+def build_tables(args) -> int:
+    """Build (or check) each requested table. Returns the process exit code."""
+    register_processors()
+    status = 0
+    for filter_type in args.filters:
+        start = time.perf_counter()
+        table = characterise(filter_type, DEFAULT_GRIDS[filter_type], frames=args.frames, fft_size=args.fft_size)
+        elapsed = time.perf_counter() - start
+        path = table_path(filter_type)
+
+        if args.check:
+            if not path.exists():
+                print(f"{filter_type}: no shipped table at {path}")
+                status = 1
+                continue
+            # Round-trip through float16 like the shipped table
+            drift = compare_tables(ResponseTable.load(path), _as_stored(table))
+            verdict = "ok" if drift <= args.tolerance else "DRIFT"
+            print(f"{filter_type}: max difference {drift:.3f} dB (tolerance {args.tolerance} dB) -> {verdict}")
+            if drift > args.tolerance:
+                status = 1
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            table.save(path)
+            print(f"{filter_type}: {table.magnitude_db.size} points in {elapsed:.1f}s -> "
+                  f"{path} ({path.stat().st_size / 1024:.0f} KiB)")
+    return status
+
+def _as_stored(table: ResponseTable) -> ResponseTable:
+    """Apply the precision loss of saving."""
+    table.magnitude_db = table.magnitude_db.astype("float16").astype("float32")
+    return table
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--filters", nargs="+", default=sorted(DEFAULT_GRIDS), choices=sorted(DEFAULT_GRIDS))
+    parser.add_argument("--frames", type=int, default=2 ** 17)
+    parser.add_argument("--fft-size", type=int, default=8192)
+    parser.add_argument("--check", action="store_true",
+                        help="Re-measure and compare against the shipped tables instead of writing them")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed drift in dB for --check")
+    sys.exit(build_tables(parser.parse_args()))
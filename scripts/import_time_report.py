@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Report cold-start import cost of the headless entry paths (python -X importtime)."""
+from pathlib import Path
+import argparse
+import subprocess
+import sys
+
+APP_DIR = Path(__file__).resolve().parent.parent / "App"
+
+# Implementation modules register_processors used to import eagerly
+IMPLEMENTATIONS = [
+    "core.noise.implementations.xorshift",
+    "core.noise.implementations.fractal",
+    "core.filters.implementations.bandpass",
+    "core.filters.implementations.cascaded_onepole_lowpass",
+    "core.filters.implementations.cascaded_onepole_lowpass_v2",
+]
+
+REGISTER = "from core.processors.processor_registry import register_processors; register_processors()"
+
+SCENARIOS = {
+    "registry (builtin)": REGISTER.replace("register_processors()", "register_processors(plugins=False)"),
+    "registry (lazy)": REGISTER,
+    "registry (eager)": REGISTER + "".join(f"; import {module}" for module in IMPLEMENTATIONS),
+    "engine": REGISTER + "; from core.audio.audio_engine import AudioEngine; AudioEngine()",
+    "headless server": "import headless",
+}
+
+def measure(code: str):
+    """Run `code` in a fresh interpreter and parse its -X importtime output.
+
+    Returns:
+        (total cumulative microseconds, number of modules, [(self us, module)])
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=APP_DIR, capture_output=True, text=True, check=True)
+    total = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((int(self_us), name.strip()))
+        if not name.startswith("  "):  # Top-level import (one leading space only)
+            total += int(cumulative_us)
+    return total, len(modules), sorted(modules, reverse=True)
+
+def report(scenarios, repeats: int, top: int) -> None:
+    """Print the best-of-repeats import time of each scenario."""
+    print(f"{'scenario':<20}{'import ms':>11}{'modules':>9}")
+    for name in scenarios:
+        runs = [measure(SCENARIOS[name]) for _ in range(repeats)]
+        total, count, modules = min(runs, key=lambda run: run[0])
+        print(f"{name:<20}{total / 1000:>11.1f}{count:>9}")
+        for self_us, module in modules[:top]:
+            print(f"    {self_us / 1000:>8.1f} ms  {module}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per scenario; the fastest is reported")
+    parser.add_argument("--top", type=int, default=0, help="Also list the N slowest modules by self time")
+    args = parser.parse_args()
+    report(args.scenarios, args.repeats, args.top)
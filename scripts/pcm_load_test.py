@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Open many PCM clients against the headless server and report delivery rates."""
+from pathlib import Path
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+BYTES_PER_SAMPLE = {"float32": 4, "int16": 2}
+
+async def read_client(host: str, port: int, unix_path: str, sample_format: str,
+                      duration: float, slow: bool) -> int:
+    """Connect one client, read PCM for `duration` seconds and return bytes received."""
+    if unix_path:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    writer.write(json.dumps({"format": sample_format}).encode() + b"\n")
+    await writer.drain()
+
+    received = 0
+    deadline = time.monotonic() + duration
+    try:
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                chunk = await asyncio.wait_for(reader.read(65536), remaining)
+            except asyncio.TimeoutError:
+                break
+            if not chunk:
+                break
+            received += len(chunk)
+            if slow:
+                # Simulate a consumer that cannot keep up
+                await asyncio.sleep(0.5)
+    finally:
+        writer.close()
+    return received
+
+async def query_stats(host: str, control_port: int) -> dict:
+    """Ask the server's control socket for statistics."""
+    reader, writer = await asyncio.open_connection(host, control_port)
+    writer.write(b'{"command": "stats"}\n')
+    await writer.drain()
+    reply = json.loads(await reader.readline())
+    writer.close()
+    return reply.get("stats", {})
+
+async def run_load_test(args) -> None:
+    """Run the load test, optionally hosting the server in-process."""
+    server = None
+    host, port, control_port = args.host, args.port, args.control_port
+    if args.spawn:
+        from App.core.audio.audio_engine import AudioEngine
+        from App.core.audio.stream_config import StreamConfig
+        from App.core.processors.processor_registry import register_processors
+        from App.core.server.pcm_server import PCMServer
+        register_processors()
+        stream_config = StreamConfig(sample_rate=args.sample_rate, block_size=args.block_size)
+        server = PCMServer(AudioEngine(stream_config=stream_config), stream_config)
+        await server.start(host=host, port=0, control_host=host, control_port=0)
+        (_, port), (_, control_port) = server.addresses[:2]
+
+    n_slow = int(args.clients * args.slow_fraction)
+    tasks = [
+        read_client(host, port, args.unix, args.format, args.duration, slow=index < n_slow)
+        for index in range(args.clients)
+    ]
+    start = time.monotonic()
+    received = await asyncio.gather(*tasks)
+    elapsed = time.monotonic() - start
+    stats = await query_stats(host, control_port)
+
+    if server is not None:
+        await server.stop()
+
+    expected_rate = args.sample_rate * BYTES_PER_SAMPLE[args.format]
+    rates = sorted(total / args.duration / expected_rate for total in received[n_slow:])
+    print(f"clients: {args.clients} ({n_slow} slow), duration: {elapsed:.1f}s")
+    if rates:
+        print(f"realtime ratio (normal clients): min {rates[0]:.2f}  "
+              f"median {rates[len(rates) // 2]:.2f}  max {rates[-1]:.2f}")
+    print(f"server: blocks rendered {stats.get('blocks_rendered')}, late {stats.get('late_blocks')}, "
+          f"dropped {stats.get('dropped_blocks')}, "
+          f"disconnected slow clients {stats.get('disconnected_slow_clients')}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5510)
+    parser.add_argument("--control-port", type=int, default=5511)
+    parser.add_argument("--unix", help="Connect data clients to this Unix socket instead of TCP")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--format", choices=sorted(BYTES_PER_SAMPLE), default="float32")
+    parser.add_argument("--slow-fraction", type=float, default=0.0,
+                        help="Fraction of clients that read too slowly")
+    parser.add_argument("--spawn", action="store_true", help="Host the server in this process")
+    parser.add_argument("--block-size", type=int, default=2048)
+    parser.add_argument("--sample-rate", type=int, default=44100)
+    asyncio.run(run_load_test(parser.parse_args()))
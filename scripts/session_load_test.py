@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Open N independent sessions on a SessionManager and report deadline misses."""
+from pathlib import Path
+import argparse
+import itertools
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from App.core.audio.stream_config import StreamConfig
+from App.core.processors.processor_registry import register_processors
+from App.core.server.session_manager import SessionManager, AdmissionError
+
+CHAINS = [
+    {"processors": [{"type": "xorshift"}, {"type": "bandpass"}]},
+    {"processors": [{"type": "xorshift"}, {"type": "cascaded_v2"}]},
+    {"processors": [{"type": "xorshift"}, {"type": "cascaded"}]},
+]
+
+def run_load_test(args) -> None:
+    """Open sessions with varied chains, seeds and parameters, then report."""
+    register_processors()
+    manager = SessionManager(
+        workers=args.workers,
+        executor=args.executor,
+        cpu_budget=args.cpu_budget,
+        admission_policy=args.policy
+    )
+    manager.start()
+
+    stream_config = StreamConfig(sample_rate=args.sample_rate, block_size=args.block_size)
+    chains = itertools.cycle(CHAINS)
+    for index in range(args.sessions):
+        try:
+            manager.open_session(
+                config=next(chains),
+                parameters={"cutoff": (index % 10) / 10.0, "poles": 1 + index % 4, "volume": 0.5},
+                seed=1000 + index,
+                stream_config=stream_config
+            )
+        except AdmissionError as e:
+            print(f"session {index} rejected: {e}")
+
+    time.sleep(args.duration)
+    summary = manager.summary()
+    manager.stop()
+
+    print(f"sessions: {summary['sessions']} admitted ({summary['degraded_sessions']} degraded), "
+          f"{summary['rejected_sessions']} rejected")
+    print(f"aggregate load: {summary['aggregate_load']:.2f} / capacity {summary['capacity']:.2f}")
+    print(f"{'id':>4}{'degraded':>10}{'blocks':>8}{'misses':>8}{'rtf':>8}{'max ms':>9}")
+    for stats in summary["session_stats"]:
+        print(f"{stats['id']:>4}{str(stats['degraded']):>10}{stats['blocks']:>8}"
+              f"{stats['deadline_misses']:>8}{stats['realtime_factor']:>8.3f}{stats['max_render_ms']:>9.2f}")
+    print(f"total deadline misses: {summary['deadline_misses']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread")
+    parser.add_argument("--cpu-budget", type=float, default=0.75)
+    parser.add_argument("--policy", choices=["reject", "degrade"], default="reject")
+    parser.add_argument("--block-size", type=int, default=2048)
+    parser.add_argument("--sample-rate", type=int, default=44100)
+    run_load_test(parser.parse_args())
@@ -0,0 +1,13 @@
+import pytest
+from App.core.processors.processor_factory import AudioProcessorFactory
+from App.core.processors.processor_registry import register_processors
+
+@pytest.fixture
+def registered_processors():
+    """Register the built-in processors with empty pools, and clear both afterwards."""
+    AudioProcessorFactory._registry.clear()
+    AudioProcessorFactory.clear_pools()
+    register_processors(plugins=False)
+    yield
+    AudioProcessorFactory._registry.clear()
+    AudioProcessorFactory.clear_pools()
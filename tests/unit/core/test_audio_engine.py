@@ -75,6 +75,16 @@ class TestAudioEngine:
         engine.set_parameters(**params)
         assert engine.parameters == params
     
+    def test_apply_changes(self, mock_factory):
+        """Test changes are merged into a new parameter snapshot."""
+        engine = AudioEngine()
+        engine.set_parameters(cutoff=0.5, bandwidth=0.3)
+        previous = engine.parameters
+        
+        engine.apply_changes(cutoff=0.8)
+        assert engine.parameters == {'cutoff': 0.8, 'bandwidth': 0.3}
+        assert previous == {'cutoff': 0.5, 'bandwidth': 0.3}
+    
     def test_generate_noise(self, mock_factory):
         """Test noise generation and processing chain."""
         engine = AudioEngine()
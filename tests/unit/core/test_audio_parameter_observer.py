@@ -36,6 +36,15 @@ class TestAudioParameterObserver:
         observer.update(params)
         mock_audio_engine.set_parameters.assert_called_once_with(**params)
     
+    def test_update_selects_filter(self, observer, mock_audio_engine):
+        """Test the filter type is passed to the engine before the parameters."""
+        params = {'filter_type': 'cascaded', 'cutoff': 0.5}
+        observer.update(params)
+        assert mock_audio_engine.method_calls == [
+            call.select_filter('cascaded'),
+            call.set_parameters(**params)
+        ]
+    
     def test_update_parameters_error(self, observer, mock_audio_engine):
         """Test parameter update error handling."""
         # Mock engine to raise error
@@ -1,4 +1,6 @@
-from App.core.audio.audio_stream import AudioStream
+from App.core.audio.audio_stream import AudioStream, SoundDeviceBackend
+from types import SimpleNamespace
+import logging
 from unittest.mock import Mock, patch, MagicMock
 import numpy as np
 import pytest
@@ -49,7 +51,7 @@ class TestAudioStream:
         # Test normal callback
         stream.audio_callback(outdata, frames, time_info, status)
         mock_callback.assert_called_once_with(frames)
-        mock_waveform_view.update_waveform.assert_called_once()
+        assert stream.waveform_tap.written == frames
         
         # Test callback with stop event set
         stream.stop_event.set()
@@ -107,19 +109,19 @@ class TestAudioStream:
         assert stream.stop_event.is_set()
         assert stream.stream is None
     
-    def test_error_handling(self, mock_callback):
+    def test_error_handling(self, mock_callback, caplog):
         """Test error handling in stream thread."""
         stream = AudioStream(mock_callback)
         
-        # Mock sounddevice to raise an error
-        with patch('App.core.audio.audio_stream.sd.OutputStream') as mock_output_stream:
-            mock_output_stream.side_effect = Exception("Test error")
-            
+        # Make opening the sound card stream fail
+        with patch.object(SoundDeviceBackend, 'open_stream', side_effect=Exception("Test error")):
             # Start stream (should handle error gracefully)
-            stream.start()
-            time.sleep(0.1)  # Give thread time to run
+            with caplog.at_level(logging.ERROR, logger="App.core.audio.audio_stream"):
+                stream.start()
+                stream.audio_thread.join(timeout=1.0)
             
             assert stream.stream is None
+            assert "Audio stream error: Test error" in caplog.text
             stream.stop()  # Cleanup
     
     def test_waveform_update(self, mock_callback, mock_waveform_view):
@@ -128,12 +130,19 @@ class TestAudioStream:
         frames = 1000
         outdata = np.zeros((frames, 1))
         
-        # Test callback with waveform view
+        # Test the view is handed a tap and the callback never calls the view
+        mock_waveform_view.attach_tap.assert_called_once_with(stream.waveform_tap)
         stream.audio_callback(outdata, frames, 0.0, None)
-        mock_waveform_view.update_waveform.assert_called_once()
+        assert mock_waveform_view.method_calls == [("attach_tap", (stream.waveform_tap,), {})]
+        
+        # Test the newest samples can be pulled from the tap
+        latest = np.ones(frames // 2)
+        stream.waveform_tap.read_latest(latest)
+        np.testing.assert_array_equal(latest, np.zeros(frames // 2))
         
         # Test callback without waveform view
-        stream.waveform_view = None
+        stream = AudioStream(mock_callback)
+        assert stream.waveform_tap is None
         stream.audio_callback(outdata, frames, 0.0, None)
         # Should not cause any errors
     
@@ -143,10 +152,17 @@ class TestAudioStream:
         frames = 1000
         outdata = np.zeros((frames, 1))
         
-        # Test callback status error
+        # Test callback status is queued, not printed, and logged once drained
         with patch('builtins.print') as mock_print:
             stream.audio_callback(outdata, frames, 0.0, "Error status")
-            mock_print.assert_called_once_with("Stream status:", "Error status")
+            stream.audio_callback(outdata, frames, 0.0, SimpleNamespace(output_underflow=True))
+            mock_print.assert_not_called()
+        assert stream.log.pending == 2
+        
+        with patch.object(stream.logger, 'log') as mock_log:
+            stream.log.drain()
+            messages = [call.args[1] for call in mock_log.call_args_list]
+        assert messages == ["Stream status: unrecognised flags", "Stream status: output underflow"]
     
     def test_callback_data_handling(self, mock_callback, mock_waveform_view):
         """Test audio data handling in callback."""
@@ -0,0 +1,78 @@
+from App.core.diagnostics.benchmark import (
+    BenchmarkResult, benchmark_chain, benchmark_processor, compare_results, from_json, measure_block_function,
+    run_suite, to_json
+)
+from App.core.processors.processor_factory import AudioProcessorFactory
+import json
+import numpy as np
+import pytest
+
+TIMING = {"min_time": 0.0, "min_blocks": 3}
+
+def make_result(name="bandpass", throughput=1e6, p95=1e-4):
+    return BenchmarkResult(
+        kind="processor", name=name, block_size=256, dtype="float64", blocks=10,
+        throughput=throughput,
+        latency={"p50": p95 / 2, "p95": p95, "p99": p95, "max": p95, "mean": p95 / 2},
+        alloc_peak_bytes=4096, alloc_blocks=0
+    )
+
+@pytest.mark.usefixtures("registered_processors")
+class TestBenchmark:
+    def test_processor_result(self):
+        """Test a filter benchmark reports timings and allocations."""
+        result = benchmark_processor("bandpass", 256, "float32", **TIMING)
+        assert result.key == ("processor", "bandpass", 256, "float32")
+        assert result.blocks >= 3
+        assert result.throughput > 0
+        assert result.latency["p50"] <= result.latency["max"]
+        assert result.alloc_peak_bytes > 0
+
+    def test_leak_check_ignores_returned_block(self):
+        """Test the returned block is not counted as left allocated, but kept references are."""
+        _, peak, remaining = measure_block_function(lambda: np.zeros(256), 256, **TIMING)
+        assert peak >= 256 * 8
+        assert remaining == 0
+
+        kept = []
+        _, _, remaining = measure_block_function(lambda: kept.append(np.zeros(256)), 256, **TIMING)
+        assert remaining > 0
+
+    def test_generator_runs_natively(self):
+        """Test generators ignore the dtype and render frames directly."""
+        result = benchmark_processor("fractal", 64, "float32", **TIMING)
+        assert result.dtype == "native"
+
+    def test_chain_result(self):
+        """Test a chain renders through the engine."""
+        result = benchmark_chain(("xorshift", "cascaded_v2"), 256, **TIMING)
+        assert result.name == "xorshift->cascaded_v2"
+        assert result.kind == "chain"
+
+    def test_suite_covers_registry(self):
+        """Test the suite measures every registered processor."""
+        results = run_suite(chains=[("xorshift", "bandpass")], block_sizes=[64], **TIMING)
+        names = {result.name for result in results}
+        registered = {info.name for info in AudioProcessorFactory.get_registered_processors()}
+        assert registered | {"xorshift->bandpass"} == names
+
+    def test_json_round_trip(self):
+        """Test results survive serialization."""
+        results = [make_result()]
+        data = json.loads(json.dumps(to_json(results)))
+        assert "environment" in data
+        assert from_json(data) == results
+
+    def test_compare_flags_regressions(self):
+        """Test slower throughput and latency beyond the threshold are flagged."""
+        baseline = [make_result(), make_result("cascaded")]
+        current = [make_result(throughput=0.8e6), make_result("cascaded", p95=1.05e-4)]
+        regressions = compare_results(baseline, current, threshold=0.10)
+        assert [(regression.key[1], regression.metric) for regression in regressions] == [("bandpass", "throughput")]
+        assert regressions[0].change == pytest.approx(0.2)
+
+    def test_compare_ignores_improvements_and_missing(self):
+        """Test faster results and results without a baseline are not flagged."""
+        baseline = [make_result()]
+        current = [make_result(throughput=2e6, p95=0.5e-4), make_result("fractal", throughput=1.0)]
+        assert compare_results(baseline, current) == []
@@ -0,0 +1,74 @@
+from App.core.diagnostics.callback_metrics import CallbackMetrics, MetricsReporter, status_bits
+from types import SimpleNamespace
+from unittest.mock import Mock
+import numpy as np
+import time
+import pytest
+
+class TestCallbackMetrics:
+    def test_status_bits(self):
+        """Test xrun flags are packed from a status object."""
+        assert status_bits(None) == 0
+        assert status_bits(SimpleNamespace(output_underflow=True, output_overflow=False)) == 0b01
+        assert status_bits(SimpleNamespace(output_underflow=True, input_overflow=True)) == 0b1001
+
+    def test_utilisation_and_percentiles(self):
+        """Test render times are converted to deadline ratios and summarised."""
+        metrics = CallbackMetrics(sample_rate=1000, capacity=100)  # 100 frames -> 100 ms deadline
+        for ms in range(1, 101):
+            metrics.record(ms / 1000, 100)
+
+        snapshot = metrics.snapshot()
+        assert snapshot.blocks == 100
+        assert snapshot.window == 99  # oldest slot is the next one written, so it is dropped
+        assert snapshot.render_ms["max"] == pytest.approx(100.0)
+        assert snapshot.utilisation["max"] == pytest.approx(1.0)
+        assert snapshot.utilisation["p50"] == pytest.approx(0.51)
+        assert snapshot.deadline_misses == 0
+        assert snapshot.histogram.sum() == snapshot.window
+
+    def test_ring_keeps_recent_blocks(self):
+        """Test old records are overwritten while totals keep counting."""
+        metrics = CallbackMetrics(sample_rate=1000, capacity=8)
+        for _ in range(20):
+            metrics.record(0.001, 100)
+        metrics.record(0.5, 100)  # deadline miss
+
+        snapshot = metrics.snapshot()
+        assert snapshot.blocks == 21
+        assert snapshot.window == 7
+        assert snapshot.deadline_misses == 1
+        assert snapshot.histogram[-1] == 1
+
+    def test_xrun_counts(self):
+        """Test cumulative and windowed xrun counts."""
+        metrics = CallbackMetrics(capacity=4)
+        underflow = SimpleNamespace(output_underflow=True)
+        for status in (underflow, None, None, None, None, underflow):
+            metrics.record(0.001, 2048, status)
+
+        snapshot = metrics.snapshot()
+        assert snapshot.xruns["output_underflow"] == 2
+        assert snapshot.window_xruns["output_underflow"] == 1
+        assert "xruns 2" in snapshot.describe()
+
+    def test_empty_snapshot(self):
+        """Test a snapshot before any callbacks."""
+        snapshot = CallbackMetrics().snapshot()
+        assert snapshot.window == 0
+        assert "no timing data" in snapshot.describe()
+
+    def test_reporter_logs_periodically(self):
+        """Test the reporter writes summary lines and stops cleanly."""
+        metrics = CallbackMetrics(sample_rate=1000)
+        logger = Mock()
+        reporter = MetricsReporter(metrics, interval=0.01, logger=logger)
+        reporter.start()
+        for _ in range(10):
+            metrics.record(0.001, 100)
+        time.sleep(0.1)
+        reporter.stop()
+
+        assert not reporter.report_thread.is_alive()
+        assert logger.info.called
+        assert "callbacks: 10" in logger.info.call_args.args[0]
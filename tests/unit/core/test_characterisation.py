@@ -0,0 +1,59 @@
+from App.core.analysis.characterisation import characterise, compare_tables
+from App.core.filters.implementations.bandpass import BandpassFilter
+from App.core.visualization.implementations import CascadedLowpassResponseV2Visualizer
+from App.core.visualization.response_table import ResponseTable, load_table
+from App.core.visualization.transfer_function import frequency_response, magnitude_db
+import numpy as np
+import pytest
+
+@pytest.mark.usefixtures("registered_processors")
+class TestCharacterisation:
+    @pytest.fixture
+    def bandpass_table(self):
+        """Measure a small bandpass table."""
+        return characterise("bandpass", {"cutoff": [0.2, 0.6], "bandwidth": [0.3]},
+                            frames=2 ** 14, fft_size=2048, octave_fraction=6)
+
+    def test_linear_filter_matches_coefficients(self, bandpass_table):
+        """Test the cross-spectral estimate recovers a linear filter's response."""
+        for index, cutoff in enumerate(bandpass_table.axes[0]):
+            parameters = {"cutoff": cutoff, "bandwidth": 0.3}
+            exact = magnitude_db(frequency_response(
+                BandpassFilter().coefficients(parameters), bandpass_table.freqs, 44100))
+            measured = bandpass_table.magnitude_db[index, 0]
+            visible = (exact > -40) & (bandpass_table.freqs > 100)
+            assert np.max(np.abs(measured[visible] - exact[visible])) < 1.0
+
+    def test_save_load_roundtrip(self, bandpass_table, tmp_path):
+        """Test tables survive the compact .npz format."""
+        path = tmp_path / "bandpass.npz"
+        bandpass_table.save(path)
+        loaded = ResponseTable.load(path)
+        assert loaded.parameter_names == ["cutoff", "bandwidth"]
+        assert loaded.metadata["fft_size"] == "2048"
+        assert compare_tables(bandpass_table, loaded) < 0.05
+
+    def test_interpolation(self, bandpass_table):
+        """Test lookups interpolate between and clamp outside grid points."""
+        low, high = bandpass_table.magnitude_db[:, 0]
+        middle = bandpass_table.lookup({"cutoff": 0.4, "bandwidth": 0.3})
+        np.testing.assert_allclose(middle, (low + high) / 2, rtol=1e-6)
+        np.testing.assert_allclose(bandpass_table.lookup({"cutoff": 0.0}), low, rtol=1e-6)
+        freqs = np.array([100.0, 1000.0])
+        assert bandpass_table.response_db({"cutoff": 0.2}, freqs).shape == (2,)
+
+    def test_shape_mismatch_rejected(self):
+        """Test tables whose data does not match the axes are rejected."""
+        with pytest.raises(ValueError):
+            ResponseTable("x", ["cutoff"], [np.array([0.0, 1.0])], np.array([100.0]), np.zeros((3, 1)))
+
+    def test_shipped_table(self):
+        """Test the shipped V2 table loads and drives the visualizer."""
+        table = load_table("cascaded_v2")
+        assert table is not None
+        assert table.parameter_names == ["cutoff", "resonance", "poles"]
+        visualizer = CascadedLowpassResponseV2Visualizer()
+        freqs = np.logspace(np.log10(20), np.log10(20000), 1000)
+        bright = visualizer.calculate_response(freqs, {"cutoff": 0.9, "resonance": 0.0, "poles": 1})
+        dark = visualizer.calculate_response(freqs, {"cutoff": 0.1, "resonance": 0.0, "poles": 4})
+        assert bright[-1] > dark[-1] + 20
@@ -0,0 +1,87 @@
+from App.core.audio.audio_engine import AudioEngine
+from App.core.audio.execution_plan import negotiate_plan
+from App.core.audio.stream_config import StreamConfig
+from App.core.processors.processor_factory import ProcessorCapabilities
+import numpy as np
+import pytest
+
+GENERATOR = ("generator", ProcessorCapabilities(dtypes=("float64",)))
+
+class TestExecutionPlan:
+    def test_direct_chain(self):
+        """Test a chain that accepts the generator's output runs directly."""
+        plan = negotiate_plan([GENERATOR, ("filter", ProcessorCapabilities(dtypes=("float64",)))], StreamConfig())
+        assert plan.is_direct
+        assert plan.output_dtype == "float64"
+
+    def test_dtype_conversion(self):
+        """Test a filter is fed its native dtype when it cannot take the previous output."""
+        plan = negotiate_plan([GENERATOR, ("f32", ProcessorCapabilities(dtypes=("float32",)))], StreamConfig())
+        stage = plan.stages[1]
+        assert stage.convert and stage.input_dtype == "float32"
+        assert plan.output_dtype == "float32"
+        assert "convert to float32" in plan.describe()
+
+    def test_block_splitting(self):
+        """Test blocks are split for maximum and preferred stage sizes."""
+        config = StreamConfig(block_size=2048)
+        limited = negotiate_plan([GENERATOR, ("f", ProcessorCapabilities(max_block_size=500))], config)
+        assert limited.stages[1].chunk_size == 500
+        preferred = negotiate_plan([GENERATOR, ("f", ProcessorCapabilities(preferred_block_size=256))], config)
+        assert preferred.stages[1].chunk_size == 256
+        odd = negotiate_plan([GENERATOR, ("f", ProcessorCapabilities(preferred_block_size=300))], config)
+        assert odd.stages[1].chunk_size is None
+
+    def test_refuses_small_blocks_and_latency(self):
+        """Test chains that cannot meet the stream settings are refused."""
+        with pytest.raises(ValueError, match="at least 64"):
+            negotiate_plan([GENERATOR, ("f", ProcessorCapabilities(min_block_size=64))], StreamConfig(block_size=32))
+        slow = [GENERATOR, ("f", ProcessorCapabilities(latency=4410))]
+        plan = negotiate_plan(slow, StreamConfig(block_size=441))
+        assert plan.latency_samples == 4410
+        assert plan.latency == pytest.approx(0.11)
+        with pytest.raises(ValueError, match="exceeds"):
+            negotiate_plan(slow, StreamConfig(block_size=441), max_latency=0.05)
+
+    def test_channels(self):
+        """Test channel strategy reporting."""
+        multichannel = ProcessorCapabilities(multichannel=True)
+        plan = negotiate_plan([("g", multichannel), ("f", multichannel)], StreamConfig(channels=2))
+        assert plan.render_channels == 2
+        plan = negotiate_plan([GENERATOR, ("f", multichannel)], StreamConfig(channels=2))
+        assert plan.render_channels == 1
+        assert "duplicated to 2 channels" in plan.describe()
+
+    def test_invalid_capabilities(self):
+        """Test inconsistent capability declarations are rejected."""
+        with pytest.raises(ValueError):
+            ProcessorCapabilities(dtypes=())
+        with pytest.raises(ValueError):
+            ProcessorCapabilities(min_block_size=128, max_block_size=64)
+
+@pytest.mark.usefixtures("registered_processors")
+class TestEnginePlanning:
+    def test_planned_output_matches_direct(self):
+        """Test conversion and splitting do not change a stateful chain's output."""
+        config = {"processors": [{"type": "xorshift"}, {"type": "cascaded_v2"}]}
+        planned = AudioEngine(config)
+        assert not planned.plan.is_direct
+        direct = AudioEngine(config)
+        direct.plan = negotiate_plan([GENERATOR, ("cascaded_v2", ProcessorCapabilities())], direct.stream_config)
+        for engine in (planned, direct):
+            engine.set_parameters(cutoff=0.3, resonance=0.2, poles=2)
+        np.testing.assert_array_equal(planned.generate_noise(2048), direct.generate_noise(2048))
+
+    def test_split_generator_is_continuous(self):
+        """Test a split generator stage produces the same stream as one call."""
+        engine = AudioEngine({"processors": [{"type": "xorshift"}]})
+        reference = AudioEngine({"processors": [{"type": "xorshift"}]}).generate_noise(1000)
+        engine.plan = negotiate_plan([("xorshift", ProcessorCapabilities(max_block_size=300))], StreamConfig(block_size=1000))
+        np.testing.assert_array_equal(engine.generate_noise(1000), reference)
+
+    def test_engine_refuses_small_blocks(self):
+        """Test the engine refuses the cascaded filter with blocks below its DC window."""
+        with pytest.raises(ValueError):
+            AudioEngine({"processors": [{"type": "xorshift"}, {"type": "cascaded"}]},
+                        stream_config=StreamConfig(block_size=32))
+        assert "bandpass" in AudioEngine().describe_plan()
@@ -0,0 +1,70 @@
+from App.core.analysis.golden_corpus import (
+    CORPUS_PATH, GoldenCase, GoldenCorpus, build_corpus, default_cases, render_case, verify_corpus
+)
+from App.core.processors.processor_factory import AudioProcessorFactory
+import numpy as np
+import pytest
+
+@pytest.mark.usefixtures("registered_processors")
+class TestGoldenCorpus:
+    @pytest.fixture
+    def small_corpus(self):
+        """Build a corpus of two short cases."""
+        return build_corpus([
+            GoldenCase("xorshift", ("xorshift",), {}, frames=1024, block_size=256),
+            GoldenCase("v2", ("xorshift", "cascaded_v2"), {"cutoff": 0.4, "poles": 2}, frames=1024, block_size=256),
+        ], stride=8)
+
+    def test_shipped_corpus_matches(self):
+        """Test current output matches the stored corpus."""
+        corpus = GoldenCorpus.load(CORPUS_PATH)
+        mismatches = verify_corpus(corpus)
+        assert mismatches == [], [f"{mismatch.name}: {mismatch.reason}" for mismatch in mismatches]
+
+    def test_corpus_covers_registry(self):
+        """Test every registered processor appears in a stored case."""
+        corpus = GoldenCorpus.load(CORPUS_PATH)
+        covered = {name for entry in corpus.entries.values() for name in entry.case.chain}
+        assert covered >= {info.name for info in AudioProcessorFactory.get_registered_processors()}
+        assert {case.name for case in default_cases()} == set(corpus.entries)
+
+    def test_rendering_is_deterministic(self):
+        """Test a case renders identically twice and depends on its seed."""
+        case = GoldenCase("case", ("xorshift", "bandpass"), {"cutoff": 0.3}, frames=1024)
+        first = render_case(case)
+        np.testing.assert_array_equal(first, render_case(case))
+        case.seed = 999
+        assert not np.array_equal(first, render_case(case))
+
+    def test_save_load_round_trip(self, small_corpus, tmp_path):
+        """Test a saved corpus loads with the same cases, hashes and references."""
+        path = tmp_path / "corpus.npz"
+        small_corpus.save(path)
+        loaded = GoldenCorpus.load(path)
+        assert loaded.stride == 8
+        for name, entry in small_corpus.entries.items():
+            assert loaded.entries[name].case == entry.case
+            assert loaded.entries[name].digest == entry.digest
+            np.testing.assert_array_equal(loaded.entries[name].reference, entry.reference)
+        assert verify_corpus(loaded, exact=True) == []
+
+    def test_tolerance_accepts_small_drift(self, small_corpus):
+        """Test a changed hash passes within tolerance but fails in exact mode."""
+        entry = small_corpus.entries["v2"]
+        entry.digest = "0" * 16
+        entry.reference = entry.reference + np.float32(1e-7)
+        assert verify_corpus(small_corpus) == []
+        mismatches = verify_corpus(small_corpus, exact=True)
+        assert [mismatch.name for mismatch in mismatches] == ["v2"]
+
+    def test_changed_output_fails(self, small_corpus):
+        """Test a bit-exact generator fails on any change."""
+        small_corpus.entries["xorshift"].digest = "0" * 16
+        mismatches = verify_corpus(small_corpus)
+        assert [mismatch.reason for mismatch in mismatches] == ["output not bit-exact"]
+
+        small_corpus.entries["v2"].digest = "0" * 16
+        small_corpus.entries["v2"].reference = small_corpus.entries["v2"].reference * 1.01
+        mismatch = verify_corpus(small_corpus, names=["v2"])[0]
+        assert mismatch.reason == "output outside tolerance"
+        assert mismatch.max_error > mismatch.tolerance
@@ -1,6 +1,6 @@
 import pytest
 from App.core.parameters.noise_parameters import NoiseParameters
-from App.core.parameters.observer import Observer
+from App.core.parameters.observer import ChangeObserver, Observer
 
 @pytest.fixture
 def test_observer():
@@ -219,3 +219,56 @@ class TestNoiseParameters:
         assert noise_parameters.get_parameter("cutoff") == 0.7  # Should still persist
         assert noise_parameters.get_parameter("volume") == 0.8  # Should still persist
         assert noise_parameters.get_parameter("bandwidth") == 0.5
+
+@pytest.mark.usefixtures("registered_processors")
+class TestChangeSetNotifications:
+    @pytest.fixture
+    def change_observer(self):
+        class RecordingObserver(ChangeObserver):
+            subscribed_keys = frozenset({"cutoff"})
+
+            def __init__(self):
+                self.change_sets = []
+
+            def on_changes(self, change_set):
+                self.change_sets.append(change_set)
+        return RecordingObserver()
+
+    def test_unchanged_values_dropped(self, noise_parameters, test_observer):
+        """Test resubmitting current values notifies nobody."""
+        noise_parameters.attach(test_observer)
+        noise_parameters.update_parameters(volume=0.5)
+        assert test_observer.update_count == 0
+        assert noise_parameters.version == 0
+
+    def test_subscribed_keys(self, noise_parameters, change_observer):
+        """Test change observers only see their subscribed keys."""
+        noise_parameters.attach(change_observer)
+        noise_parameters.update_parameters(volume=0.7)
+        assert change_observer.change_sets == []
+
+        volume_observer = type(change_observer)()
+        noise_parameters.attach(volume_observer, keys=["volume"])
+        noise_parameters.update_parameters(volume=0.6)
+        change_set, = volume_observer.change_sets
+        assert change_set.changes == {"volume": 0.6}
+        assert change_set.version == 2
+        assert change_observer.change_sets == []
+        with pytest.raises(TypeError):
+            change_set.parameters["volume"] = 1.0
+
+    def test_attach_keys_filter_plain_observers(self, noise_parameters, test_observer):
+        """Test keys given to attach() filter plain observers too."""
+        noise_parameters.attach(test_observer, keys=["cutoff"])
+        noise_parameters.update_parameters(volume=0.7)
+        assert test_observer.update_count == 0
+        noise_parameters.detach(test_observer)
+        noise_parameters.attach(test_observer)
+        noise_parameters.update_parameters(volume=0.6)
+        assert test_observer.last_update["volume"] == 0.6
+
+    def test_notify_sends_everything(self, noise_parameters, change_observer):
+        """Test an explicit notify() delivers all current values."""
+        noise_parameters.attach(change_observer, keys=["volume"])
+        noise_parameters.notify()
+        assert change_observer.change_sets[0].changes == {"volume": 0.5}
@@ -0,0 +1,47 @@
+from App.core.visualization.octave_smoothing import OctaveSmoother, OCTAVE_FRACTIONS
+import numpy as np
+import pytest
+
+class TestOctaveSmoother:
+    @pytest.fixture
+    def freqs(self):
+        """FFT bin frequencies for a 4096-point FFT at 44.1 kHz."""
+        return np.fft.rfftfreq(4096, d=1.0 / 44100)
+
+    @pytest.mark.parametrize("fraction", OCTAVE_FRACTIONS)
+    def test_rows_are_normalised(self, freqs, fraction):
+        """Test every output point is a weighted mean of FFT bins."""
+        smoother = OctaveSmoother(freqs, fraction)
+        np.testing.assert_allclose(smoother.dense().sum(axis=1), 1.0)
+        np.testing.assert_allclose(smoother.apply(np.full(len(freqs), 3.0)), 3.0)
+
+    def test_matches_dense_product(self, freqs):
+        """Test the sparse product equals the dense matrix-vector product."""
+        power = np.random.default_rng(0).random(len(freqs))
+        smoother = OctaveSmoother(freqs, 6)
+        np.testing.assert_allclose(smoother.apply(power), smoother.dense() @ power)
+
+    def test_band_widths(self, freqs):
+        """Test bands span 1/N octave and narrower fractions keep fewer bins."""
+        wide = OctaveSmoother(freqs, 1)
+        narrow = OctaveSmoother(freqs, 24)
+        assert narrow.nnz < wide.nnz
+        # At 10 kHz a 1/1-octave band spans about 7071..14142 Hz
+        row = np.argmin(np.abs(wide.centers - 10000))
+        bins = wide.indices[wide.indptr[row]:wide.indptr[row + 1]]
+        band = freqs[bins]
+        assert band.min() == pytest.approx(wide.centers[row] / np.sqrt(2), abs=11)
+        assert band.max() == pytest.approx(wide.centers[row] * np.sqrt(2), abs=11)
+
+    def test_low_frequencies_interpolate(self, freqs):
+        """Test bands narrower than a bin interpolate between neighbours."""
+        smoother = OctaveSmoother(freqs, 24)
+        power = freqs.copy()
+        # A linear spectrum is reproduced exactly by interpolation and band means
+        low = smoother.centers < 100
+        np.testing.assert_allclose(smoother.apply(power)[low], smoother.centers[low], rtol=0.02)
+
+    def test_invalid_fraction(self, freqs):
+        """Test unsupported fractions are rejected."""
+        with pytest.raises(ValueError):
+            OctaveSmoother(freqs, 5)
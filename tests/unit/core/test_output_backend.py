@@ -0,0 +1,81 @@
+from App.core.audio.audio_stream import AudioStream
+from App.core.audio.output_backend import VirtualOutputBackend, VirtualOutputStream, CallbackStop
+from App.core.audio.stream_config import StreamConfig
+import numpy as np
+import time
+import pytest
+
+CONFIG = StreamConfig(sample_rate=8000, block_size=80)  # 10 ms blocks
+
+class TestVirtualOutputBackend:
+    @pytest.fixture
+    def ramp_callback(self):
+        """Create a callback producing consecutive ramp blocks."""
+        counter = iter(range(10**6))
+        def callback(frames):
+            start = next(counter) * frames
+            return np.arange(start, start + frames, dtype=np.float64) / 10**6
+        return callback
+
+    def test_records_every_block(self, ramp_callback):
+        """Test the fast virtual device drives AudioStream and records its output."""
+        backend = VirtualOutputBackend(max_blocks=25)
+        stream = AudioStream(ramp_callback, config=CONFIG, backend=backend)
+        stream.start()
+        assert backend.wait(2.0)
+        stream.stop()
+
+        recording = backend.stream.recording()
+        assert recording.shape == (25 * 80, 1)
+        np.testing.assert_allclose(recording[:, 0], np.arange(25 * 80) / 10**6, rtol=1e-6)
+        assert stream.metrics.blocks == 25
+        assert backend.stream.underflows == 0
+
+    def test_record_to_file(self, ramp_callback, tmp_path):
+        """Test blocks are appended to a raw sample file."""
+        path = tmp_path / "out.f32"
+        stream = VirtualOutputStream(
+            lambda outdata, frames, time_info, status: outdata.fill(0.25),
+            CONFIG, max_blocks=4, record=False, record_path=str(path)
+        )
+        with stream:
+            stream.start()
+            assert stream.finished.wait(2.0)
+        samples = np.fromfile(path, dtype=np.float32)
+        assert len(samples) == 4 * 80
+        assert np.all(samples == 0.25)
+
+    def test_jitter_causes_underflows(self):
+        """Test injected scheduling delay produces reproducible underflow flags."""
+        def run():
+            statuses = []
+            def callback(outdata, frames, time_info, status):
+                statuses.append(bool(status))
+            stream = VirtualOutputStream(callback, CONFIG, jitter=0.005, max_blocks=200, seed=7)
+            stream.start()
+            stream.finished.wait(2.0)
+            return stream.underflows, statuses
+
+        underflows, statuses = run()
+        assert 0 < underflows < 200
+        # Each late block is reported to the following callback (none follows the last)
+        assert underflows - 1 <= sum(statuses) <= underflows
+        assert run()[0] == underflows
+
+    def test_realtime_pacing(self):
+        """Test realtime mode issues callbacks at the device rate."""
+        stream = VirtualOutputStream(lambda *args: None, CONFIG, realtime=True, max_blocks=10)
+        start = time.monotonic()
+        stream.start()
+        stream.finished.wait(2.0)
+        assert time.monotonic() - start >= 0.09
+
+    def test_callback_stop(self):
+        """Test CallbackStop ends the stream cleanly."""
+        def callback(outdata, frames, time_info, status):
+            raise CallbackStop()
+        stream = VirtualOutputStream(callback, CONFIG)
+        stream.start()
+        assert stream.finished.wait(2.0)
+        assert stream.error is None
+        assert stream.blocks_played == 0
@@ -0,0 +1,63 @@
+from App.core.parameters.parameter_builder import ParameterDefinitionBuilder as Param
+from App.core.parameters.parameter_schema import ParameterSchema, CLAMP
+from App.core.parameters.parameter_system import ParameterRegistry
+import pytest
+
+class TestParameterSchema:
+    @pytest.fixture
+    def definitions(self):
+        """Definitions covering every parameter type."""
+        return {
+            "volume": Param().float().default(0.5).range(0, 1).build(),
+            "poles": Param().int().default(1).range(1, 4).build(),
+            "name": Param().string().default("noise").build(),
+            "enabled": Param().boolean().default(True).build(),
+            "mode": Param().enum(["a", "b"]).default("a").build(),
+        }
+
+    def test_valid_batch(self, definitions):
+        """Test a batch of valid values passes through unchanged."""
+        schema = ParameterSchema(definitions)
+        updates = {"volume": 0.3, "poles": 4, "name": "pink", "enabled": False, "mode": "b"}
+        assert schema.validate(updates) == updates
+
+    @pytest.mark.parametrize("updates, error", [
+        ({"unknown": 1.0}, KeyError),
+        ({"volume": "loud"}, TypeError),
+        ({"poles": 2.0}, TypeError),
+        ({"name": 3}, TypeError),
+        ({"enabled": "yes"}, TypeError),
+        ({"mode": "c"}, ValueError),
+        ({"mode": []}, ValueError),
+        ({"volume": 1.5}, ValueError),
+        ({"poles": 0}, ValueError),
+    ])
+    def test_invalid_values(self, definitions, updates, error):
+        """Test each kind of invalid value raises the matching error."""
+        with pytest.raises(error):
+            ParameterSchema(definitions).validate(updates)
+
+    def test_clamp_policy(self, definitions):
+        """Test out-of-range values are clamped under the clamp policy."""
+        schema = ParameterSchema(definitions, policies={"volume": CLAMP})
+        assert schema.validate({"volume": 1.5}) == {"volume": 1}
+        assert schema.validate({"volume": -0.5}) == {"volume": 0}
+        with pytest.raises(ValueError):
+            schema.validate({"poles": 5})
+        with pytest.raises(ValueError):
+            ParameterSchema(definitions, policy="ignore")
+
+    def test_defaults_and_unknown(self, definitions):
+        """Test schema metadata helpers."""
+        schema = ParameterSchema(definitions)
+        assert schema.defaults()["mode"] == "a"
+        assert "volume" in schema
+        assert schema.unknown(["volume", "x", "y"]) == ["x", "y"]
+
+    def test_registry_recompiles(self, definitions):
+        """Test the registry schema picks up later registrations."""
+        registry = ParameterRegistry()
+        registry.register("volume", definitions["volume"])
+        assert registry.validate_parameters({"volume": 0.2}) == {"volume": 0.2}
+        registry.register("poles", definitions["poles"])
+        assert registry.validate_parameters({"poles": 3}) == {"poles": 3}
@@ -0,0 +1,62 @@
+import pytest
+import numpy as np
+from App.core.analysis.parameter_sweep import ParameterSweep, sequential_sweep, get_sweep_kernel
+
+pytestmark = pytest.mark.usefixtures("registered_processors")
+
+class TestParameterSweep:
+    def test_output_shape(self):
+        """Test sweep returns one row per parameter set."""
+        sweep = ParameterSweep("bandpass", {"cutoff": np.linspace(0, 1, 8), "bandwidth": 0.5})
+        result = sweep.run(1000, block_size=256)
+        assert result.output.shape == (8, 1000)
+        assert np.all(np.abs(result.output) <= 1.0)
+
+    def test_bandpass_matches_sequential(self):
+        """Test bandpass sweep is bit-exact with one filter per row."""
+        grid = {"cutoff": np.linspace(0, 1, 6), "bandwidth": [0.0, 0.2, 0.4, 0.6, 0.8, 1.0], "volume": 0.7}
+        result = ParameterSweep("bandpass", grid).run(1500, block_size=512)
+        reference = sequential_sweep("bandpass", grid, 1500, block_size=512)
+        np.testing.assert_array_equal(result.output, reference)
+
+    @pytest.mark.parametrize("filter_type", ["cascaded", "cascaded_v2"])
+    def test_cascaded_matches_sequential(self, filter_type):
+        """Test cascaded sweeps match per-row filters across mixed pole counts."""
+        grid = [
+            {"cutoff": cutoff, "resonance": resonance, "poles": poles}
+            for cutoff in (0.1, 0.8)
+            for resonance in (0.0, 0.6)
+            for poles in (1, 2, 3, 4)
+        ]
+        result = ParameterSweep(filter_type, grid).run(1024, block_size=256)
+        reference = sequential_sweep(filter_type, grid, 1024, block_size=256)
+        np.testing.assert_allclose(result.output, reference, rtol=0, atol=1e-12)
+
+    def test_state_persists_between_blocks(self):
+        """Test processing in two calls equals processing in one."""
+        audio = np.sin(np.linspace(0, 40 * np.pi, 1000))
+        grid = {"cutoff": [0.2, 0.9]}
+        whole = ParameterSweep("bandpass", grid).process(audio)
+        split = ParameterSweep("bandpass", grid)
+        halves = np.hstack([split.process(audio[:400]), split.process(audio[400:])])
+        np.testing.assert_allclose(halves, whole)
+
+    def test_spectra(self):
+        """Test optional per-row spectra follow the cutoff."""
+        result = ParameterSweep("cascaded_v2", {"cutoff": [0.1, 0.9]}).run(
+            8192, compute_spectra=True, fft_size=1024)
+        assert result.spectra.shape == (2, 513)
+        assert result.freqs.shape == (513,)
+        high = result.freqs > 10000
+        # Higher cutoff should pass more high-frequency energy
+        assert result.spectra[1, high].sum() > result.spectra[0, high].sum()
+
+    def test_mismatched_grid_lengths(self):
+        """Test grids with inconsistent sequence lengths are rejected."""
+        with pytest.raises(ValueError):
+            ParameterSweep("bandpass", {"cutoff": [0.1, 0.2], "bandwidth": [0.1, 0.2, 0.3]})
+
+    def test_unknown_filter(self):
+        """Test unsupported processors raise ValueError."""
+        with pytest.raises(ValueError, match="No sweep kernel"):
+            get_sweep_kernel("xorshift")
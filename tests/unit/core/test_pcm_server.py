@@ -0,0 +1,125 @@
+from App.core.server.pcm_server import PCMServer, ClientConnection, encode_block
+from App.core.audio.stream_config import StreamConfig
+from unittest.mock import Mock
+import numpy as np
+import asyncio
+import json
+import pytest
+
+class TestPCMServer:
+    @pytest.fixture
+    def mock_engine(self):
+        """Create a mock engine producing a constant block."""
+        engine = Mock()
+        engine.generate_noise.side_effect = lambda frames: np.full(frames, 0.5)
+        return engine
+
+    def test_encode_block(self):
+        """Test PCM encoding for both sample formats."""
+        audio = np.array([-1.0, 0.0, 0.5, 1.0])
+        assert np.frombuffer(encode_block(audio, "float32"), '<f4').tolist() == [-1.0, 0.0, 0.5, 1.0]
+        assert np.frombuffer(encode_block(audio, "int16"), '<i2').tolist() == [-32767, 0, 16383, 32767]
+        with pytest.raises(ValueError):
+            encode_block(audio, "int24")
+
+    def test_invalid_policy(self, mock_engine):
+        """Test unknown slow-client policies are rejected."""
+        with pytest.raises(ValueError):
+            PCMServer(mock_engine, slow_client_policy="ignore")
+
+    @pytest.mark.parametrize("policy,expected", [
+        ("drop_oldest", [b"2", b"3"]),
+        ("drop_newest", [b"1", b"2"]),
+    ])
+    def test_slow_client_drop_policy(self, mock_engine, policy, expected):
+        """Test full client queues drop blocks according to policy."""
+        server = PCMServer(mock_engine, queue_size=2, slow_client_policy=policy)
+        client = ClientConnection(1, Mock(), asyncio.Queue(maxsize=2), "float32")
+        server.clients[1] = client
+
+        for payload in (b"1", b"2", b"3"):
+            server._fan_out({"float32": payload})
+
+        assert [client.queue.get_nowait() for _ in range(2)] == expected
+        assert client.blocks_dropped == 1
+
+    def test_slow_client_disconnect_policy(self, mock_engine):
+        """Test the disconnect policy removes a client with a full queue."""
+        server = PCMServer(mock_engine, queue_size=1, slow_client_policy="disconnect")
+        client = ClientConnection(1, Mock(), asyncio.Queue(maxsize=1), "float32", task=Mock())
+        server.clients[1] = client
+
+        server._fan_out({"float32": b"1"})
+        server._fan_out({"float32": b"2"})
+
+        assert 1 not in server.clients
+        client.task.cancel.assert_called_once()
+        assert server.disconnected_slow_clients == 1
+
+    def test_control_parameter_updates(self, mock_engine):
+        """Test control lines are validated and merged into engine parameters."""
+        server = PCMServer(mock_engine)
+
+        reply = server._handle_control_line(b'{"cutoff": 0.3}')
+        assert reply["ok"]
+        reply = server._handle_control_line(b'{"volume": 0.8}')
+        mock_engine.set_parameters.assert_called_with(cutoff=0.3, volume=0.8)
+
+        reply = server._handle_control_line(b'{"cutoff": 3.0}')
+        assert not reply["ok"]
+        assert "outside valid range" in reply["error"]
+
+        reply = server._handle_control_line(b'not json')
+        assert not reply["ok"]
+
+    def test_stream_to_clients(self, mock_engine):
+        """Test connected clients receive identical blocks in their formats."""
+        async def scenario():
+            server = PCMServer(mock_engine, StreamConfig(sample_rate=6400, block_size=64))
+            await server.start(port=0, control_port=0)
+            (host, port), (_, control_port) = server.addresses[:2]
+            try:
+                float_reader, float_writer = await asyncio.open_connection(host, port)
+                float_writer.write(b'{"format": "float32"}\n')
+                int_reader, int_writer = await asyncio.open_connection(host, port)
+                int_writer.write(b'{"format": "int16"}\n')
+
+                float_block = await float_reader.readexactly(64 * 4)
+                int_block = await int_reader.readexactly(64 * 2)
+
+                control_reader, control_writer = await asyncio.open_connection(host, control_port)
+                control_writer.write(b'{"command": "stats"}\n')
+                stats = json.loads(await control_reader.readline())["stats"]
+                for writer in (float_writer, int_writer, control_writer):
+                    writer.close()
+                return float_block, int_block, stats
+            finally:
+                await server.stop()
+
+        float_block, int_block, stats = asyncio.run(scenario())
+        np.testing.assert_array_equal(np.frombuffer(float_block, '<f4'), np.full(64, 0.5, dtype=np.float32))
+        np.testing.assert_array_equal(np.frombuffer(int_block, '<i2'), np.full(64, 16383, dtype=np.int16))
+        assert stats["clients"] == 2
+        assert stats["blocks_rendered"] > 0
+
+    @pytest.mark.parametrize("hello", [b'[1]\n', b'"x"\n', b'not json\n', b'{"format": [1]}\n'])
+    def test_rejects_bad_hello(self, mock_engine, hello):
+        """Test a hello that is not a JSON object with a known format gets an error reply."""
+        async def scenario():
+            server = PCMServer(mock_engine, StreamConfig(sample_rate=6400, block_size=64))
+            await server.start(port=0, control_port=0)
+            host, port = server.addresses[0]
+            try:
+                reader, writer = await asyncio.open_connection(host, port)
+                writer.write(hello)
+                reply = json.loads(await reader.readline())
+                closed = await reader.read() == b""
+                writer.close()
+                return reply, closed, len(server.clients)
+            finally:
+                await server.stop()
+
+        reply, closed, clients = asyncio.run(scenario())
+        assert not reply["ok"]
+        assert closed
+        assert clients == 0
@@ -0,0 +1,93 @@
+from App.core.audio.audio_engine import AudioEngine
+from App.core.audio.audio_parameter_observer import AudioParameterObserver
+from App.core.audio.audio_stream import AudioStream
+from App.core.filters.implementations.cascaded_onepole_lowpass_v2 import CascadedOnePoleLowPassV2
+from App.core.processors.processor_factory import AudioProcessorFactory
+from unittest.mock import Mock
+import numpy as np
+import pytest
+
+@pytest.mark.usefixtures("registered_processors")
+class TestProcessorPool:
+    def test_prewarm_fills_pool(self):
+        """Test prewarming pools warmed instances, bounded by POOL_SIZE."""
+        timings = AudioProcessorFactory.prewarm(["cascaded_v2", "xorshift"], count=5)
+        assert set(timings) == {"cascaded_v2", "xorshift"}
+        assert AudioProcessorFactory.pooled("cascaded_v2") == AudioProcessorFactory.POOL_SIZE
+
+    def test_checkout_resets_state(self):
+        """Test a pooled instance behaves exactly like a fresh one."""
+        AudioProcessorFactory.prewarm(["cascaded_v2", "xorshift"])
+        pooled = AudioProcessorFactory.checkout("cascaded_v2")
+        generator = AudioProcessorFactory.checkout("xorshift")
+        assert isinstance(pooled, CascadedOnePoleLowPassV2)
+        assert AudioProcessorFactory.pooled("cascaded_v2") == 0
+
+        noise = generator.process_audio(512, {})
+        fresh_noise = AudioProcessorFactory.create("xorshift").process_audio(512, {})
+        np.testing.assert_array_equal(noise, fresh_noise)
+        parameters = {"cutoff": 0.3, "resonance": 0.5, "poles": 3}
+        np.testing.assert_array_equal(pooled.process_audio(noise, parameters),
+                                      CascadedOnePoleLowPassV2().process_audio(noise, parameters))
+
+    def test_checkout_restores_fractal_settings(self):
+        """Test a released fractal generator comes back with its constructor settings."""
+        generator = AudioProcessorFactory.checkout("fractal")
+        generator.process_audio(256, {"octave_count": 7, "persistence": 0.8, "lacunarity": 3.0,
+                                      "scale": 5.0, "seed": 99})
+        AudioProcessorFactory.release("fractal", generator)
+
+        pooled = AudioProcessorFactory.checkout("fractal")
+        fresh = AudioProcessorFactory.create("fractal")
+        assert pooled is generator
+        for setting in ("octave_count", "persistence", "lacunarity", "scale", "seed"):
+            assert getattr(pooled, setting) == getattr(fresh, setting)
+        np.testing.assert_array_equal(pooled.process_audio(256, {}), fresh.process_audio(256, {}))
+
+    def test_checkout_without_pool_creates(self):
+        """Test checkout falls back to create() and release() is bounded."""
+        instance = AudioProcessorFactory.checkout("bandpass")
+        assert AudioProcessorFactory.release("bandpass", instance)
+        for _ in range(AudioProcessorFactory.POOL_SIZE - 1):
+            AudioProcessorFactory.release("bandpass", AudioProcessorFactory.create("bandpass"))
+        assert not AudioProcessorFactory.release("bandpass", AudioProcessorFactory.create("bandpass"))
+        with pytest.raises(ValueError):
+            AudioProcessorFactory.checkout("missing")
+
+    def test_failed_warmup_skipped(self):
+        """Test a processor that cannot warm up is left out of the pool."""
+        AudioProcessorFactory.register("broken", "no.such.module:Broken", "", "filter", {})
+        timings = AudioProcessorFactory.prewarm(["broken", "bandpass"])
+        assert "broken" not in timings
+        assert AudioProcessorFactory.pooled("bandpass") == 1
+
+    def test_background_prewarm(self):
+        """Test prewarming on a background thread."""
+        thread = AudioProcessorFactory.prewarm_in_background(["cascaded"])
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+        assert AudioProcessorFactory.pooled("cascaded") == 1
+
+    def test_engine_switch_uses_pool(self):
+        """Test switching the engine's filter takes a pooled instance and returns the old one."""
+        AudioProcessorFactory.prewarm(["cascaded_v2"])
+        engine = AudioEngine()
+        engine.switch_processor(1, "cascaded_v2")
+        assert engine.processor_types == ["xorshift", "cascaded_v2"]
+        assert AudioProcessorFactory.pooled("cascaded_v2") == 0
+        assert AudioProcessorFactory.pooled("bandpass") == 1
+        assert engine.generate_noise(256).dtype == np.float32
+
+    def test_filter_selection_uses_pool(self):
+        """Test a filter type change from the GUI parameters checks out a prewarmed filter."""
+        AudioProcessorFactory.prewarm(["cascaded"])
+        engine = AudioEngine()
+        observer = AudioParameterObserver(engine, Mock(spec=AudioStream))
+        observer.update({"filter_type": "cascaded", "cutoff": 0.5})
+        assert engine.processor_types == ["xorshift", "cascaded"]
+        assert AudioProcessorFactory.pooled("cascaded") == 0
+        
+        # Unchanged filter type: the instance stays in place
+        filter_instance = engine.processors[1]
+        observer.update({"filter_type": "cascaded", "cutoff": 0.7})
+        assert engine.processors[1] is filter_instance
@@ -0,0 +1,92 @@
+from App.core.audio.audio_engine import AudioEngine
+from App.core.audio.stream_config import StreamConfig
+from App.core.diagnostics.processor_profiler import ProcessorProfiler
+import json
+import numpy as np
+import pytest
+
+@pytest.mark.usefixtures("registered_processors")
+class TestProcessorProfiler:
+    @pytest.fixture
+    def profiler(self):
+        """Profiler with two synthetic blocks of 441 frames (10 ms budget)."""
+        profiler = ProcessorProfiler(["xorshift", "bandpass"], sample_rate=44100, capacity=8)
+        for offset in (0.0, 1.0):
+            start = profiler.origin + offset
+            profiler.record_stage(0, start, start + 0.002)
+            profiler.record_stage(1, start + 0.002, start + 0.005)
+            profiler.end_block(start, start + 0.006, 441)
+        return profiler
+
+    def test_summary(self, profiler):
+        """Test per-stage times, engine overhead and budget share."""
+        rows = {row.name: row for row in profiler.summary()}
+        assert list(rows) == ["xorshift", "bandpass", "engine", "block"]
+        assert rows["xorshift"].mean_ms == pytest.approx(2.0)
+        assert rows["bandpass"].p99_ms == pytest.approx(3.0)
+        assert rows["engine"].mean_ms == pytest.approx(1.0)
+        assert rows["block"].budget_share == pytest.approx(0.6)
+        assert "bandpass" in profiler.describe()
+
+    def test_chrome_trace(self, profiler, tmp_path):
+        """Test blocks export as complete events with nested stages."""
+        path = tmp_path / "trace.json"
+        profiler.export_chrome_trace(path)
+        events = [event for event in json.loads(path.read_text())["traceEvents"] if event["ph"] == "X"]
+        assert [event["name"] for event in events] == ["block", "xorshift", "bandpass"] * 2
+        second_block = events[3]
+        assert second_block["ts"] == pytest.approx(1e6)
+        assert second_block["dur"] == pytest.approx(6000)
+        assert second_block["args"] == {"block": 1, "frames": 441}
+
+    def test_ring_keeps_recent_blocks(self):
+        """Test the ring wraps without growing and drops the oldest blocks."""
+        profiler = ProcessorProfiler(["xorshift"], capacity=4)
+        for block in range(10):
+            profiler.record_stage(0, block, block + 0.001)
+            profiler.end_block(block, block + 0.002, 256)
+        assert profiler.blocks == 10
+        trace = profiler.chrome_trace()["traceEvents"]
+        blocks = [event["args"]["block"] for event in trace if event["name"] == "block"]
+        # The slot after the newest one is treated as possibly torn
+        assert blocks == [7, 8, 9]
+
+    def test_empty_profile(self):
+        """Test a profiler without blocks reports nothing."""
+        profiler = ProcessorProfiler(["xorshift"])
+        assert profiler.summary() == []
+        assert profiler.describe() == "profile: no blocks recorded"
+
+    def test_engine_profiling_toggle(self):
+        """Test the engine records blocks only while profiling and output is unchanged."""
+        config = {"processors": [{"type": "xorshift"}, {"type": "cascaded_v2"}]}
+        stream_config = StreamConfig(block_size=256)
+        reference = AudioEngine(config, stream_config=stream_config)
+        engine = AudioEngine(config, stream_config=stream_config)
+
+        profiler = engine.enable_profiling(capacity=16)
+        for _ in range(3):
+            np.testing.assert_array_equal(engine.generate_noise(256), reference.generate_noise(256))
+        assert profiler.blocks == 3
+        assert [row.name for row in profiler.summary()][:2] == ["xorshift", "cascaded_v2"]
+
+        assert engine.disable_profiling() is profiler
+        engine.generate_noise(256)
+        assert profiler.blocks == 3
+        assert engine.disable_profiling() is None
+
+    def test_switch_keeps_history(self):
+        """Test blocks before a processor switch stay attributed to the old processor."""
+        engine = AudioEngine(stream_config=StreamConfig(block_size=256))
+        profiler = engine.enable_profiling()
+        engine.generate_noise(256)
+        engine.generate_noise(256)
+        engine.switch_processor(1, "cascaded")
+        engine.generate_noise(256)
+        assert profiler.stage_names == ("xorshift", "cascaded")
+
+        names = [row.name for row in profiler.summary()]
+        assert names == ["xorshift", "bandpass", "cascaded", "engine", "block"]
+        stages = [event["name"] for event in profiler.chrome_trace()["traceEvents"]
+                  if event["ph"] == "X" and event["name"] != "block"]
+        assert stages == ["xorshift", "bandpass", "xorshift", "bandpass", "xorshift", "cascaded"]
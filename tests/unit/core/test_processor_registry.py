@@ -1,4 +1,5 @@
-from App.core.processors.processor_registry import register_processors
+from App.core.processors.processor_factory import AudioProcessorFactory
+from App.core.processors.processor_registry import register_processors, discover_plugins, PLUGIN_GROUP
 from App.core.noise.implementations.xorshift import XorShiftGenerator
 from App.core.filters.implementations.bandpass import BandpassFilter
 from unittest.mock import patch, Mock
@@ -66,3 +67,48 @@ class TestProcessorRegistry:
         # Verify final registrations
         mock_factory.register_generator.assert_called_with("noise", XorShiftGenerator)
         mock_factory.register_filter.assert_called_with("bandpass", BandpassFilter)
+
+class TestLazyRegistration:
+    @pytest.fixture(autouse=True)
+    def clean_registry(self):
+        """Start and finish each test with an empty factory registry."""
+        AudioProcessorFactory._registry.clear()
+        yield
+        AudioProcessorFactory._registry.clear()
+
+    def test_metadata_without_import(self):
+        """Test registration exposes metadata without loading implementation classes."""
+        register_processors(plugins=False)
+        info = AudioProcessorFactory.get_processor_info("cascaded_v2")
+        assert info.category == "filter"
+        assert set(info.parameters) == {"cutoff", "resonance", "poles"}
+        assert not info.is_loaded
+
+    def test_class_loads_on_create(self):
+        """Test the first create() imports and caches the implementation class."""
+        register_processors(plugins=False)
+        processor = AudioProcessorFactory.create("xorshift")
+        assert isinstance(processor, XorShiftGenerator)
+        assert AudioProcessorFactory.get_processor_info("xorshift").processor_class is XorShiftGenerator
+
+    def test_invalid_class_path(self):
+        """Test class paths must name a module and a class."""
+        with pytest.raises(ValueError):
+            AudioProcessorFactory.register("broken", "no_colon", "", "noise", {})
+
+    def test_discover_plugins(self):
+        """Test entry point plugins register and broken ones are skipped."""
+        def register_plugin(factory):
+            factory.register("plugin_noise", f"{XorShiftGenerator.__module__}:XorShiftGenerator",
+                             "Plugin noise", "noise", {})
+        def broken_plugin(factory):
+            raise RuntimeError("broken")
+        good = Mock(load=Mock(return_value=register_plugin))
+        good.name = "good"
+        bad = Mock(load=Mock(return_value=broken_plugin))
+        bad.name = "bad"
+
+        with patch("importlib.metadata.entry_points", return_value=[good, bad]) as entry_points:
+            assert discover_plugins() == ["good"]
+        entry_points.assert_called_once_with(group=PLUGIN_GROUP)
+        assert isinstance(AudioProcessorFactory.create("plugin_noise"), XorShiftGenerator)
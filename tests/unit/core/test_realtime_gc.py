@@ -0,0 +1,116 @@
+from App.core.audio.audio_stream import AudioStream
+from App.core.audio.output_backend import VirtualOutputBackend
+from App.core.audio.realtime_gc import RealtimeGC
+from App.core.audio.stream_config import StreamConfig
+import gc
+import numpy as np
+import pytest
+
+def make_cycles(count: int):
+    for _ in range(count):
+        node = {}
+        node["self"] = node
+
+class TestRealtimeGC:
+    @pytest.fixture
+    def control(self, request):
+        """RealtimeGC in the requested mode, always uninstalled afterwards."""
+        control = RealtimeGC(getattr(request, "param", "default"))
+        yield control
+        control.uninstall()
+
+    def test_rejects_unknown_mode(self):
+        """Test an unknown mode is rejected."""
+        with pytest.raises(ValueError):
+            RealtimeGC("never")
+
+    def test_records_pauses(self, control):
+        """Test collections are timed, with generation and block overlap."""
+        control.install()
+        gc.disable()  # Only the explicit collections below
+        try:
+            gc.collect(0)
+            token = control.block_started()
+            gc.collect(1)
+            control.block_finished(token, 0.002, 0.010)
+        finally:
+            gc.enable()
+
+        snapshot = control.snapshot()
+        assert snapshot.pauses == 2
+        assert snapshot.by_generation == {0: 1, 1: 1}
+        assert snapshot.pauses_in_blocks == 1
+        assert snapshot.pause_ms["max"] >= 0.0
+        assert snapshot.blocks == 1
+        assert snapshot.deadline_misses == 0
+        assert "2 collections" in snapshot.describe()
+
+    def test_attributes_misses(self, control):
+        """Test deadline misses are counted, and flagged when a collection ran in the block."""
+        control.install()
+        gc.disable()
+        try:
+            token = control.block_started()
+            control.block_finished(token, 0.020, 0.010)
+            token = control.block_started()
+            gc.collect(0)
+            control.block_finished(token, 0.020, 0.010)
+        finally:
+            gc.enable()
+
+        snapshot = control.snapshot()
+        assert snapshot.deadline_misses == 2
+        assert snapshot.misses_with_gc == 1
+
+    @pytest.mark.parametrize("control", ["freeze"], indirect=True)
+    def test_freeze_mode(self, control):
+        """Test freeze mode moves existing objects to the permanent generation and back."""
+        control.install()
+        assert gc.get_freeze_count() > 0
+        assert gc.isenabled()
+        control.uninstall()
+        assert gc.get_freeze_count() == 0
+
+    @pytest.mark.parametrize("control", ["deferred"], indirect=True)
+    def test_deferred_collects_between_blocks(self, control):
+        """Test deferred mode disables automatic collection and collects after blocks with slack."""
+        control.install()
+        assert not gc.isenabled()
+
+        token = control.block_started()
+        make_cycles(gc.get_threshold()[0] * 2)
+        assert control.pauses == 0  # Nothing collected while rendering
+        control.block_finished(token, 0.001, 0.010)
+
+        snapshot = control.snapshot()
+        assert snapshot.explicit >= 1
+        assert snapshot.pauses_in_blocks == 0
+        control.uninstall()
+        assert gc.isenabled()
+
+    @pytest.mark.parametrize("control", ["deferred"], indirect=True)
+    def test_deferred_waits_for_slack(self, control):
+        """Test a collection that does not fit the slack waits until overdue."""
+        control.install()
+        control._estimates[0] = 1.0  # Pretend young collections take a second
+        threshold = gc.get_threshold()[0]
+
+        make_cycles(threshold * 2)
+        control.block_finished(control.block_started(), 0.009, 0.010)
+        assert control.pauses == 0
+
+        make_cycles(threshold * control.max_backlog)
+        control.block_finished(control.block_started(), 0.009, 0.010)
+        assert control.pauses == 1
+
+    @pytest.mark.parametrize("control", ["deferred"], indirect=True)
+    def test_stream_reports_blocks(self, control):
+        """Test AudioStream brackets every callback."""
+        config = StreamConfig(block_size=256)
+        backend = VirtualOutputBackend(max_blocks=20)
+        stream = AudioStream(lambda frames: np.zeros(frames), config=config, backend=backend, gc_control=control)
+        control.install()
+        stream.start()
+        backend.wait(timeout=5.0)
+        stream.stop()
+        assert control.blocks == 20
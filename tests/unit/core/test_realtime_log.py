@@ -0,0 +1,79 @@
+from App.core.diagnostics.realtime_log import RealtimeLog
+from unittest.mock import Mock
+import logging
+import time
+import pytest
+
+class TestRealtimeLog:
+    @pytest.fixture
+    def log(self):
+        """Queue with one event, logging to a mock."""
+        log = RealtimeLog(capacity=8, window=1.0, burst=2, logger=Mock())
+        log.define("output_underflow", logging.WARNING, "Stream status: output underflow")
+        log.define("render_time", logging.INFO, "Block took {value:.1f} ms", "{count} slow blocks in {window:g}s")
+        return log
+
+    def messages(self, log):
+        return [call.args for call in log.logger.log.call_args_list]
+
+    def test_define(self, log):
+        """Test events get stable codes."""
+        assert log.code("output_underflow") == 0
+        assert log.define("output_underflow", logging.ERROR, "again") == 0
+        assert log.code("render_time") == 1
+
+    def test_push_and_drain(self, log):
+        """Test records are formatted only when drained."""
+        log.push(log.code("render_time"), 12.34)
+        log.logger.log.assert_not_called()
+        assert log.pending == 1
+
+        assert log.drain(now=0.0) == 1
+        assert log.pending == 0
+        assert self.messages(log) == [(logging.INFO, "Block took 12.3 ms")]
+
+    def test_repeats_are_aggregated(self, log):
+        """Test repeats past the burst are folded into one summary per window."""
+        code = log.code("output_underflow")
+        for _ in range(37):
+            log.push(code)
+            if log.pending == log.capacity:
+                log.drain(now=0.0)
+        log.drain(now=0.5)
+        assert len(self.messages(log)) == 2  # Burst of two, the rest held back
+
+        log.drain(now=1.5)
+        assert self.messages(log)[-1] == (logging.WARNING, "37 output underflows in last 1s")
+
+        # A new window starts from scratch
+        log.push(code)
+        log.drain(now=2.0)
+        assert self.messages(log)[-1] == (logging.WARNING, "Stream status: output underflow")
+
+    def test_full_queue_drops(self, log):
+        """Test a full queue drops records instead of blocking, and reports it."""
+        for _ in range(10):
+            log.push(log.code("render_time"), 1.0)
+        assert log.dropped == 2
+        log.drain(now=0.0)
+        log.logger.warning.assert_called_once_with("Realtime log full, dropped 2 records")
+
+    def test_stop_flushes_windows(self, log):
+        """Test stopping forwards pending records and open summaries."""
+        log.start()
+        for _ in range(5):
+            log.push(log.code("render_time"), 30.0)
+        log.stop()
+        assert not log.drain_thread.is_alive()
+        assert self.messages(log)[-1] == (logging.INFO, "5 slow blocks in 1s")
+
+    def test_drainer_thread(self, log):
+        """Test the drainer forwards records on its own thread."""
+        log.interval = 0.01
+        log.start()
+        log.push(log.code("output_underflow"))
+        deadline = time.monotonic() + 1.0
+        while log.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        log.stop()
+        assert (logging.WARNING, "Stream status: output underflow") in self.messages(log)
@@ -0,0 +1,71 @@
+from App.core.audio.ring_buffer import SampleRingBuffer
+import numpy as np
+import threading
+import pytest
+
+class TestSampleRingBuffer:
+    def test_invalid_capacity(self):
+        """Test a non-positive capacity is rejected."""
+        with pytest.raises(ValueError):
+            SampleRingBuffer(0)
+
+    def test_read_latest_before_full(self):
+        """Test missing samples are zero-filled until enough are written."""
+        ring = SampleRingBuffer(8, dtype=np.float64)
+        ring.write(np.array([1.0, 2.0, 3.0]))
+        out = np.full(5, -1.0)
+        assert ring.read_latest(out) == 3
+        np.testing.assert_array_equal(out, [0, 0, 1, 2, 3])
+
+    def test_wraparound(self):
+        """Test writes that wrap keep the newest samples in order."""
+        ring = SampleRingBuffer(8, dtype=np.float64)
+        for start in range(0, 30, 3):
+            ring.write(np.arange(start, start + 3, dtype=np.float64))
+        out = np.zeros(8)
+        assert ring.read_latest(out) == 8
+        np.testing.assert_array_equal(out, np.arange(22, 30))
+
+    def test_oversized_write(self):
+        """Test a block larger than the buffer keeps its tail."""
+        ring = SampleRingBuffer(4, dtype=np.float64)
+        ring.write(np.arange(10, dtype=np.float64))
+        assert ring.written == 10
+        out = np.zeros(4)
+        ring.read_latest(out)
+        np.testing.assert_array_equal(out, [6, 7, 8, 9])
+
+    def test_read_from_position(self):
+        """Test reading from an absolute position, including lost samples."""
+        ring = SampleRingBuffer(8, dtype=np.float64)
+        ring.write(np.arange(12, dtype=np.float64))
+        out = np.full(6, -1.0)
+        # Samples 2 and 3 were overwritten, 8..11 are still there
+        assert ring.read(2, out) == 4
+        np.testing.assert_array_equal(out, [0, 0, 4, 5, 6, 7])
+        # Samples beyond the write position are not available yet
+        assert ring.read(10, out) == 2
+        np.testing.assert_array_equal(out, [10, 11, 0, 0, 0, 0])
+
+    def test_concurrent_reader_sees_consistent_blocks(self):
+        """Test a reader racing the writer only ever sees whole ramps."""
+        ring = SampleRingBuffer(1024, dtype=np.float64)
+        stop = threading.Event()
+
+        def writer():
+            position = 0
+            while not stop.is_set():
+                ring.write(np.arange(position, position + 64, dtype=np.float64))
+                position += 64
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            out = np.zeros(256)
+            for _ in range(2000):
+                valid = ring.read_latest(out)
+                if valid == len(out):
+                    np.testing.assert_array_equal(np.diff(out), 1.0)
+        finally:
+            stop.set()
+            thread.join()
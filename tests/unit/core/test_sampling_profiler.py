@@ -0,0 +1,133 @@
+from App.core.audio.audio_engine import AudioEngine
+from App.core.audio.audio_stream import AudioStream
+from App.core.audio.output_backend import VirtualOutputBackend
+from App.core.audio.stream_config import StreamConfig
+from App.core.diagnostics.sampling_profiler import SamplingProfiler
+from threading import Event, Thread, get_ident
+import os
+import signal
+import sys
+import time
+import pytest
+
+def busy_inner(stop: Event):
+    while not stop.is_set():
+        sum(range(200))
+
+def busy_outer(stop: Event):
+    busy_inner(stop)
+
+class TestSamplingProfiler:
+    @pytest.fixture
+    def busy_thread(self):
+        """Run a named thread spinning in busy_outer -> busy_inner."""
+        stop = Event()
+        thread = Thread(target=busy_outer, args=(stop,), name="RenderThread", daemon=True)
+        thread.start()
+        yield thread
+        stop.set()
+        thread.join()
+
+    def test_samples_named_thread(self, busy_thread):
+        """Test samples capture the target thread's stack, outermost first."""
+        profiler = SamplingProfiler(output_dir=None)
+        for _ in range(5):
+            profiler.sample()
+        assert profiler.samples == 5
+        stacks = list(profiler.stacks)
+        assert all(stack[0] == "RenderThread" for stack in stacks)
+        assert sum(profiler.stacks.values()) == 5
+        labels = [label.split(" ")[0] for label in max(profiler.stacks, key=profiler.stacks.get)]
+        assert labels.index("busy_outer") < labels.index("busy_inner")
+
+    def test_ignores_other_threads(self, busy_thread):
+        """Test threads not in thread_names are not sampled."""
+        profiler = SamplingProfiler(thread_names=("AudioThread",), output_dir=None)
+        profiler.sample()
+        assert profiler.samples == 1
+        assert profiler.stacks == {}
+
+    def test_collapsed_output(self, busy_thread, tmp_path):
+        """Test start/stop writes one "stack count" line per distinct stack."""
+        profiler = SamplingProfiler(interval=0.001, output_dir=tmp_path)
+        profiler.start()
+        assert profiler.running
+        time.sleep(0.05)
+        path = profiler.stop()
+        assert not profiler.running
+        assert path.parent == tmp_path
+
+        lines = path.read_text().splitlines()
+        assert lines
+        counts = []
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            assert stack.startswith("RenderThread;")
+            counts.append(int(count))
+        assert counts == sorted(counts, reverse=True)
+        assert sum(counts) <= profiler.samples
+
+    def test_toggle_restarts_profile(self, busy_thread):
+        """Test toggling starts a fresh profile each time."""
+        profiler = SamplingProfiler(interval=0.001, output_dir=None)
+        assert profiler.toggle() is True
+        time.sleep(0.02)
+        assert profiler.toggle() is False
+        assert profiler.samples > 0
+        profiler.interval = 60.0
+        profiler.toggle()
+        assert profiler.samples == 0
+        assert profiler.stacks == {}
+        profiler.stop()
+        assert profiler.stop() is None
+
+    def test_samples_added_ident(self, busy_thread):
+        """Test a thread added by ident is sampled under its label, whatever its name."""
+        profiler = SamplingProfiler(thread_names=(), output_dir=None)
+        profiler.add_thread("Device", busy_thread.ident)
+        profiler.add_thread("Unknown", lambda: None)
+        profiler.sample()
+        assert [stack[0] for stack in profiler.stacks] == ["Device"]
+
+    @pytest.mark.usefixtures("registered_processors")
+    def test_samples_stream_callback(self):
+        """Test the audio callback thread of an AudioStream is sampled through its ident."""
+        config = StreamConfig(block_size=256)
+        engine = AudioEngine(stream_config=config)
+        stream = AudioStream(engine.generate_noise, config=config, backend=VirtualOutputBackend(record=False))
+        profiler = SamplingProfiler(output_dir=None)
+        profiler.add_thread("AudioCallback", lambda: stream.callback_thread_ident)
+        stream.start()
+        try:
+            assert stream.first_callback.wait(5.0)
+            assert stream.callback_thread_ident != get_ident()
+            for _ in range(50):
+                profiler.sample()
+                time.sleep(0.001)
+        finally:
+            stream.stop()
+
+        assert any(
+            label.startswith("generate_noise ") for stack in profiler.stacks for label in stack
+        )
+        assert all(stack[0] == "AudioCallback" for stack in profiler.stacks)
+
+    @pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="SIGUSR1 not available")
+    def test_signal_toggles(self):
+        """Test SIGUSR1 starts and stops sampling."""
+        profiler = SamplingProfiler(output_dir=None)
+        previous = signal.getsignal(signal.SIGUSR1)
+        try:
+            assert profiler.install_signal_handler()
+            os.kill(os.getpid(), signal.SIGUSR1)
+            assert profiler.running
+            os.kill(os.getpid(), signal.SIGUSR1)
+            assert not profiler.running
+        finally:
+            profiler.stop()
+            signal.signal(signal.SIGUSR1, previous)
+
+    def test_rejects_bad_interval(self):
+        """Test a non-positive interval is rejected."""
+        with pytest.raises(ValueError):
+            SamplingProfiler(interval=0)
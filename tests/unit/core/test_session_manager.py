@@ -0,0 +1,92 @@
+from App.core.server.session_manager import SessionManager, AdmissionError
+from App.core.audio.stream_config import StreamConfig
+import numpy as np
+import pytest
+import time
+
+SMALL_BLOCKS = StreamConfig(block_size=256)
+
+pytestmark = pytest.mark.usefixtures("registered_processors")
+
+class TestSessionManager:
+    def test_invalid_options(self):
+        """Test unknown executor kinds and policies are rejected."""
+        with pytest.raises(ValueError):
+            SessionManager(executor="fiber")
+        with pytest.raises(ValueError):
+            SessionManager(admission_policy="queue")
+
+    def test_reject_over_budget(self):
+        """Test sessions beyond the CPU budget are rejected."""
+        manager = SessionManager(workers=1, cpu_budget=1e-9, admission_policy="reject")
+        with pytest.raises(AdmissionError):
+            manager.open_session(stream_config=SMALL_BLOCKS)
+        assert manager.rejected_sessions == 1
+        assert manager.sessions == {}
+
+    def test_degrade_over_budget(self):
+        """Test the degrade policy admits sessions as best effort."""
+        manager = SessionManager(workers=1, cpu_budget=1e-9, admission_policy="degrade")
+        session = manager.open_session(stream_config=SMALL_BLOCKS)
+        assert session.degraded
+        assert manager.aggregate_load() == 0.0
+
+    def test_earliest_deadline_first(self):
+        """Test ready blocks are dispatched in deadline order, guaranteed first."""
+        manager = SessionManager(workers=1, cpu_budget=100.0, lookahead_blocks=0.0)
+        late = manager.open_session(stream_config=SMALL_BLOCKS)
+        early = manager.open_session(stream_config=SMALL_BLOCKS)
+        degraded = manager.open_session(stream_config=SMALL_BLOCKS)
+        degraded.degraded = True
+
+        # Rebuild the queues with explicit, already-due deadlines
+        manager._queues[0].clear()
+        manager._queues[1].clear()
+        now = time.monotonic()
+        for session, due in ((late, now - 0.1), (early, now - 0.2), (degraded, now - 0.3)):
+            session.next_due = due
+            manager._schedule(session)
+
+        order = [manager._next_job()[0] for _ in range(3)]
+        assert order == [early, late, degraded]
+
+    def test_render_sessions(self):
+        """Test independent sessions render blocks and track realtime factor."""
+        received = {}
+        manager = SessionManager(workers=2, cpu_budget=100.0)
+        manager.start()
+        try:
+            first = manager.open_session(seed=1, stream_config=SMALL_BLOCKS,
+                                         on_block=lambda sid, block: received.setdefault(sid, block))
+            second = manager.open_session(seed=2, stream_config=SMALL_BLOCKS,
+                                          on_block=lambda sid, block: received.setdefault(sid, block))
+            deadline = time.monotonic() + 2.0
+            while time.monotonic() < deadline and (second.stats.blocks_rendered < 3 or first.stats.blocks_rendered < 3):
+                time.sleep(0.01)
+        finally:
+            manager.stop()
+
+        assert first.stats.blocks_rendered >= 3
+        assert first.stats.realtime_factor > 0
+        assert len(received[first.session_id]) == 256
+        # Different seeds give different audio
+        assert not np.array_equal(received[first.session_id], received[second.session_id])
+
+        summary = manager.summary()
+        assert summary["sessions"] == 2
+        assert {s["id"] for s in summary["session_stats"]} == {first.session_id, second.session_id}
+
+    def test_render_sessions_in_processes(self):
+        """Test a process pool renders blocks and shuts down cleanly."""
+        manager = SessionManager(workers=2, executor="process", cpu_budget=100.0)
+        manager.start()
+        try:
+            session = manager.open_session(seed=1, stream_config=SMALL_BLOCKS)
+            deadline = time.monotonic() + 10.0
+            while time.monotonic() < deadline and session.stats.blocks_rendered < 3:
+                time.sleep(0.01)
+        finally:
+            manager.stop()
+
+        assert session.stats.blocks_rendered >= 3
+        assert len(session.output[-1]) == 256
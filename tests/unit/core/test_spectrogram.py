@@ -0,0 +1,74 @@
+from App.core.audio.ring_buffer import SampleRingBuffer
+from App.core.visualization.spectrogram import IncrementalSTFT
+import numpy as np
+import pytest
+
+class TestIncrementalSTFT:
+    @pytest.fixture
+    def noise(self):
+        """Create reproducible white noise."""
+        return np.random.default_rng(1).uniform(-1, 1, 20000).astype(np.float32)
+
+    def batch_columns(self, stft, samples, start, count):
+        """Compute STFT columns directly for comparison."""
+        columns = []
+        for k in range(count):
+            frame = samples[start + k * stft.hop:start + k * stft.hop + stft.fft_size]
+            columns.append(np.abs(np.fft.rfft(frame * stft.window)))
+        return stft._to_levels(np.array(columns))
+
+    def test_incremental_matches_batch(self, noise):
+        """Test columns computed across many small updates equal a batch STFT."""
+        tap = SampleRingBuffer(8192)
+        stft = IncrementalSTFT(fft_size=256, hop=128, history=32, dtype=np.float16)
+        stft.position = 0
+        total = 0
+        for start in range(0, 8000, 100):
+            tap.write(noise[start:start + 100])
+            total += stft.update(tap)
+
+        assert total == (8000 - 256) // 128 + 1
+        expected = self.batch_columns(stft, noise, (total - 32) * 128, 32)
+        np.testing.assert_allclose(stft.image.astype(np.float32), expected.astype(np.float32), atol=0.05)
+
+    def test_memory_is_fixed(self, noise):
+        """Test the image storage is never reallocated."""
+        tap = SampleRingBuffer(4096)
+        stft = IncrementalSTFT(fft_size=256, hop=128, history=16)
+        storage = stft._image
+        for start in range(0, 20000, 512):
+            tap.write(noise[start:start + 512])
+            stft.update(tap)
+        assert stft._image is storage
+        assert stft.image.base is storage
+        assert stft.image.shape == (16, 129)
+        assert stft.image.dtype == np.uint8
+
+    def test_newest_column_is_last(self):
+        """Test the image view is ordered oldest to newest across the wrap."""
+        tap = SampleRingBuffer(4096)
+        stft = IncrementalSTFT(fft_size=64, hop=64, history=4, dtype=np.float16)
+        stft.position = 0
+        for level in (0.001, 0.01, 0.1, 1.0, 0.5, 0.05):
+            tap.write(np.full(64, level, dtype=np.float32))
+            assert stft.update(tap) == 1
+        dc = stft.image[:, 0].astype(np.float32)
+        assert np.all(np.diff(dc[:2]) > 0)
+        assert dc.argmax() == 1 and dc[-1] < dc[-2]
+
+    def test_skips_ahead_when_far_behind(self, noise):
+        """Test one update never computes more than the configured column count."""
+        tap = SampleRingBuffer(32768)
+        tap.write(np.zeros(20000, dtype=np.float32))
+        stft = IncrementalSTFT(fft_size=256, hop=128, max_columns_per_update=8)
+        stft.position = 0
+        assert stft.update(tap) == 8
+        assert stft.columns_skipped > 0
+        assert stft.update(tap) == 0
+
+    def test_invalid_settings(self):
+        """Test invalid hop and dtype are rejected."""
+        with pytest.raises(ValueError):
+            IncrementalSTFT(fft_size=256, hop=512)
+        with pytest.raises(ValueError):
+            IncrementalSTFT(dtype=np.float64)
@@ -0,0 +1,93 @@
+from App.core.visualization.spectrum_analyzer import SpectrumAnalyzer, FFT_SIZES
+import numpy as np
+import pytest
+
+class TestSpectrumAnalyzer:
+    @pytest.fixture
+    def noise(self):
+        """Create reproducible white noise."""
+        return np.random.default_rng(0).uniform(-1, 1, 80000)
+
+    def test_matches_single_frame_display(self, noise):
+        """Test the default settings reproduce the original single-frame spectrum."""
+        samples = noise[:2048]
+        analyzer = SpectrumAnalyzer()
+        freqs, levels = analyzer.analyze(samples)
+
+        fft = np.abs(np.fft.rfft(samples * np.hanning(2048)))
+        fft_smoothed = np.convolve(fft, np.hanning(5) / 5, mode='same')
+        expected = np.clip(20 * np.log10(np.clip(fft_smoothed * 2, 1e-3, None)), -60, 24)
+        all_freqs = np.fft.rfftfreq(2048, d=1.0 / 44100)
+        valid = (all_freqs > 20) & (all_freqs < 20000)
+
+        np.testing.assert_array_equal(freqs, all_freqs[valid])
+        np.testing.assert_allclose(levels, expected[valid])
+
+    def test_plans_are_cached(self):
+        """Test windows and grids are built once per FFT size."""
+        analyzer = SpectrumAnalyzer()
+        plan = analyzer.plan
+        analyzer.configure(fft_size=32768)
+        analyzer.configure(fft_size=2048)
+        assert analyzer.plan is plan
+        assert set(analyzer._plans) == {2048, 32768}
+
+    def test_level_independent_of_fft_size(self, noise):
+        """Test white noise sits at the same average level for every FFT size."""
+        means = []
+        for size in FFT_SIZES:
+            analyzer = SpectrumAnalyzer(fft_size=size, segments=8, cpu_budget=1.0)
+            means.append(analyzer.analyze(noise[:analyzer.samples_needed])[1].mean())
+        assert max(means) - min(means) < 1.0
+
+    def test_welch_reduces_variance(self, noise):
+        """Test averaging more segments gives a smoother spectrum."""
+        single = SpectrumAnalyzer().analyze(noise[-2048:])[1]
+        analyzer = SpectrumAnalyzer(segments=16, overlap=0.5, cpu_budget=1.0)
+        welch = analyzer.analyze(noise[-analyzer.samples_needed:])[1]
+        assert welch.std() < single.std() / 2
+
+    def test_exponential_averaging(self, noise):
+        """Test successive frames are blended and reset clears the history."""
+        analyzer = SpectrumAnalyzer(averaging=0.5)
+        first = analyzer.analyze(noise[:2048])[1]
+        blended = analyzer.analyze(noise[2048:4096])[1]
+        fresh = SpectrumAnalyzer().analyze(noise[2048:4096])[1]
+        assert not np.allclose(blended, fresh)
+        analyzer.reset()
+        np.testing.assert_allclose(analyzer.analyze(noise[2048:4096])[1], fresh)
+        assert not np.allclose(first, fresh)
+
+    def test_cpu_budget_limits_segments(self, noise):
+        """Test segments are dropped when analysis exceeds the budget."""
+        analyzer = SpectrumAnalyzer(fft_size=32768, segments=4, cpu_budget=1e-6)
+        analyzer.analyze(noise[:analyzer.samples_needed])
+        assert analyzer.effective_segments == 1
+        # Short input still works with fewer segments
+        analyzer.analyze(noise[:32768])
+
+    @pytest.mark.parametrize("settings", [
+        {"fft_size": 1000},
+        {"overlap": 1.0},
+        {"segments": 0},
+        {"averaging": 1.0},
+    ])
+    def test_invalid_settings(self, settings):
+        """Test invalid analysis settings are rejected."""
+        with pytest.raises(ValueError):
+            SpectrumAnalyzer(**settings)
+
+    def test_octave_smoothing(self, noise):
+        """Test octave smoothing returns a log grid at the same noise level."""
+        linear = SpectrumAnalyzer(segments=8, cpu_budget=1.0)
+        octave = SpectrumAnalyzer(segments=8, octave_fraction=3, cpu_budget=1.0)
+        samples = 0.05 * noise[:linear.samples_needed]  # Keep levels clear of the display clip
+        linear_freqs, linear_levels = linear.analyze(samples)
+        freqs, levels = octave.analyze(samples)
+
+        assert len(freqs) < len(linear_freqs) / 5
+        np.testing.assert_allclose(np.diff(np.log2(freqs)), 1 / 12)
+        assert abs(levels[freqs > 1000].mean() - linear_levels[linear_freqs > 1000].mean()) < 2.0
+
+        octave.configure(octave_fraction=0)
+        np.testing.assert_array_equal(octave.analyze(samples)[0], linear_freqs)
@@ -0,0 +1,72 @@
+from App.core.audio.stream_config import (
+    StreamConfig, DEFAULT_STREAM_CONFIG, LOW_LATENCY_STREAM_CONFIG,
+    get_preset, validate_stream_config
+)
+from App.core.filters.implementations.bandpass import BandpassFilter
+import numpy as np
+import time
+import pytest
+
+class TestStreamConfig:
+    def test_defaults_match_previous_stream(self):
+        """Test the default configuration keeps the original stream settings."""
+        assert DEFAULT_STREAM_CONFIG.stream_kwargs() == {
+            "samplerate": 44100,
+            "channels": 1,
+            "dtype": "float32",
+            "blocksize": 2048,
+            "latency": 'high',
+            "device": None,
+        }
+
+    @pytest.mark.parametrize("overrides", [
+        {"sample_rate": 0},
+        {"block_size": -1},
+        {"channels": 0},
+        {"dtype": "float64"},
+        {"latency": "medium"},
+    ])
+    def test_invalid_values(self, overrides):
+        """Test invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            StreamConfig(**overrides)
+
+    def test_presets(self):
+        """Test preset lookup and overrides."""
+        assert get_preset("low_latency") is LOW_LATENCY_STREAM_CONFIG
+        assert get_preset("low_latency").with_overrides(sample_rate=48000).block_size == 128
+        with pytest.raises(KeyError):
+            get_preset("missing")
+
+    def test_validate_stream_config(self):
+        """Test validation passes fast renderers and fails slow ones."""
+        config = StreamConfig(sample_rate=1000, block_size=10)  # 10 ms deadline
+
+        fast = validate_stream_config(config, lambda frames: np.zeros(frames), blocks=20)
+        assert fast.passed
+
+        def slow(frames):
+            time.sleep(0.008)
+            return np.zeros(frames)
+        result = validate_stream_config(config, slow, blocks=5)
+        assert not result.passed
+        assert "too slow" in result.describe()
+
+class TestSampleRateScaling:
+    def test_identity_at_reference_rate(self):
+        """Test filter coefficients are unchanged at 44.1 kHz."""
+        bandpass = BandpassFilter()
+        assert bandpass._scale_coefficient(0.3) == 0.3
+
+    def test_same_corner_frequency_at_other_rates(self):
+        """Test a scaled one-pole coefficient gives the same -3 dB frequency in Hz."""
+        def corner_hz(alpha, sample_rate):
+            freqs = np.linspace(1, sample_rate / 2, 200000)
+            z = np.exp(-2j * np.pi * freqs / sample_rate)
+            magnitude = np.abs(alpha / (1 - (1 - alpha) * z))
+            return freqs[np.argmin(np.abs(magnitude - 1 / np.sqrt(2)))]
+
+        bandpass = BandpassFilter()
+        bandpass.set_sample_rate(96000)
+        scaled = bandpass._scale_coefficient(0.05)
+        assert corner_hz(scaled, 96000) == pytest.approx(corner_hz(0.05, 44100), rel=0.02)
@@ -0,0 +1,102 @@
+from App.core.audio.audio_stream import AudioStream
+from App.core.audio.block_renderer import BlockRenderer
+from App.core.audio.output_backend import VirtualOutputBackend
+from App.core.audio.stream_config import StreamConfig
+from App.core.audio.thread_priority import ThreadPolicy, apply_thread_policy, parse_cpus, policy_from_args
+from types import SimpleNamespace
+from unittest.mock import patch
+import numpy as np
+import os
+import threading
+import time
+import pytest
+
+linux_only = pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux scheduling APIs")
+
+def run_in_thread(function):
+    """Call `function` on a fresh thread, so scheduling changes do not leak into the test runner."""
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(value=function()))
+    thread.start()
+    thread.join()
+    return result["value"]
+
+class TestThreadPriority:
+    def test_parse_cpus(self):
+        """Test CPU lists with single cores and ranges."""
+        assert parse_cpus("3") == (3,)
+        assert parse_cpus("4-6,1") == (1, 4, 5, 6)
+        with pytest.raises(ValueError):
+            parse_cpus("a")
+
+    def test_policy_validation(self):
+        """Test out-of-range requests are rejected."""
+        with pytest.raises(ValueError):
+            ThreadPolicy(realtime_priority=0)
+        with pytest.raises(ValueError):
+            ThreadPolicy(nice=30)
+        with pytest.raises(ValueError):
+            ThreadPolicy(cpus=())
+        assert policy_from_args() is None
+        assert policy_from_args("0", None, 5) == ThreadPolicy(cpus=(0,), nice=5)
+
+    @linux_only
+    def test_pins_thread(self):
+        """Test affinity is applied to the calling thread and reported."""
+        cpu = min(os.sched_getaffinity(0))
+        applied = run_in_thread(lambda: apply_thread_policy(ThreadPolicy(cpus=(cpu,))))
+        assert applied.cpus == (cpu,)
+        assert applied.errors == []
+        assert f"cpus {cpu}" in applied.describe()
+
+    @linux_only
+    def test_degrades_without_privileges(self):
+        """Test refused requests are reported and the nice fallback still applies."""
+        refused = PermissionError(1, "Operation not permitted")
+        policy = ThreadPolicy(cpus=(100000,), realtime_priority=50, nice=5)
+        with patch("os.sched_setscheduler", side_effect=refused):
+            applied = run_in_thread(lambda: apply_thread_policy(policy))
+        assert applied.scheduler == "normal"
+        assert applied.cpus is None
+        assert applied.nice == 5
+        assert len(applied.errors) == 2
+        assert "SCHED_FIFO 50: Operation not permitted" in applied.describe()
+
+    def test_unsupported_platform(self):
+        """Test missing APIs are reported instead of raising."""
+        with patch("App.core.audio.thread_priority.os", SimpleNamespace()):
+            applied = apply_thread_policy(ThreadPolicy(cpus=(0,), realtime_priority=10, nice=1))
+        assert applied.errors == [
+            "CPU affinity is not supported on this platform",
+            "SCHED_FIFO is not supported on this platform",
+            "Thread nice values are not supported on this platform",
+        ]
+
+    @linux_only
+    def test_block_renderer_applies_policy(self):
+        """Test the render thread applies its policy when it starts."""
+        cpu = min(os.sched_getaffinity(0))
+        renderer = BlockRenderer(np.zeros, lambda audio: None, block_size=64, sample_rate=64000,
+                                 thread_policy=ThreadPolicy(cpus=(cpu,)))
+        renderer.start()
+        deadline = time.monotonic() + 1.0
+        while renderer.applied_policy is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        renderer.stop()
+        assert renderer.applied_policy.cpus == (cpu,)
+        assert renderer.applied_policy.thread_id == renderer.render_thread.native_id
+
+    @linux_only
+    def test_audio_stream_applies_policy_to_callback_thread(self):
+        """Test the policy reaches the thread the device calls back on."""
+        cpu = min(os.sched_getaffinity(0))
+        backend = VirtualOutputBackend(realtime=True, record=False)
+        stream = AudioStream(np.zeros, config=StreamConfig(block_size=256), backend=backend,
+                             thread_policy=ThreadPolicy(cpus=(cpu,)))
+        stream.start()
+        deadline = time.monotonic() + 2.0
+        while stream.applied_policy is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stream.stop()
+        assert stream.applied_policy.thread_id == backend.stream.device_thread.native_id
+        assert stream.applied_policy.cpus == (cpu,)
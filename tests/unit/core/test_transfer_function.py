@@ -0,0 +1,104 @@
+from App.core.filters.base import FilterBase
+from App.core.filters.implementations.bandpass import BandpassFilter
+from App.core.filters.implementations.cascaded_onepole_lowpass import CascadedOnePoleLowPass
+from App.core.filters.implementations.cascaded_onepole_lowpass_v2 import CascadedOnePoleLowPassV2
+from App.core.visualization.transfer_function import ResponseCache, frequency_response
+from App.core.visualization.filter_response_base import CoefficientResponseVisualizer
+import numpy as np
+import pytest
+
+FRAMES = 32768
+SAMPLE_RATE = 44100
+
+def measured_response(filter, parameters, amplitude=1e-3):
+    """Measure a filter's response from its response to a small impulse."""
+    impulse = np.zeros(FRAMES)
+    impulse[FRAMES // 4] = amplitude
+    output = filter.process_audio(impulse, parameters)
+    freqs = np.fft.rfftfreq(FRAMES, d=1.0 / SAMPLE_RATE)
+    return freqs, np.fft.rfft(output) / amplitude
+
+class TestTransferFunction:
+    @pytest.mark.parametrize("filter_class,parameters,tolerance_db", [
+        (BandpassFilter, {"cutoff": 0.5, "bandwidth": 0.3}, 0.01),
+        (BandpassFilter, {"cutoff": 0.1, "bandwidth": 0.9}, 0.01),
+        (CascadedOnePoleLowPass, {"cutoff": 0.6, "resonance": 0.0, "poles": 2}, 0.2),
+        (CascadedOnePoleLowPass, {"cutoff": 0.8, "resonance": 0.7, "poles": 2}, 0.2),
+        (CascadedOnePoleLowPassV2, {"cutoff": 0.4, "resonance": 0.0, "poles": 4}, 0.01),
+        (CascadedOnePoleLowPassV2, {"cutoff": 0.7, "resonance": 0.5, "poles": 2}, 0.01),
+    ])
+    def test_matches_filter_output(self, filter_class, parameters, tolerance_db):
+        """Test the coefficient response matches the response measured from the DSP."""
+        freqs, measured = measured_response(filter_class(), parameters)
+        predicted = frequency_response(filter_class().coefficients(parameters), freqs, SAMPLE_RATE)
+
+        # Compare over the displayed range; block edge effects of the DC
+        # removal swamp the deep stopband
+        band = (freqs > 100) & (freqs < 20000) & (np.abs(predicted) > 1e-3)
+        error_db = 20 * np.log10(np.abs(measured[band]) / np.abs(predicted[band]))
+        assert np.max(np.abs(error_db)) < tolerance_db
+
+    def test_sample_rate_is_respected(self):
+        """Test the response follows the filter's sample rate scaling."""
+        filter = BandpassFilter()
+        parameters = {"cutoff": 0.5, "bandwidth": 0.3}
+        freqs = np.array([200.0, 1000.0, 5000.0])
+        reference = np.abs(frequency_response(filter.coefficients(parameters), freqs, 44100))
+        filter.set_sample_rate(96000)
+        scaled = np.abs(frequency_response(filter.coefficients(parameters), freqs, 96000))
+        np.testing.assert_allclose(scaled, reference, rtol=0.05)
+
+    def test_filters_must_expose_coefficients(self):
+        """Test a filter without coefficients() cannot be instantiated."""
+        class NoCoefficients(FilterBase):
+            def process_audio(self, audio, parameters):
+                return audio
+        with pytest.raises(TypeError):
+            NoCoefficients()
+
+class TestResponseCache:
+    def test_hits_on_revisited_values(self):
+        """Test values within the quantisation step reuse the cached response."""
+        cache = ResponseCache(maxsize=4)
+        filter = CascadedOnePoleLowPassV2()
+        freqs = np.logspace(np.log10(20), np.log10(20000), 100)
+
+        first = cache.response_db(filter, {"cutoff": 0.5, "poles": 2}, freqs)
+        again = cache.response_db(filter, {"cutoff": 0.50000001, "poles": 2}, freqs)
+        assert again is first
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert not first.flags.writeable
+
+        cache.response_db(filter, {"cutoff": 0.5, "poles": 2}, freqs[:50])
+        assert cache.misses == 2
+
+    def test_least_recently_used_eviction(self):
+        """Test the oldest unused entry is evicted when full."""
+        cache = ResponseCache(maxsize=2)
+        filter = BandpassFilter()
+        freqs = np.array([100.0, 1000.0])
+        for cutoff in (0.1, 0.2):
+            cache.response_db(filter, {"cutoff": cutoff}, freqs)
+        cache.response_db(filter, {"cutoff": 0.1}, freqs)  # 0.1 is now most recent
+        cache.response_db(filter, {"cutoff": 0.3}, freqs)  # evicts 0.2
+
+        misses = cache.misses
+        cache.response_db(filter, {"cutoff": 0.1}, freqs)
+        assert cache.misses == misses
+        cache.response_db(filter, {"cutoff": 0.2}, freqs)
+        assert cache.misses == misses + 1
+
+    def test_visualizer_uses_cutoff_mapping(self):
+        """Test the V2 coefficient response follows the filter's cutoff**2 mapping."""
+        class V2Visualizer(CoefficientResponseVisualizer):
+            filter_class = CascadedOnePoleLowPassV2
+        visualizer = V2Visualizer(cache=ResponseCache())
+        freqs = np.logspace(np.log10(20), np.log10(20000), 1000)
+        low = visualizer.calculate_response(freqs, {"cutoff": 0.2, "poles": 1})
+        high = visualizer.calculate_response(freqs, {"cutoff": 0.8, "poles": 1})
+        # -3 dB point relative to the passband
+        corner = lambda db: freqs[np.argmax(db < db[0] - 3)]
+        alpha = lambda cutoff: 0.005 + cutoff ** 2 * 0.495
+        expected = lambda a: SAMPLE_RATE / (2 * np.pi) * np.arccos(1 - a ** 2 / (2 * (1 - a)))
+        assert corner(low) == pytest.approx(expected(alpha(0.2)), rel=0.02)
+        assert corner(high) == pytest.approx(expected(alpha(0.8)), rel=0.02)
@@ -0,0 +1,106 @@
+from App.core.audio.audio_engine import AudioEngine
+from App.core.parameters.noise_parameters import NoiseParameters
+from App.core.parameters.observer import Observer
+from App.core.parameters.update_coalescer import UpdateCoalescer
+import pytest
+
+class TestUpdateCoalescer:
+    def test_merges_changes_until_flush(self):
+        """Test a burst of changes is delivered as one merged call."""
+        delivered = []
+        coalescer = UpdateCoalescer(lambda **changes: delivered.append(changes))
+        for value in (0.1, 0.2, 0.3):
+            coalescer.submit(cutoff=value)
+        coalescer.submit(volume=0.7)
+        
+        assert delivered == []
+        assert coalescer.flush()
+        assert delivered == [{"cutoff": 0.3, "volume": 0.7}]
+        assert not coalescer.flush()
+        assert (coalescer.raw_updates, coalescer.delivered_updates) == (4, 1)
+        assert "4 raw, 1 delivered" in coalescer.describe()
+
+    def test_fast_path_sees_every_change(self):
+        """Test the fast path receives changes without waiting for a flush."""
+        fast = []
+        coalescer = UpdateCoalescer(lambda **changes: None, fast_path=lambda **changes: fast.append(changes))
+        coalescer.submit(cutoff=0.1)
+        coalescer.submit(cutoff=0.2)
+        assert fast == [{"cutoff": 0.1}, {"cutoff": 0.2}]
+
+    def test_rejected_batch_is_dropped(self):
+        """Test a batch the target rejects is not delivered again."""
+        def target(**changes):
+            raise ValueError("out of range")
+        coalescer = UpdateCoalescer(target)
+        coalescer.submit(volume=2.0)
+        with pytest.raises(ValueError):
+            coalescer.flush()
+        assert not coalescer.has_pending
+        assert coalescer.delivered_updates == 0
+
+    def test_rejected_batch_restores_fast_path(self):
+        """Test invalid changes skip the fast path and a rejected flush restores it."""
+        def validate(changes):
+            if changes.get("volume", 0.0) > 1.0:
+                raise ValueError("out of range")
+            return changes
+        def target(**changes):
+            validate(changes)
+        fast, restored = [], []
+        coalescer = UpdateCoalescer(target, fast_path=lambda **changes: fast.append(changes),
+                                    validate=validate, restore=lambda: restored.append(True))
+        coalescer.submit(volume=0.5)
+        coalescer.submit(volume=2.0)
+        assert fast == [{"volume": 0.5}]
+        with pytest.raises(ValueError):
+            coalescer.flush()
+        assert restored == [True]
+
+    @pytest.mark.usefixtures("registered_processors")
+    def test_engine_follows_model_after_rejection(self):
+        """Test the audio engine fast path is validated and reset to the model when a batch fails."""
+        parameters = NoiseParameters()
+        engine = AudioEngine()
+        coalescer = UpdateCoalescer(
+            parameters.update_parameters,
+            fast_path=engine.apply_changes,
+            validate=parameters.validate,
+            restore=lambda: engine.set_parameters(**parameters.parameters)
+        )
+        coalescer.submit(volume=0.7)
+        coalescer.submit(cutoff=0.9)  # Not a parameter of the model
+        assert engine.parameters["volume"] == 0.7
+        assert "cutoff" not in engine.parameters
+        with pytest.raises(KeyError):
+            coalescer.flush()
+        assert engine.parameters == parameters.parameters
+        
+        coalescer.submit(volume=0.3)
+        coalescer.flush()
+        assert engine.parameters == parameters.parameters
+        assert engine.parameters["volume"] == 0.3
+
+    def test_invalid_interval(self):
+        """Test non-positive flush intervals are rejected."""
+        with pytest.raises(ValueError):
+            UpdateCoalescer(lambda **changes: None, interval=0)
+        assert UpdateCoalescer(lambda **changes: None).interval_ms == 17
+
+    @pytest.mark.usefixtures("registered_processors")
+    def test_one_notification_per_flush(self):
+        """Test observers of NoiseParameters are notified once per flush."""
+        class CountingObserver(Observer):
+            def __init__(self):
+                self.updates = []
+            def update(self, parameters):
+                self.updates.append(dict(parameters))
+        parameters = NoiseParameters()
+        observer = CountingObserver()
+        parameters.attach(observer)
+        coalescer = UpdateCoalescer(parameters.update_parameters)
+        for step in range(100):
+            coalescer.submit(volume=step / 100)
+        coalescer.flush()
+        assert len(observer.updates) == 1
+        assert observer.updates[0]["volume"] == 0.99
@@ -0,0 +1 @@
+"""Unit tests for the GUI widgets of the Noise Playground application."""
@@ -0,0 +1,37 @@
+from pathlib import Path
+from types import MappingProxyType
+import os
+import sys
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+pytest.importorskip("pyqtgraph")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# The GUI modules import `core` the way App/main.py runs them
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "App"))
+
+from PyQt6.QtWidgets import QApplication
+from core.parameters.observer import ChangeSet
+from gui.waveform_view import WaveformView
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+class TestWaveformView:
+    def test_constructs_with_default_response(self, app):
+        """Test the view builds and draws the default bandpass response."""
+        view = WaveformView()
+        assert view.current_visualizer is view.filter_visualizers['bandpass']
+        assert set(view.current_parameters) == {'filter_type', 'cutoff', 'bandwidth'}
+        xs, ys = view.filter_curve.getData()
+        assert len(xs) == len(view.response_freqs)
+
+    def test_follows_filter_changes(self, app):
+        """Test a filter type change set switches the visualizer."""
+        view = WaveformView()
+        parameters = {'filter_type': 'Cascaded', 'cutoff': 0.3, 'volume': 0.5}
+        view.on_changes(ChangeSet({'filter_type': 'Cascaded'}, 1, MappingProxyType(parameters)))
+        assert view.current_visualizer is view.filter_visualizers['cascaded']
+        assert view.current_parameters == {'filter_type': 'Cascaded', 'cutoff': 0.3}